@@ -0,0 +1,27 @@
+"""Index provider event identity for batched calendar cancellations.
+
+Revision ID: 3d6e1f0a9b27
+Revises: 8c3d4e5f6071
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "3d6e1f0a9b27"
+down_revision: str | None = "8c3d4e5f6071"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_external_event_source_provider_event",
+        "external_event",
+        ["calendar_source_id", "provider_event_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_external_event_source_provider_event", table_name="external_event")
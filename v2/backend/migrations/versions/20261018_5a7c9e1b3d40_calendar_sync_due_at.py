@@ -0,0 +1,27 @@
+"""Persist the adaptive next calendar synchronization time per source.
+
+Revision ID: 5a7c9e1b3d40
+Revises: 3d6e1f0a9b27
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "5a7c9e1b3d40"
+down_revision: str | None = "3d6e1f0a9b27"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "calendar_source",
+        sa.Column("next_sync_due_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("calendar_source", "next_sync_due_at")
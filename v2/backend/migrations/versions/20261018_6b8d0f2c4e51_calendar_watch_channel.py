@@ -0,0 +1,48 @@
+"""Store Google Calendar push-notification channels per source.
+
+Revision ID: 6b8d0f2c4e51
+Revises: 5a7c9e1b3d40
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "6b8d0f2c4e51"
+down_revision: str | None = "5a7c9e1b3d40"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "calendar_watch_channel",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("calendar_source_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("resource_id", sa.String(length=512), nullable=False),
+        sa.Column("token_hash", sa.String(length=128), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["calendar_source_id"],
+            ["calendar_source.id"],
+            name=op.f("fk_calendar_watch_channel_calendar_source_id_calendar_source"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_calendar_watch_channel")),
+    )
+    op.create_index(
+        "ix_calendar_watch_channel_source_expires",
+        "calendar_watch_channel",
+        ["calendar_source_id", "expires_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_calendar_watch_channel_source_expires", table_name="calendar_watch_channel")
+    op.drop_table("calendar_watch_channel")
@@ -0,0 +1,73 @@
+"""Queue calendar sync requests so concurrent callers share one execution.
+
+Revision ID: 7c9e1a3b5d62
+Revises: 6b8d0f2c4e51
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "7c9e1a3b5d62"
+down_revision: str | None = "6b8d0f2c4e51"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "calendar_sync_request",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("calendar_source_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("state", sa.String(length=24), nullable=False),
+        sa.Column("force_full", sa.Boolean(), nullable=False),
+        sa.Column("requesters", sa.Integer(), nullable=False),
+        sa.Column("requested_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("result_value", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("error_code", sa.String(length=100), nullable=True),
+        sa.CheckConstraint(
+            "state IN ('pending', 'running', 'succeeded', 'failed')",
+            name=op.f("ck_calendar_sync_request_state"),
+        ),
+        sa.CheckConstraint(
+            "requesters >= 1", name=op.f("ck_calendar_sync_request_positive_requesters")
+        ),
+        sa.ForeignKeyConstraint(
+            ["calendar_source_id"],
+            ["calendar_source.id"],
+            name=op.f("fk_calendar_sync_request_calendar_source_id_calendar_source"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_calendar_sync_request")),
+    )
+    op.create_index(
+        "uq_calendar_sync_request_pending_source",
+        "calendar_sync_request",
+        ["calendar_source_id"],
+        unique=True,
+        postgresql_where=sa.text("state = 'pending'"),
+    )
+    op.create_index(
+        "uq_calendar_sync_request_running_source",
+        "calendar_sync_request",
+        ["calendar_source_id"],
+        unique=True,
+        postgresql_where=sa.text("state = 'running'"),
+    )
+    op.create_index(
+        "ix_calendar_sync_request_state_requested",
+        "calendar_sync_request",
+        ["state", "requested_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_calendar_sync_request_state_requested", table_name="calendar_sync_request")
+    op.drop_index("uq_calendar_sync_request_running_source", table_name="calendar_sync_request")
+    op.drop_index("uq_calendar_sync_request_pending_source", table_name="calendar_sync_request")
+    op.drop_table("calendar_sync_request")
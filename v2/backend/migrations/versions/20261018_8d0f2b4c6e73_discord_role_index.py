@@ -0,0 +1,52 @@
+"""Index Discord role membership for publication guard recipients.
+
+Revision ID: 8d0f2b4c6e73
+Revises: 7c9e1a3b5d62
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "8d0f2b4c6e73"
+down_revision: str | None = "7c9e1a3b5d62"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "discord_role_index",
+        sa.Column("guild_id", sa.BigInteger(), nullable=False),
+        sa.Column("role_id", sa.BigInteger(), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["guild_id"],
+            ["guild_config.guild_id"],
+            name=op.f("fk_discord_role_index_guild_id_guild_config"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("guild_id", "role_id", name=op.f("pk_discord_role_index")),
+    )
+    op.create_table(
+        "discord_role_member",
+        sa.Column("guild_id", sa.BigInteger(), nullable=False),
+        sa.Column("role_id", sa.BigInteger(), nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["guild_id", "role_id"],
+            ["discord_role_index.guild_id", "discord_role_index.role_id"],
+            name=op.f("fk_discord_role_member_guild_id_role_id_discord_role_index"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "guild_id", "role_id", "user_id", name=op.f("pk_discord_role_member")
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("discord_role_member")
+    op.drop_table("discord_role_index")
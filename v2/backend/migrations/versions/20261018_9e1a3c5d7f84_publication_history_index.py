@@ -0,0 +1,28 @@
+"""Index publication runs for keyset-paginated history.
+
+Revision ID: 9e1a3c5d7f84
+Revises: 8d0f2b4c6e73
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "9e1a3c5d7f84"
+down_revision: str | None = "8d0f2b4c6e73"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_publication_run_guild_scheduled",
+        "publication_run",
+        ["guild_id", "scheduled_for", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_publication_run_guild_scheduled", table_name="publication_run")
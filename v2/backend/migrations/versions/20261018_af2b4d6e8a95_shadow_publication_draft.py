@@ -0,0 +1,77 @@
+"""Store shadow publication drafts once per content hash.
+
+Revision ID: af2b4d6e8a95
+Revises: 9e1a3c5d7f84
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "af2b4d6e8a95"
+down_revision: str | None = "9e1a3c5d7f84"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "shadow_publication_draft",
+        sa.Column("sha256", sa.String(length=64), nullable=False),
+        sa.Column("draft_json", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("sha256", name=op.f("pk_shadow_publication_draft")),
+    )
+    op.execute(
+        """
+        INSERT INTO shadow_publication_draft (sha256, draft_json)
+        SELECT DISTINCT ON (draft_sha256) draft_sha256, draft_json
+        FROM shadow_publication
+        ORDER BY draft_sha256, last_observed_at DESC
+        """
+    )
+    op.create_index(
+        "ix_shadow_publication_draft_sha256",
+        "shadow_publication",
+        ["draft_sha256"],
+        unique=False,
+    )
+    op.create_foreign_key(
+        op.f("fk_shadow_publication_draft_sha256_shadow_publication_draft"),
+        "shadow_publication",
+        "shadow_publication_draft",
+        ["draft_sha256"],
+        ["sha256"],
+    )
+    op.drop_column("shadow_publication", "draft_json")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "shadow_publication",
+        sa.Column("draft_json", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+    op.execute(
+        """
+        UPDATE shadow_publication
+        SET draft_json = shadow_publication_draft.draft_json
+        FROM shadow_publication_draft
+        WHERE shadow_publication_draft.sha256 = shadow_publication.draft_sha256
+        """
+    )
+    op.alter_column("shadow_publication", "draft_json", nullable=False)
+    op.drop_constraint(
+        op.f("fk_shadow_publication_draft_sha256_shadow_publication_draft"),
+        "shadow_publication",
+        type_="foreignkey",
+    )
+    op.drop_index("ix_shadow_publication_draft_sha256", table_name="shadow_publication")
+    op.drop_table("shadow_publication_draft")
@@ -0,0 +1,27 @@
+"""Count member events per indexed Discord role so stale scans are not stored.
+
+Revision ID: b4c6e8f0a2d3
+Revises: af2b4d6e8a95
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "b4c6e8f0a2d3"
+down_revision: str | None = "af2b4d6e8a95"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "discord_role_index",
+        sa.Column("generation", sa.BigInteger(), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("discord_role_index", "generation")
@@ -0,0 +1,138 @@
+"""Compare per-repository and aggregated compose snapshot reads against a live database."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+
+from domcek_bot.application.publication.composer import next_guild_slot
+from domcek_bot.application.records import PublicationGuildInputs, PublicationWindowEvents
+from domcek_bot.application.unit_of_work import RepositorySet
+from domcek_bot.config import ProcessKind, load_settings
+from domcek_bot.domain.time import PublicationWindow
+from domcek_bot.infrastructure.database import Database
+from domcek_bot.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+Inputs = tuple[PublicationGuildInputs, PublicationWindowEvents]
+
+
+def _aware(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None or parsed.utcoffset() is None:
+        raise argparse.ArgumentTypeError("reference time must contain a UTC offset")
+    return parsed
+
+
+async def _per_repository(
+    repositories: RepositorySet, guild_id: int, reference_time: datetime
+) -> Inputs:
+    guild = await repositories.guild_configs.get(guild_id)
+    if guild is None:
+        raise SystemExit(f"publication configuration not found for guild {guild_id}")
+    completed = await repositories.publication_runs.completed_slot_keys(guild_id)
+    window = PublicationWindow.from_slot(next_guild_slot(guild, reference_time, completed))
+    starts_on, ends_on = window.local_dates()
+    sources = await repositories.calendar_sources.list_for_guild(guild_id)
+    source_ids = tuple(source.id for source in sources if source.active)
+    events = await repositories.external_events.list_active_in_window(
+        source_ids,
+        starts_at=window.starts_at,
+        ends_at=window.ends_at,
+        starts_on=starts_on,
+        ends_on=ends_on,
+    )
+    overrides = await repositories.event_overrides.list_for_events(
+        tuple(event.id for event in events)
+    )
+    inputs = PublicationGuildInputs(
+        guild=guild,
+        completed_slot_keys=completed,
+        calendar_sources=tuple(sources),
+        series_overrides=tuple(
+            await repositories.event_series_overrides.list_for_sources(source_ids)
+        ),
+        manual_events=tuple(await repositories.manual_events.list_for_guild(guild_id)),
+        info_announcements=tuple(await repositories.info_announcements.list_for_guild(guild_id)),
+        reaction_config=await repositories.reaction_configs.get(guild_id),
+    )
+    return inputs, PublicationWindowEvents(tuple(events), tuple(overrides))
+
+
+async def _aggregated(
+    repositories: RepositorySet, guild_id: int, reference_time: datetime
+) -> Inputs:
+    inputs = await repositories.publication_snapshots.load_guild_inputs(guild_id)
+    if inputs is None:
+        raise SystemExit(f"publication configuration not found for guild {guild_id}")
+    window = PublicationWindow.from_slot(
+        next_guild_slot(inputs.guild, reference_time, inputs.completed_slot_keys)
+    )
+    starts_on, ends_on = window.local_dates()
+    events = await repositories.publication_snapshots.load_window_events(
+        tuple(source.id for source in inputs.calendar_sources if source.active),
+        starts_at=window.starts_at,
+        ends_at=window.ends_at,
+        starts_on=starts_on,
+        ends_on=ends_on,
+    )
+    return inputs, events
+
+
+async def benchmark(*, guild_id: int, reference_time: datetime, iterations: int) -> None:
+    database = Database(load_settings(ProcessKind.MIGRATION))
+    unit_of_work = SqlAlchemyUnitOfWork(database)
+    loaders: dict[str, Callable[[RepositorySet, int, datetime], Awaitable[Inputs]]] = {
+        "per_repository": _per_repository,
+        "aggregated": _aggregated,
+    }
+    timings: dict[str, list[float]] = {name: [] for name in loaders}
+    results: dict[str, Inputs] = {}
+    try:
+        # Interleave the loaders so cache warm-up and load drift hit both equally.
+        for _ in range(iterations + 1):
+            for name, loader in loaders.items():
+                started = time.perf_counter()
+                async with unit_of_work.transaction() as repositories:
+                    results[name] = await loader(repositories, guild_id, reference_time)
+                timings[name].append((time.perf_counter() - started) * 1000)
+    finally:
+        await database.close()
+    report: dict[str, object] = {
+        name: {
+            "median_ms": round(statistics.median(samples[1:]), 3),
+            "p95_ms": round(statistics.quantiles(samples[1:], n=20)[-1], 3)
+            if len(samples) > 2
+            else round(samples[-1], 3),
+        }
+        for name, samples in timings.items()
+    }
+    report["identical_inputs"] = results["per_repository"] == results["aggregated"]
+    report["iterations"] = iterations
+    print(json.dumps(report, indent=2, sort_keys=True))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--guild-id", type=int, required=True)
+    parser.add_argument("--reference-time", type=_aware, required=True)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--confirm-read-only", action="store_true", required=True)
+    args = parser.parse_args()
+    if args.iterations < 1:
+        parser.error("--iterations must be positive")
+    asyncio.run(
+        benchmark(
+            guild_id=args.guild_id,
+            reference_time=args.reference_time,
+            iterations=args.iterations,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
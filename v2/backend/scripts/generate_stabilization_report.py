@@ -38,7 +38,7 @@ async def generate(
         app_roles=frozenset({AppRole.ADMIN}),
     )
     try:
-        entries = await history.list(principal, limit=100)
+        entries = (await history.list(principal, limit=100)).entries
         operations = await RuntimeOperationsService(unit_of_work).summary(principal)
         async with unit_of_work.transaction() as repositories:
             open_incident_count = await repositories.publication_runs.count_open_incidents(guild_id)
@@ -8,12 +8,14 @@ from datetime import time
 from typing import Annotated, Any, Literal
 
 from fastapi import APIRouter, Depends, Query, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, Field
 
 from domcek_bot.api.dependencies import AuthContext, authenticated_context, csrf_context, services
 from domcek_bot.api.errors import ApplicationError
+from domcek_bot.api.validators import validated_json
 from domcek_bot.application.auth.authorization import AuthorizationDenied, Capability
+from domcek_bot.application.calendar.requests import CalendarSyncRequestTimeout
 from domcek_bot.application.channels import (
     ArchiveDecisionConflict,
     ChannelOperationError,
@@ -195,22 +197,23 @@ async def undo_operation(
     )
 
 
-@router.get("/settings", response_class=JSONResponse)
+@router.get("/settings", response_model=None)
 async def get_settings(
     request: Request,
     context: Annotated[AuthContext, Depends(authenticated_context)],
-) -> JSONResponse:
+) -> Response:
     service = _service(request, "settings")
     try:
         snapshot = await service.get(context.principal)
     except AuthorizationDenied as exc:
         raise _forbidden("Nastavenia môže spravovať iba Admin.") from exc
-    return JSONResponse(
+    return validated_json(
+        request,
         {
             "publication": _guild_json(snapshot.guild),
             "calendars": [_calendar_json(item) for item in snapshot.calendars],
             "reactions": _reaction_json(snapshot.reactions),
-        }
+        },
     )
 
 
@@ -319,6 +322,13 @@ async def sync_calendar(
         raise _forbidden("Synchronizáciu môže spustiť iba Admin.") from exc
     except LookupError as exc:
         raise _not_found("Kalendár sa nenašiel.") from exc
+    except CalendarSyncRequestTimeout as exc:
+        raise ApplicationError(
+            "calendar_sync_queued",
+            "Synchronizácia ešte prebieha",
+            "Požiadavka čaká vo fronte a dokončí sa na pozadí. Stav zdroja obnovte neskôr.",
+            504,
+        ) from exc
     except Exception as exc:
         raise ApplicationError(
             "calendar_sync_failed",
@@ -333,6 +343,7 @@ async def sync_calendar(
             "received": result.received,
             "created": result.created,
             "updated": result.updated,
+            "unchanged": result.unchanged,
             "completed_at": result.completed_at.isoformat(),
         }
     )
@@ -626,7 +637,12 @@ def _calendar_json(record: CalendarSourceRecord) -> dict[str, object]:
     data["id"] = str(data["id"])
     data["guild_id"] = str(data["guild_id"])
     data["sync_status"] = record.sync_status.value
-    for key in ("last_sync_attempt_at", "last_sync_success_at", "last_full_sync_at"):
+    for key in (
+        "last_sync_attempt_at",
+        "last_sync_success_at",
+        "last_full_sync_at",
+        "next_sync_due_at",
+    ):
         value = data[key]
         data[key] = None if value is None else value.isoformat()
     return dict(data)
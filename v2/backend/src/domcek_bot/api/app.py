@@ -12,6 +12,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from domcek_bot.api.admin import router as admin_router
 from domcek_bot.api.audit import router as audit_router
 from domcek_bot.api.auth import router as auth_router
+from domcek_bot.api.calendar import router as calendar_router
 from domcek_bot.api.content import router as content_router
 from domcek_bot.api.dependencies import ApiServices
 from domcek_bot.api.editor import router as editor_router
@@ -95,4 +96,5 @@ def create_app(
     app.include_router(publication_router)
     app.include_router(operations_router)
     app.include_router(admin_router)
+    app.include_router(calendar_router)
     return app
@@ -0,0 +1,31 @@
+"""Unauthenticated Google Calendar push-notification receiver."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Request, Response
+
+from domcek_bot.api.dependencies import services
+from domcek_bot.api.errors import ApplicationError
+
+router = APIRouter(prefix="/api/v1/calendar", tags=["calendar"])
+
+
+@router.post("/notifications", status_code=204)
+async def calendar_notification(request: Request) -> Response:
+    # Google authenticates nothing beyond the channel token it echoes back, so
+    # an unknown, expired or mismatched channel is answered like a missing route.
+    receiver = services(request).calendar_notifications
+    accepted = receiver is not None and await receiver.receive(
+        channel_id=request.headers.get("X-Goog-Channel-ID"),
+        token=request.headers.get("X-Goog-Channel-Token"),
+        resource_id=request.headers.get("X-Goog-Resource-ID"),
+        resource_state=request.headers.get("X-Goog-Resource-State"),
+    )
+    if not accepted:
+        raise ApplicationError(
+            "calendar_channel_unknown",
+            "Kanál nebol nájdený",
+            "Notifikácia nepatrí žiadnemu aktívnemu sledovaniu kalendára.",
+            404,
+        )
+    return Response(status_code=204)
@@ -7,6 +7,7 @@ from datetime import date, datetime
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import Response
 from pydantic import BaseModel, ConfigDict
 
 from domcek_bot.api.dependencies import (
@@ -16,6 +17,7 @@ from domcek_bot.api.dependencies import (
     services,
 )
 from domcek_bot.api.errors import ApplicationError
+from domcek_bot.api.validators import not_modified, strong_etag, validated_json
 from domcek_bot.application.auth.authorization import AuthorizationDenied
 from domcek_bot.application.editor.content import (
     ContentConflict,
@@ -80,16 +82,24 @@ class InfoAnnouncementUpdateBody(InfoAnnouncementBody):
         return InfoAnnouncementValues(**self.model_dump(exclude={"expected_version"}))
 
 
-@router.get("/manual-events")
+@router.get("/manual-events", response_model=None)
 async def list_manual_events(
     request: Request,
     context: Annotated[AuthContext, Depends(authenticated_context)],
-) -> list[dict[str, object]]:
+) -> Response:
+    editor = services(request).content_editor
     try:
-        records = await services(request).content_editor.list_manual(principal=context.principal)
+        etag = strong_etag(
+            "manual-events", await editor.manual_fingerprint(principal=context.principal)
+        )
+        unchanged = not_modified(request, etag)
+        if unchanged is not None:
+            return unchanged
+        records = await editor.list_manual(principal=context.principal)
     except AuthorizationDenied as exc:
         raise _content_error(exc) from exc
-    return [_manual_json(record) for record in records]
+    # Read after the fingerprint, so the body is never older than its ETag.
+    return validated_json(request, [_manual_json(record) for record in records], etag=etag)
 
 
 @router.post("/manual-events", status_code=201)
@@ -156,16 +166,23 @@ async def delete_manual_event(
     return _manual_json(result)
 
 
-@router.get("/info-announcements")
+@router.get("/info-announcements", response_model=None)
 async def list_info_announcements(
     request: Request,
     context: Annotated[AuthContext, Depends(authenticated_context)],
-) -> list[dict[str, object]]:
+) -> Response:
+    editor = services(request).content_editor
     try:
-        records = await services(request).content_editor.list_info(principal=context.principal)
+        etag = strong_etag(
+            "info-announcements", await editor.info_fingerprint(principal=context.principal)
+        )
+        unchanged = not_modified(request, etag)
+        if unchanged is not None:
+            return unchanged
+        records = await editor.list_info(principal=context.principal)
     except AuthorizationDenied as exc:
         raise _content_error(exc) from exc
-    return [_info_json(record) for record in records]
+    return validated_json(request, [_info_json(record) for record in records], etag=etag)
 
 
 @router.post("/info-announcements", status_code=201)
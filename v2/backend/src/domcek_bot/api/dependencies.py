@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Protocol
 
+import structlog
 from fastapi import Request
 
 from domcek_bot.api.errors import ApplicationError
@@ -14,6 +15,7 @@ from domcek_bot.application.auth.contracts import DiscordIdentityError, DiscordM
 from domcek_bot.application.auth.oauth_state import OAuthStateCodec
 from domcek_bot.application.auth.service import AuthService, GuildConfigurationMissing, LoginDenied
 from domcek_bot.application.auth.session import InvalidSession, SessionService
+from domcek_bot.application.calendar.watch import CalendarNotificationReceiver
 from domcek_bot.application.channels import ChannelManagementService
 from domcek_bot.application.discord_admin import DiscordAdministrationService
 from domcek_bot.application.editor.content import ContentEditorialService
@@ -32,6 +34,8 @@ SESSION_COOKIE = "domcek_session"
 CSRF_COOKIE = "domcek_csrf"
 OAUTH_STATE_COOKIE = "domcek_oauth_state"
 
+logger = structlog.get_logger(__name__)
+
 
 class AsyncCloseable(Protocol):
     async def close(self) -> None: ...
@@ -55,12 +59,22 @@ class ApiServices:
     shadow_publications: ShadowPublicationService | None = None
     operations: RuntimeOperationsService | None = None
     undo: UndoService | None = None
+    calendar_notifications: CalendarNotificationReceiver | None = None
     resources: tuple[AsyncCloseable, ...] = ()
 
     async def close(self) -> None:
-        await self.auth.close()
-        for resource in self.resources:
-            await resource.close()
+        # A failed session-touch flush must not leave the Discord client or
+        # the shared resources open, so every close runs regardless.
+        closers: tuple[AsyncCloseable, ...] = (self.sessions, self.auth, *self.resources)
+        for closer in closers:
+            try:
+                await closer.close()
+            except Exception as exc:
+                await logger.awarning(
+                    "api_service_close_failed",
+                    service=type(closer).__name__,
+                    error_type=type(exc).__name__,
+                )
 
 
 @dataclass(frozen=True, slots=True)
@@ -2,24 +2,28 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from domcek_bot.api.dependencies import AuthContext, authenticated_context, services
 from domcek_bot.api.errors import ApplicationError
+from domcek_bot.api.validators import validated_json
 from domcek_bot.application.auth.authorization import AuthorizationDenied
+from domcek_bot.application.auth.principals import PrincipalCacheStats
 
 router = APIRouter(prefix="/api/v1/operations", tags=["operations"])
 
 
-@router.get("/summary", response_class=JSONResponse)
+@router.get("/summary", response_model=None)
 async def operations_summary(
     request: Request,
     context: Annotated[AuthContext, Depends(authenticated_context)],
-) -> JSONResponse:
-    operations = services(request).operations
+) -> Response:
+    bundle = services(request)
+    operations = bundle.operations
     if operations is None:
         raise ApplicationError(
             "operations_unavailable",
@@ -45,7 +49,8 @@ async def operations_summary(
         ) from exc
 
     metrics = summary.publication_metrics
-    return JSONResponse(
+    return validated_json(
+        request,
         {
             "observed_at": summary.observed_at.isoformat(),
             "next_publication": {
@@ -65,6 +70,7 @@ async def operations_summary(
                 for process in summary.processes
             ],
             "active_instance_counts": summary.active_instance_counts,
+            "api_principal_cache": _stats(bundle.auth.principal_cache_stats()),
             "calendars": [
                 {
                     "id": str(calendar.id),
@@ -96,9 +102,13 @@ async def operations_summary(
                 }
                 for task in summary.recent_tasks
             ],
-        }
+        },
     )
 
 
+def _stats(value: PrincipalCacheStats | None) -> dict[str, int] | None:
+    return None if value is None else asdict(value)
+
+
 def _iso(value: object) -> str | None:
     return value.isoformat() if hasattr(value, "isoformat") else None
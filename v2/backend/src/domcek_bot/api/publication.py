@@ -8,7 +8,7 @@ from datetime import UTC, datetime
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, Field
 
 from domcek_bot.api.dependencies import (
@@ -18,6 +18,12 @@ from domcek_bot.api.dependencies import (
     services,
 )
 from domcek_bot.api.errors import ApplicationError
+from domcek_bot.api.validators import (
+    not_modified,
+    strong_etag,
+    validated_body,
+    validated_json,
+)
 from domcek_bot.application.auth.authorization import AuthorizationDenied, Capability
 from domcek_bot.application.publication.composer import PublicationCompositionError
 from domcek_bot.application.publication.engine import (
@@ -27,16 +33,23 @@ from domcek_bot.application.publication.engine import (
     PublicationGuardResult,
     PublicationResult,
 )
-from domcek_bot.application.publication.history import PublicationHistoryEntry
+from domcek_bot.application.publication.history import (
+    InvalidHistoryCursor,
+    PublicationHistoryCursor,
+    PublicationHistoryEntry,
+)
 from domcek_bot.application.publication.manual import (
     InvalidPublishConfirmation,
     ManualPublicationDisabled,
 )
 from domcek_bot.application.publication.recovery import InvalidReconciliation
 from domcek_bot.application.publication.service import PublicationConfigurationNotFound
+from domcek_bot.application.publication.shadow import ShadowPublicationEntry
 
 router = APIRouter(prefix="/api/v1/publication")
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 class ConfirmPublicationBody(BaseModel):
     confirmation_token: str = Field(min_length=20, max_length=4096)
@@ -60,15 +73,31 @@ async def publication_history(
     request: Request,
     context: Annotated[AuthContext, Depends(authenticated_context)],
     limit: int = 50,
+    cursor: str | None = None,
+    summary: bool = False,
 ) -> JSONResponse:
     history = services(request).publication_history
     if history is None:
         raise _history_unavailable()
     try:
-        entries = await history.list(context.principal, limit=limit)
+        before = None if cursor is None else PublicationHistoryCursor.decode(cursor)
+    except InvalidHistoryCursor as exc:
+        raise ApplicationError(
+            "invalid_cursor",
+            "Neplatná stránka histórie",
+            "Načítajte históriu publikácií znova od začiatku.",
+            400,
+        ) from exc
+    try:
+        page = await history.list(
+            context.principal, limit=limit, before=before, include_details=not summary
+        )
     except AuthorizationDenied as exc:
         raise _history_forbidden() from exc
-    return JSONResponse([_history_json(entry) for entry in entries])
+    headers = {} if page.next_cursor is None else {NEXT_CURSOR_HEADER: page.next_cursor.encode()}
+    return JSONResponse(
+        [_history_json(entry, details=not summary) for entry in page.entries], headers=headers
+    )
 
 
 @router.get("/history/{run_id}", response_class=JSONResponse)
@@ -94,11 +123,11 @@ async def publication_history_detail(
     return JSONResponse(_history_json(entry))
 
 
-@router.get("/dashboard", response_class=JSONResponse)
+@router.get("/dashboard", response_model=None)
 async def publication_dashboard(
     request: Request,
     context: Annotated[AuthContext, Depends(authenticated_context)],
-) -> JSONResponse:
+) -> Response:
     history = services(request).publication_history
     if history is None:
         raise _history_unavailable()
@@ -114,7 +143,8 @@ async def publication_dashboard(
             409,
         ) from exc
     last = summary.last_publication
-    return JSONResponse(
+    return validated_json(
+        request,
         {
             "automatic_publication_enabled": summary.automatic_publication_enabled,
             "last_calendar_sync_at": _iso(summary.last_calendar_sync_at),
@@ -140,7 +170,7 @@ async def publication_dashboard(
                 "state": last.state.value,
                 "mode": last.mode.value,
             },
-        }
+        },
     )
 
 
@@ -149,44 +179,52 @@ async def publication_shadow_history(
     request: Request,
     context: Annotated[AuthContext, Depends(authenticated_context)],
     limit: int = 20,
+    summary: bool = False,
 ) -> JSONResponse:
     shadow = services(request).shadow_publications
     if shadow is None:
         raise _history_unavailable()
     try:
-        captures = await shadow.list(context.principal, limit=limit)
+        entries = await shadow.list(context.principal, limit=limit, include_drafts=not summary)
     except AuthorizationDenied as exc:
         raise _history_forbidden() from exc
-    return JSONResponse(
-        [
-            {
-                "id": str(capture.id),
-                "slot_key": capture.slot_key,
-                "scheduled_for": capture.scheduled_for.isoformat(),
-                "first_observed_at": capture.first_observed_at.isoformat(),
-                "last_observed_at": capture.last_observed_at.isoformat(),
-                "observation_count": capture.observation_count,
-                "draft_sha256": capture.draft_sha256,
-                "item_count": capture.item_count,
-                "message_count": capture.message_count,
-                "calendar_sync_valid": capture.calendar_sync_valid,
-                "calendar_sync_evidence": capture.calendar_sync_evidence,
-                "warning_codes": list(capture.warning_codes),
-                "draft": capture.draft_json,
-            }
-            for capture in captures
-        ]
-    )
+    return JSONResponse([_shadow_capture_json(entry) for entry in entries])
+
+
+@router.get("/shadow-history/{capture_id}/draft", response_model=None)
+async def publication_shadow_draft(
+    capture_id: uuid.UUID,
+    request: Request,
+    context: Annotated[AuthContext, Depends(authenticated_context)],
+) -> Response:
+    shadow = services(request).shadow_publications
+    if shadow is None:
+        raise _history_unavailable()
+    try:
+        capture = await shadow.get(capture_id, context.principal)
+        if capture is None:
+            raise _shadow_capture_not_found()
+        # The hash names the draft body, so a matching validator needs no read.
+        etag = strong_etag(capture.draft_sha256)
+        unchanged = not_modified(request, etag)
+        if unchanged is not None:
+            return unchanged
+        draft = await shadow.draft(capture, context.principal)
+    except AuthorizationDenied as exc:
+        raise _history_forbidden() from exc
+    if draft is None:
+        raise _shadow_capture_not_found()
+    return validated_json(request, draft.draft_json, etag=etag)
 
 
-@router.get("/draft", response_class=JSONResponse)
+@router.get("/draft", response_model=None)
 async def publication_draft(
     request: Request,
     context: Annotated[AuthContext, Depends(authenticated_context)],
-) -> JSONResponse:
+) -> Response:
     try:
         context.principal.require(Capability.VIEW_ADMIN)
-        draft = await services(request).publication_drafts.compose_next(
+        canonical, digest = await services(request).publication_drafts.compose_next_canonical(
             context.principal.guild_id,
             reference_time=datetime.now(UTC),
             intro_text="Ahojte, prinášame prehľad udalostí na najbližšie dva týždne.",
@@ -212,7 +250,7 @@ async def publication_draft(
             "Niektorý oznam prekračuje publikačné limity alebo nie je platný.",
             422,
         ) from exc
-    return JSONResponse(json.loads(draft.canonical_json()))
+    return validated_body(request, canonical.encode(), etag=strong_etag(digest))
 
 
 @router.post("/manual/preview", response_class=JSONResponse)
@@ -485,9 +523,39 @@ def _recovery_invalid() -> ApplicationError:
     )
 
 
-def _history_json(entry: PublicationHistoryEntry) -> dict[str, object]:
+def _shadow_capture_json(entry: ShadowPublicationEntry) -> dict[str, object]:
+    capture = entry.capture
+    value: dict[str, object] = {
+        "id": str(capture.id),
+        "slot_key": capture.slot_key,
+        "scheduled_for": capture.scheduled_for.isoformat(),
+        "first_observed_at": capture.first_observed_at.isoformat(),
+        "last_observed_at": capture.last_observed_at.isoformat(),
+        "observation_count": capture.observation_count,
+        "draft_sha256": capture.draft_sha256,
+        "item_count": capture.item_count,
+        "message_count": capture.message_count,
+        "calendar_sync_valid": capture.calendar_sync_valid,
+        "calendar_sync_evidence": capture.calendar_sync_evidence,
+        "warning_codes": list(capture.warning_codes),
+    }
+    if entry.draft_json is not None:
+        value["draft"] = entry.draft_json
+    return value
+
+
+def _shadow_capture_not_found() -> ApplicationError:
+    return ApplicationError(
+        "shadow_publication_not_found",
+        "Kontrolný náhľad sa nenašiel",
+        "Záznam neexistuje alebo patrí inému Discord serveru.",
+        404,
+    )
+
+
+def _history_json(entry: PublicationHistoryEntry, *, details: bool = True) -> dict[str, object]:
     run = entry.run
-    return {
+    value: dict[str, object] = {
         "id": str(run.id),
         "slot_key": run.slot_key,
         "scheduled_for": run.scheduled_for.isoformat(),
@@ -507,6 +575,10 @@ def _history_json(entry: PublicationHistoryEntry) -> dict[str, object]:
         "completed_at": _iso(run.completed_at),
         "error_code": run.error_code,
         "error_detail": run.error_detail,
+    }
+    if not details:
+        return value
+    return value | {
         "items": [
             {
                 "id": str(item.id),
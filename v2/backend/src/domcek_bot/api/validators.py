@@ -0,0 +1,52 @@
+"""Strong ETags and conditional GET for read-only API responses."""
+
+from __future__ import annotations
+
+import hashlib
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+
+# Browsers keep the body but revalidate every time, so a poll that finds
+# nothing new costs a 304 instead of the full payload.
+VALIDATED_HEADERS = {"Cache-Control": "private, no-cache", "Vary": "Cookie"}
+
+
+def strong_etag(*parts: str) -> str:
+    """Quote a digest of ``parts``; callers pass versions or content hashes."""
+
+    return '"' + hashlib.sha256("\x1f".join(parts).encode()).hexdigest() + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """Return a 304 when the client already holds ``etag``."""
+
+    if not etag_matches(request, etag):
+        return None
+    return Response(status_code=304, headers={"ETag": etag, **VALIDATED_HEADERS})
+
+
+def validated_body(request: Request, body: bytes, *, etag: str | None = None) -> Response:
+    """Send a rendered JSON body, or a 304 when it matches the client's copy."""
+
+    resolved = etag or strong_etag(hashlib.sha256(body).hexdigest())
+    unchanged = not_modified(request, resolved)
+    if unchanged is not None:
+        return unchanged
+    return Response(
+        body,
+        media_type="application/json",
+        headers={"ETag": resolved, **VALIDATED_HEADERS},
+    )
+
+
+def validated_json(request: Request, content: object, *, etag: str | None = None) -> Response:
+    return validated_body(request, bytes(JSONResponse(content).body), etag=etag)
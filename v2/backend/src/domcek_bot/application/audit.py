@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import uuid
-from typing import Any
+from typing import Any, Protocol
 
 from domcek_bot.application.auth.authorization import (
     AuthorizationDenied,
@@ -11,7 +11,6 @@ from domcek_bot.application.auth.authorization import (
     Principal,
 )
 from domcek_bot.application.records import AuditLogRecord
-from domcek_bot.application.repositories import AuditLogRepository
 from domcek_bot.application.unit_of_work import UnitOfWork
 from domcek_bot.domain.enums import AuditResult
 
@@ -25,10 +24,14 @@ TEAM_MOD_AUDIT_OBJECTS = (
 )
 
 
+class AuditSink(Protocol):
+    async def add(self, record: AuditLogRecord) -> None: ...
+
+
 class AuditWriter:
     """Small helper keeping new use cases on one audit record shape."""
 
-    def __init__(self, repository: AuditLogRepository) -> None:
+    def __init__(self, repository: AuditSink) -> None:
         self._repository = repository
 
     async def success(
@@ -0,0 +1,127 @@
+"""Short-lived per-session cache of principals resolved from Discord."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import timedelta
+
+from domcek_bot.application.auth.authorization import Principal
+
+
+@dataclass(frozen=True, slots=True)
+class PrincipalCacheStats:
+    entries: int
+    hits: int
+    misses: int
+    joined: int
+    invalidations: int
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    principal: Principal
+    expires_at: float
+
+
+class PrincipalCache:
+    """Reuse a session's principal for ``ttl`` instead of asking Discord again.
+
+    Concurrent lookups for one session share a single load. Role and guild
+    configuration changes made through Carlo invalidate entries explicitly;
+    changes made directly in Discord take effect once the entry expires, so
+    ``ttl`` bounds how long a revoked role keeps working. A zero ``ttl`` only
+    deduplicates concurrent lookups.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: timedelta,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl < timedelta(0) or max_entries < 1:
+            raise ValueError(
+                "principal cache TTL must not be negative and its size must be positive"
+            )
+        self._ttl = ttl.total_seconds()
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: dict[uuid.UUID, _Entry] = {}
+        self._loading: dict[uuid.UUID, asyncio.Task[Principal]] = {}
+        # Bumped by every invalidation so a load that started before it is
+        # returned to its callers but never stored.
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._joined = 0
+        self._invalidations = 0
+
+    async def get(
+        self, session_id: uuid.UUID, load: Callable[[], Awaitable[Principal]]
+    ) -> Principal:
+        entry = self._entries.get(session_id)
+        if entry is not None and entry.expires_at > self._clock():
+            self._hits += 1
+            return entry.principal
+        loading = self._loading.get(session_id)
+        if loading is not None:
+            self._joined += 1
+            return await asyncio.shield(loading)
+        self._misses += 1
+        generation = self._generation
+        task = asyncio.ensure_future(load())
+        # A load whose callers all went away still has its failure retrieved.
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self._loading[session_id] = task
+        try:
+            principal = await asyncio.shield(task)
+        finally:
+            if self._loading.get(session_id) is task:
+                del self._loading[session_id]
+        if self._ttl > 0 and generation == self._generation:
+            self._store(session_id, principal)
+        return principal
+
+    def invalidate_user(self, user_id: int) -> None:
+        self._invalidate(
+            [
+                session_id
+                for session_id, entry in self._entries.items()
+                if entry.principal.user_id == user_id
+            ]
+        )
+
+    def invalidate_all(self) -> None:
+        self._invalidate(list(self._entries))
+
+    def stats(self) -> PrincipalCacheStats:
+        return PrincipalCacheStats(
+            entries=len(self._entries),
+            hits=self._hits,
+            misses=self._misses,
+            joined=self._joined,
+            invalidations=self._invalidations,
+        )
+
+    def _invalidate(self, session_ids: list[uuid.UUID]) -> None:
+        for session_id in session_ids:
+            del self._entries[session_id]
+        # In-flight loads may have read the old roles; later callers load anew.
+        self._loading.clear()
+        self._generation += 1
+        self._invalidations += 1
+
+    def _store(self, session_id: uuid.UUID, principal: Principal) -> None:
+        now = self._clock()
+        if len(self._entries) >= self._max_entries:
+            for expired in [key for key, entry in self._entries.items() if entry.expires_at <= now]:
+                del self._entries[expired]
+        while len(self._entries) >= self._max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries.pop(session_id, None)
+        self._entries[session_id] = _Entry(principal, now + self._ttl)
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 
 from domcek_bot.application.auth.authorization import Principal, resolve_app_roles
 from domcek_bot.application.auth.contracts import DiscordIdentityClient, DiscordUser
+from domcek_bot.application.auth.principals import PrincipalCache, PrincipalCacheStats
 from domcek_bot.application.auth.session import IssuedSession, SessionService
 from domcek_bot.application.records import WebSessionRecord
 from domcek_bot.application.unit_of_work import UnitOfWork
@@ -35,11 +36,13 @@ class AuthService:
         sessions: SessionService,
         *,
         guild_id: int,
+        principals: PrincipalCache | None = None,
     ) -> None:
         self._unit_of_work = unit_of_work
         self._discord = discord
         self._sessions = sessions
         self._guild_id = guild_id
+        self._principals = principals
 
     async def close(self) -> None:
         await self._discord.close()
@@ -62,11 +65,21 @@ class AuthService:
         self, session_token: str | None
     ) -> tuple[WebSessionRecord, Principal]:
         record = await self._sessions.authenticate(session_token)
+        if self._principals is None:
+            return record, await self._session_principal(record)
+        return record, await self._principals.get(
+            record.id, lambda: self._session_principal(record)
+        )
+
+    def principal_cache_stats(self) -> PrincipalCacheStats | None:
+        return None if self._principals is None else self._principals.stats()
+
+    async def _session_principal(self, record: WebSessionRecord) -> Principal:
         member = await self._discord.guild_member(record.guild_id, record.discord_user_id)
         principal = await self._principal(member.user, member.role_ids, member.nickname)
         if not principal.app_roles:
             raise LoginDenied("Discord member no longer has an administration role")
-        return record, principal
+        return principal
 
     async def _principal(
         self,
@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import hmac
 import secrets
 import uuid
+from contextlib import suppress
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 
+import structlog
+
 from domcek_bot.application.records import WebSessionRecord
 from domcek_bot.application.unit_of_work import UnitOfWork
 
+logger = structlog.get_logger(__name__)
+
 
 class InvalidSession(PermissionError):
     pass
@@ -25,16 +31,32 @@ class IssuedSession:
 
 
 class SessionService:
+    """Create, verify and revoke opaque server sessions.
+
+    ``last_seen_at`` is only advanced once it is ``touch_granularity`` old. With
+    ``defer_touches`` those updates are collected in memory and written by a
+    background task in one statement per interval, so authenticating a request
+    only reads; ``close`` writes whatever is still pending.
+    """
+
     def __init__(
         self,
         unit_of_work: UnitOfWork,
         *,
         secret: str,
         lifetime: timedelta,
+        touch_granularity: timedelta = timedelta(seconds=60),
+        defer_touches: bool = False,
     ) -> None:
+        if touch_granularity <= timedelta(0):
+            raise ValueError("session touch granularity must be positive")
         self._unit_of_work = unit_of_work
         self._secret = secret.encode()
         self._lifetime = lifetime
+        self._touch_granularity = touch_granularity
+        self._defer_touches = defer_touches
+        self._pending_touches: dict[uuid.UUID, datetime] = {}
+        self._touch_flusher: asyncio.Task[None] | None = None
 
     async def create(
         self, *, guild_id: int, user_id: int, now: datetime | None = None
@@ -66,9 +88,14 @@ class SessionService:
             record = await repositories.web_sessions.get_active_by_token_hash(
                 self.hash_token(session_token), now=current
             )
-            if record is None:
-                raise InvalidSession("session is invalid or expired")
-            await repositories.web_sessions.touch(record.id, seen_at=current)
+        if record is None:
+            raise InvalidSession("session is invalid or expired")
+        if current - record.last_seen_at >= self._touch_granularity:
+            if self._defer_touches:
+                self._defer_touch(record.id, current)
+            else:
+                async with self._unit_of_work.transaction() as repositories:
+                    await repositories.web_sessions.touch_many({record.id: current})
         return record
 
     def verify_csrf(self, record: WebSessionRecord, cookie: str | None, header: str | None) -> None:
@@ -79,12 +106,55 @@ class SessionService:
 
     async def revoke(self, record: WebSessionRecord, *, now: datetime | None = None) -> None:
         current = _aware_now(now)
+        self._pending_touches.pop(record.id, None)
         async with self._unit_of_work.transaction() as repositories:
             await repositories.web_sessions.revoke(record.id, revoked_at=current)
 
+    async def flush_touches(self) -> int:
+        """Write all deferred touches in one statement and return how many."""
+
+        pending, self._pending_touches = self._pending_touches, {}
+        if not pending:
+            return 0
+        try:
+            async with self._unit_of_work.transaction() as repositories:
+                await repositories.web_sessions.touch_many(pending)
+        except Exception:
+            for session_id, seen_at in pending.items():
+                self._merge_touch(session_id, seen_at)
+            raise
+        return len(pending)
+
+    async def close(self) -> None:
+        if self._touch_flusher is not None:
+            self._touch_flusher.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._touch_flusher
+            self._touch_flusher = None
+        await self.flush_touches()
+
     def hash_token(self, token: str) -> str:
         return hmac.new(self._secret, token.encode(), hashlib.sha256).hexdigest()
 
+    def _defer_touch(self, session_id: uuid.UUID, seen_at: datetime) -> None:
+        self._merge_touch(session_id, seen_at)
+        if self._touch_flusher is None or self._touch_flusher.done():
+            self._touch_flusher = asyncio.create_task(self._flush_touches_periodically())
+
+    def _merge_touch(self, session_id: uuid.UUID, seen_at: datetime) -> None:
+        pending = self._pending_touches.get(session_id)
+        if pending is None or pending < seen_at:
+            self._pending_touches[session_id] = seen_at
+
+    async def _flush_touches_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._touch_granularity.total_seconds())
+            try:
+                await self.flush_touches()
+            except Exception as exc:
+                # Kept touches are retried with the next batch.
+                await logger.awarning("session_touch_flush_failed", error_type=type(exc).__name__)
+
 
 def _aware_now(value: datetime | None) -> datetime:
     current = value or datetime.now(UTC)
@@ -85,6 +85,13 @@ class CalendarEventPage:
     next_sync_token: str | None
 
 
+@dataclass(frozen=True, slots=True)
+class CalendarWatchChannel:
+    channel_id: str
+    resource_id: str
+    expires_at: datetime
+
+
 @dataclass(frozen=True, slots=True)
 class CalendarMetadata:
     calendar_id: str
@@ -110,3 +117,19 @@ class CalendarClient(Protocol):
     ) -> CalendarEventPage: ...
 
     async def close(self) -> None: ...
+
+
+class CalendarWatchClient(Protocol):
+    """Push-notification channels for one calendar's event changes."""
+
+    async def watch_events(
+        self,
+        calendar_id: str,
+        *,
+        channel_id: str,
+        token: str,
+        address: str,
+        expires_at: datetime,
+    ) -> CalendarWatchChannel: ...
+
+    async def stop_watch(self, channel_id: str, resource_id: str) -> None: ...
@@ -0,0 +1,75 @@
+"""Bounded-concurrency execution of independent calendar source synchronizations."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Protocol
+
+from domcek_bot.application.calendar.sync import CalendarSyncResult
+from domcek_bot.application.records import CalendarSourceRecord
+
+
+class CalendarSourceSynchronizer(Protocol):
+    async def synchronize(self, source_id: uuid.UUID) -> CalendarSyncResult: ...
+
+
+@dataclass(frozen=True, slots=True)
+class CalendarSyncOutcome:
+    source_id: uuid.UUID
+    guild_id: int
+    result: CalendarSyncResult | None
+    error: Exception | None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.result is not None
+
+
+class CalendarSyncExecutor:
+    """Run source synchronizations in parallel under global and per-guild limits.
+
+    Each source still takes its own ``try_acquire_sync`` lease inside the
+    synchronizer, so a source already leased by another worker fails alone.
+    The global limit is shared by every ``run`` on this executor; per-guild
+    limits apply within one run.
+    """
+
+    def __init__(
+        self,
+        synchronizer: CalendarSourceSynchronizer,
+        *,
+        max_concurrency: int = 4,
+        max_concurrency_per_guild: int = 2,
+    ) -> None:
+        if max_concurrency < 1 or max_concurrency_per_guild < 1:
+            raise ValueError("calendar sync concurrency limits must be positive")
+        self._synchronizer = synchronizer
+        self._max_concurrency_per_guild = max_concurrency_per_guild
+        self._global_limit = asyncio.Semaphore(max_concurrency)
+
+    async def run(self, sources: Sequence[CalendarSourceRecord]) -> tuple[CalendarSyncOutcome, ...]:
+        guild_limits = {
+            guild_id: asyncio.Semaphore(self._max_concurrency_per_guild)
+            for guild_id in {source.guild_id for source in sources}
+        }
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(self._run_one(source, guild_limits[source.guild_id]))
+                for source in sources
+            ]
+        return tuple(task.result() for task in tasks)
+
+    async def _run_one(
+        self, source: CalendarSourceRecord, guild_limit: asyncio.Semaphore
+    ) -> CalendarSyncOutcome:
+        # Take the guild slot first so a guild waiting on its own limit never
+        # holds a global slot another guild could use.
+        async with guild_limit, self._global_limit:
+            try:
+                result = await self._synchronizer.synchronize(source.id)
+            except Exception as exc:
+                return CalendarSyncOutcome(source.id, source.guild_id, None, exc)
+        return CalendarSyncOutcome(source.id, source.guild_id, result, None)
@@ -0,0 +1,185 @@
+"""Durable, coalescing queue in front of calendar source synchronization."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any, Protocol
+
+from domcek_bot.application.calendar.contracts import CalendarIntegrationError
+from domcek_bot.application.calendar.sync import (
+    CalendarSyncMode,
+    CalendarSyncResult,
+    safe_sync_error_code,
+)
+from domcek_bot.application.records import CalendarSyncRequestRecord
+from domcek_bot.application.unit_of_work import UnitOfWork
+from domcek_bot.domain.enums import CalendarSyncRequestState
+
+
+class CalendarSyncRequestFailed(CalendarIntegrationError):
+    def __init__(self, error_code: str) -> None:
+        super().__init__(f"calendar sync request failed: {error_code}")
+        self.error_code = error_code
+
+
+class CalendarSyncRequestTimeout(CalendarIntegrationError):
+    pass
+
+
+class CalendarSynchronizer(Protocol):
+    async def synchronize(
+        self, source_id: uuid.UUID, *, force_full: bool = False
+    ) -> CalendarSyncResult: ...
+
+
+class CalendarSyncRequestQueue:
+    """Merge concurrent sync requests per source into one execution.
+
+    A source has at most one pending request; later requests join it and a
+    force-full request upgrades it. Whoever claims the pending request first
+    (a waiting caller or the worker draining the queue) runs the sync and
+    stores the result, which every other waiter reads back. A request that
+    arrives while a sync is running queues behind it instead of failing with
+    ``CalendarSyncAlreadyRunning``.
+    """
+
+    def __init__(
+        self,
+        unit_of_work: UnitOfWork,
+        synchronizer: CalendarSynchronizer,
+        *,
+        wait_timeout: timedelta = timedelta(minutes=2),
+        poll_interval: float = 0.5,
+        stale_after: timedelta = timedelta(minutes=15),
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        if wait_timeout <= timedelta(0) or poll_interval <= 0:
+            raise ValueError("sync request wait timeout and poll interval must be positive")
+        self._unit_of_work = unit_of_work
+        self._synchronizer = synchronizer
+        self._wait_timeout = wait_timeout
+        self._poll_interval = poll_interval
+        self._stale_after = stale_after
+        self._clock = clock
+        self._sleep = sleep
+
+    async def request(
+        self, source_id: uuid.UUID, *, force_full: bool = False
+    ) -> CalendarSyncRequestRecord:
+        """Record a request without waiting; returns the pending request it joined."""
+
+        async with self._unit_of_work.transaction() as repositories:
+            pending = await repositories.calendar_sync_requests.enqueue(
+                CalendarSyncRequestRecord(
+                    id=uuid.uuid4(),
+                    calendar_source_id=source_id,
+                    state=CalendarSyncRequestState.PENDING,
+                    requested_at=self._clock(),
+                    force_full=force_full,
+                )
+            )
+            await repositories.worker_wakeups.notify("calendar_sync_request")
+        return pending
+
+    async def status(self, request_id: uuid.UUID) -> CalendarSyncRequestRecord:
+        async with self._unit_of_work.transaction() as repositories:
+            current = await repositories.calendar_sync_requests.get(request_id)
+        if current is None:
+            raise LookupError(f"calendar sync request not found: {request_id}")
+        return current
+
+    async def wait(self, request_id: uuid.UUID) -> CalendarSyncResult:
+        """Return the request's result, running it here if nobody else has."""
+
+        deadline = time.monotonic() + self._wait_timeout.total_seconds()
+        while True:
+            current = await self.status(request_id)
+            if current.state is CalendarSyncRequestState.SUCCEEDED:
+                return _result_from_value(current)
+            if current.state is CalendarSyncRequestState.FAILED:
+                raise CalendarSyncRequestFailed(current.error_code or "unknown")
+            if current.state is CalendarSyncRequestState.PENDING:
+                claimed = await self._claim(request_id)
+                if claimed is not None:
+                    return await self._execute(claimed)
+            if time.monotonic() >= deadline:
+                raise CalendarSyncRequestTimeout("calendar sync request is still queued")
+            await self._sleep(self._poll_interval)
+
+    async def synchronize(
+        self, source_id: uuid.UUID, *, force_full: bool = False
+    ) -> CalendarSyncResult:
+        request = await self.request(source_id, force_full=force_full)
+        return await self.wait(request.id)
+
+    async def _claim(self, request_id: uuid.UUID) -> CalendarSyncRequestRecord | None:
+        started_at = self._clock()
+        async with self._unit_of_work.transaction() as repositories:
+            return await repositories.calendar_sync_requests.claim(
+                request_id,
+                started_at=started_at,
+                stale_before=started_at - self._stale_after,
+            )
+
+    async def _execute(self, request: CalendarSyncRequestRecord) -> CalendarSyncResult:
+        try:
+            result = await self._synchronizer.synchronize(
+                request.calendar_source_id, force_full=request.force_full
+            )
+        except (Exception, asyncio.CancelledError) as exc:
+            # Waiters must not poll a cancelled request until it goes stale.
+            async with self._unit_of_work.transaction() as repositories:
+                await repositories.calendar_sync_requests.complete(
+                    request.id,
+                    state=CalendarSyncRequestState.FAILED,
+                    completed_at=self._clock(),
+                    error_code=safe_sync_error_code(exc),
+                )
+            raise
+        async with self._unit_of_work.transaction() as repositories:
+            await repositories.calendar_sync_requests.complete(
+                request.id,
+                state=CalendarSyncRequestState.SUCCEEDED,
+                completed_at=self._clock(),
+                result_value=_result_value(result),
+            )
+        return result
+
+
+def _result_value(result: CalendarSyncResult) -> dict[str, Any]:
+    return {
+        "mode": result.mode.value,
+        "pages": result.pages,
+        "received": result.received,
+        "created": result.created,
+        "updated": result.updated,
+        "unchanged": result.unchanged,
+        "cancelled": result.cancelled,
+        "ignored_cancellations": result.ignored_cancellations,
+        "missing_marked_deleted": result.missing_marked_deleted,
+        "series_identity_warnings": result.series_identity_warnings,
+        "completed_at": result.completed_at.isoformat(),
+    }
+
+
+def _result_from_value(request: CalendarSyncRequestRecord) -> CalendarSyncResult:
+    value = request.result_value or {}
+    return CalendarSyncResult(
+        source_id=request.calendar_source_id,
+        mode=CalendarSyncMode(value["mode"]),
+        pages=int(value["pages"]),
+        received=int(value["received"]),
+        created=int(value["created"]),
+        updated=int(value["updated"]),
+        unchanged=int(value["unchanged"]),
+        cancelled=int(value["cancelled"]),
+        ignored_cancellations=int(value["ignored_cancellations"]),
+        missing_marked_deleted=int(value["missing_marked_deleted"]),
+        series_identity_warnings=int(value["series_identity_warnings"]),
+        completed_at=datetime.fromisoformat(value["completed_at"]),
+    )
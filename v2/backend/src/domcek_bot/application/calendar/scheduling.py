@@ -0,0 +1,76 @@
+"""Adaptive per-source calendar synchronization cadence."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from domcek_bot.application.calendar.sync import CalendarSyncResult
+from domcek_bot.application.records import CalendarSourceRecord
+
+
+@dataclass(frozen=True, slots=True)
+class CalendarSyncCadence:
+    """Back off sources that stopped changing, but never near a publication.
+
+    A sync that changed rows, failed or was skipped resets a source to the base
+    interval; each quiet sync multiplies the previous interval up to the
+    ceiling. Inside ``publication_lead`` before the guild's next slot every
+    source runs at the base interval, and the lead itself always starts with a
+    sync, so the publication freshness guard is met regardless of backoff.
+    Sources with a live push channel back off to ``watched_max_interval``
+    instead, since a change ping makes them due immediately.
+    """
+
+    base_interval: timedelta = timedelta(minutes=5)
+    max_interval: timedelta = timedelta(hours=1)
+    backoff_factor: int = 2
+    publication_lead: timedelta = timedelta(hours=6)
+    watched_max_interval: timedelta | None = None
+
+    def __post_init__(self) -> None:
+        if self.base_interval <= timedelta(0):
+            raise ValueError("base sync interval must be positive")
+        if self.max_interval < self.base_interval:
+            raise ValueError("max sync interval cannot be shorter than the base interval")
+        if self.backoff_factor < 1:
+            raise ValueError("sync backoff factor must be positive")
+        if self.publication_lead <= timedelta(0):
+            raise ValueError("publication lead must be positive")
+        if self.watched_max_interval is not None and self.watched_max_interval < self.max_interval:
+            raise ValueError("watched sync interval cannot be shorter than the max interval")
+
+    def next_due(
+        self,
+        source: CalendarSourceRecord,
+        result: CalendarSyncResult | None,
+        *,
+        now: datetime,
+        next_publication_at: datetime,
+        watched: bool = False,
+    ) -> datetime:
+        """Return the next due time; ``source`` is the record read before this sync."""
+
+        interval = self.base_interval
+        ceiling = self.max_interval
+        if watched and self.watched_max_interval is not None:
+            ceiling = self.watched_max_interval
+        previous = _previous_interval(source)
+        if result is not None and not _changed(result) and previous is not None:
+            interval = min(max(previous * self.backoff_factor, interval), ceiling)
+        due_at = now + interval
+        lead_starts_at = next_publication_at - self.publication_lead
+        if now >= lead_starts_at:
+            return min(due_at, now + self.base_interval)
+        return min(due_at, lead_starts_at)
+
+
+def _previous_interval(source: CalendarSourceRecord) -> timedelta | None:
+    if source.next_sync_due_at is None or source.last_sync_attempt_at is None:
+        return None
+    interval = source.next_sync_due_at - source.last_sync_attempt_at
+    return interval if interval > timedelta(0) else None
+
+
+def _changed(result: CalendarSyncResult) -> bool:
+    return result.created + result.updated + result.cancelled + result.missing_marked_deleted > 0
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import itertools
 import uuid
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from enum import StrEnum
@@ -13,6 +15,7 @@ import structlog
 
 from domcek_bot.application.calendar.contracts import (
     CalendarClient,
+    CalendarEventPage,
     CalendarIntegrationError,
     CalendarMetadata,
     CalendarPayloadError,
@@ -20,12 +23,15 @@ from domcek_bot.application.calendar.contracts import (
     ProviderCalendarEvent,
 )
 from domcek_bot.application.calendar.normalization import normalize_provider_event
-from domcek_bot.application.records import CalendarSourceRecord
-from domcek_bot.application.unit_of_work import UnitOfWork
+from domcek_bot.application.records import CalendarSourceRecord, ExternalEventRecord
+from domcek_bot.application.repositories import ExternalEventRepository
+from domcek_bot.application.unit_of_work import RepositorySet, UnitOfWork
 from domcek_bot.domain.enums import ExternalEventStatus
 
 logger = structlog.get_logger(__name__)
 
+SYNC_TOKEN_PROBE_WINDOW = timedelta(minutes=1)
+
 
 class CalendarSyncMode(StrEnum):
     FULL = "full"
@@ -43,6 +49,9 @@ class CalendarSyncPolicy:
     future_horizon: timedelta = timedelta(days=400)
     max_pages: int = 1000
     lease_timeout: timedelta = timedelta(minutes=15)
+    apply_batch_size: int = 250
+    stream_pages: bool = False
+    full_sync_partitions: int = 1
 
     def __post_init__(self) -> None:
         if self.past_horizon < timedelta(0):
@@ -53,6 +62,12 @@ class CalendarSyncPolicy:
             raise ValueError("max_pages must be positive")
         if self.lease_timeout <= timedelta(0):
             raise ValueError("sync lease timeout must be positive")
+        if self.apply_batch_size < 1:
+            raise ValueError("apply_batch_size must be positive")
+        if self.full_sync_partitions < 1:
+            raise ValueError("full_sync_partitions must be positive")
+        if self.stream_pages and self.full_sync_partitions > 1:
+            raise ValueError("partitioned full sync merges slices and cannot stream pages")
 
 
 @dataclass(frozen=True, slots=True)
@@ -63,6 +78,7 @@ class CalendarSyncResult:
     received: int
     created: int
     updated: int
+    unchanged: int
     cancelled: int
     ignored_cancellations: int
     missing_marked_deleted: int
@@ -143,28 +159,29 @@ class CalendarSyncService:
             )
             if can_increment:
                 try:
-                    events, next_token, pages = await self._collect_pages(
-                        source, sync_token=source.sync_token
+                    return await self._synchronize_pages(
+                        source, sync_token=source.sync_token, mode=CalendarSyncMode.INCREMENTAL
                     )
-                    mode = CalendarSyncMode.INCREMENTAL
                 except CalendarSyncTokenExpired:
-                    events, next_token, pages = await self._collect_pages(source, sync_token=None)
-                    mode = CalendarSyncMode.FULL_AFTER_EXPIRED_TOKEN
-            else:
-                events, next_token, pages = await self._collect_pages(source, sync_token=None)
-                mode = CalendarSyncMode.FULL
-
-            completed_at = self._aware_now()
-            return await self._apply_success(
-                source,
-                events=events,
-                next_sync_token=next_token,
-                pages=pages,
-                mode=mode,
-                completed_at=completed_at,
+                    return await self._synchronize_pages(
+                        source, sync_token=None, mode=CalendarSyncMode.FULL_AFTER_EXPIRED_TOKEN
+                    )
+            return await self._synchronize_pages(
+                source, sync_token=None, mode=CalendarSyncMode.FULL
             )
+        except asyncio.CancelledError as exc:
+            # A timed-out or shut-down caller must not leave the lease held
+            # until it goes stale; cancellation is not a provider failure, so
+            # nobody is alerted.
+            async with self._unit_of_work.transaction() as transaction:
+                await transaction.calendar_sources.mark_sync_failed(
+                    source_id,
+                    attempted_at=self._aware_now(),
+                    error_code=safe_sync_error_code(exc),
+                )
+            raise
         except Exception as exc:
-            error_code = _safe_error_code(exc)
+            error_code = safe_sync_error_code(exc)
             failure_at = self._aware_now()
             async with self._unit_of_work.transaction() as transaction:
                 await transaction.calendar_sources.mark_sync_failed(
@@ -195,18 +212,143 @@ class CalendarSyncService:
             raise CalendarIntegrationError("calendar source is inactive")
         return source
 
-    async def _collect_pages(
-        self, source: CalendarSourceRecord, *, sync_token: str | None
-    ) -> tuple[list[ProviderCalendarEvent], str, int]:
+    async def _synchronize_pages(
+        self, source: CalendarSourceRecord, *, sync_token: str | None, mode: CalendarSyncMode
+    ) -> CalendarSyncResult:
+        full_range = None if sync_token else self._full_sync_range()
+        time_min, time_max = full_range or (None, None)
+        if full_range is not None and self._policy.full_sync_partitions > 1:
+            merged, provider_pages = await self._collect_partitioned(source, *full_range)
+            completed_at = self._aware_now()
+            async with self._unit_of_work.transaction() as transaction:
+                application = _SyncApplication(
+                    transaction, source, mode=mode, synced_at=completed_at, policy=self._policy
+                )
+                await application.apply_page(merged, provider_pages=provider_pages)
+                await application.finish(sync_query_key=self._client.sync_query_key)
+        elif self._policy.stream_pages:
+            # Pages are applied while the sync transaction stays open, so peak
+            # memory follows the page size and readers still see either the
+            # previous state or the complete sync after commit.
+            completed_at = self._aware_now()
+            async with self._unit_of_work.transaction() as transaction:
+                application = _SyncApplication(
+                    transaction, source, mode=mode, synced_at=completed_at, policy=self._policy
+                )
+                async for page in self._iter_pages(
+                    source, sync_token=sync_token, time_min=time_min, time_max=time_max
+                ):
+                    await application.apply_page(page)
+                await application.finish(sync_query_key=self._client.sync_query_key)
+        else:
+            pages = [
+                page
+                async for page in self._iter_pages(
+                    source, sync_token=sync_token, time_min=time_min, time_max=time_max
+                )
+            ]
+            completed_at = self._aware_now()
+            async with self._unit_of_work.transaction() as transaction:
+                application = _SyncApplication(
+                    transaction, source, mode=mode, synced_at=completed_at, policy=self._policy
+                )
+                for page in pages:
+                    await application.apply_page(page)
+                await application.finish(sync_query_key=self._client.sync_query_key)
+
+        for event_id in application.series_identity_warnings:
+            try:
+                await self._alerts.calendar_series_identity_changed(
+                    guild_id=source.guild_id,
+                    source_id=source.id,
+                    event_id=event_id,
+                )
+            except Exception as alert_error:
+                logger.warning(
+                    "calendar_series_alert_failed",
+                    source_id=str(source.id),
+                    event_id=str(event_id),
+                    alert_error=type(alert_error).__name__,
+                )
+        return application.result()
+
+    def _full_sync_range(self) -> tuple[datetime, datetime]:
+        now = self._aware_now()
+        return now - self._policy.past_horizon, now + self._policy.future_horizon
+
+    async def _collect_partitioned(
+        self, source: CalendarSourceRecord, time_min: datetime, time_max: datetime
+    ) -> tuple[CalendarEventPage, int]:
+        """Read disjoint horizon slices concurrently and merge them into one page.
+
+        The sync token comes from a tiny listing just past the horizon that is
+        read before any slice, so changes made while the slices are fetched are
+        delivered again by the next incremental sync instead of being lost.
+        """
+
+        token_pages = [
+            page
+            async for page in self._iter_pages(
+                source,
+                sync_token=None,
+                time_min=time_max,
+                time_max=time_max + SYNC_TOKEN_PROBE_WINDOW,
+            )
+        ]
+        partitions = self._policy.full_sync_partitions
+        step = (time_max - time_min) / partitions
+        bounds = [time_min + step * index for index in range(partitions)] + [time_max]
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [
+                    group.create_task(self._collect_slice(source, time_min=start, time_max=end))
+                    for start, end in itertools.pairwise(bounds)
+                ]
+        except ExceptionGroup as errors:
+            # Surface the provider error itself so failure codes and the
+            # expired-token fallback behave as for a sequential listing.
+            raise errors.exceptions[0] from None
+
+        merged: dict[str, ProviderCalendarEvent] = {}
+        provider_pages = len(token_pages)
+        for task in tasks:
+            slice_pages = task.result()
+            provider_pages += len(slice_pages)
+            for page in slice_pages:
+                for event in page.events:
+                    # Events spanning a slice boundary are listed by both slices.
+                    current = merged.get(event.provider_event_id)
+                    if current is None or _is_newer(event, current):
+                        merged[event.provider_event_id] = event
+        page = CalendarEventPage(
+            events=tuple(merged.values()),
+            next_page_token=None,
+            next_sync_token=token_pages[-1].next_sync_token,
+        )
+        return page, provider_pages
+
+    async def _collect_slice(
+        self, source: CalendarSourceRecord, *, time_min: datetime, time_max: datetime
+    ) -> list[CalendarEventPage]:
+        return [
+            page
+            async for page in self._iter_pages(
+                source, sync_token=None, time_min=time_min, time_max=time_max
+            )
+        ]
+
+    async def _iter_pages(
+        self,
+        source: CalendarSourceRecord,
+        *,
+        sync_token: str | None,
+        time_min: datetime | None,
+        time_max: datetime | None,
+    ) -> AsyncIterator[CalendarEventPage]:
         page_token: str | None = None
         seen_page_tokens: set[str] = set()
-        events: list[ProviderCalendarEvent] = []
-        next_sync_token: str | None = None
-        now = self._aware_now()
-        time_min = None if sync_token else now - self._policy.past_horizon
-        time_max = None if sync_token else now + self._policy.future_horizon
 
-        for page_number in range(1, self._policy.max_pages + 1):
+        for _ in range(self._policy.max_pages):
             page = await self._client.list_events(
                 source.external_calendar_id,
                 page_token=page_token,
@@ -214,118 +356,215 @@ class CalendarSyncService:
                 time_min=time_min,
                 time_max=time_max,
             )
-            events.extend(page.events)
-            next_sync_token = page.next_sync_token
             if page.next_page_token is None:
-                if next_sync_token is None:
+                if page.next_sync_token is None:
                     raise CalendarPayloadError("last Google page has no nextSyncToken")
-                return events, next_sync_token, page_number
+                yield page
+                return
             if page.next_sync_token is not None:
                 raise CalendarPayloadError("non-final Google page unexpectedly has nextSyncToken")
             if page.next_page_token in seen_page_tokens:
                 raise CalendarPayloadError("Google pagination token repeated")
             seen_page_tokens.add(page.next_page_token)
             page_token = page.next_page_token
+            yield page
 
         raise CalendarPayloadError("Google pagination exceeded configured safety limit")
 
-    async def _apply_success(
+    def _aware_now(self) -> datetime:
+        value = self._clock()
+        if value.utcoffset() is None:
+            raise ValueError("calendar sync clock must return an aware datetime")
+        return value
+
+
+class _SyncApplication:
+    """Apply validated provider pages inside one sync transaction."""
+
+    def __init__(
         self,
+        transaction: RepositorySet,
         source: CalendarSourceRecord,
         *,
-        events: list[ProviderCalendarEvent],
-        next_sync_token: str,
-        pages: int,
         mode: CalendarSyncMode,
-        completed_at: datetime,
-    ) -> CalendarSyncResult:
-        created = 0
-        updated = 0
-        cancelled = 0
-        ignored_cancellations = 0
-        seen_source_keys: set[str] = set()
-        series_identity_warnings: set[uuid.UUID] = set()
-
-        async with self._unit_of_work.transaction() as transaction:
-            existing_by_source_key = {
-                event.source_key: event
-                for event in await transaction.external_events.list_for_source(source.id)
-            }
-            for event in events:
-                if event.status is ExternalEventStatus.CANCELLED:
-                    was_known = await transaction.external_events.cancel_by_provider_event_id(
-                        source.id,
-                        event.provider_event_id,
-                        synced_at=completed_at,
-                    )
-                    cancelled += int(was_known)
-                    ignored_cancellations += int(not was_known)
-                    continue
-
-                normalized = normalize_provider_event(event, source, synced_at=completed_at)
-                existing = existing_by_source_key.get(normalized.source_key)
-                if existing is not None and existing.series_key != normalized.series_key:
-                    override = await transaction.event_overrides.get(existing.id)
-                    if override is not None:
-                        series_identity_warnings.add(existing.id)
-                seen_source_keys.add(normalized.source_key)
-                was_created = await transaction.external_events.upsert_from_sync(normalized)
-                created += int(was_created)
-                updated += int(not was_created)
-
-            is_full = mode is not CalendarSyncMode.INCREMENTAL
-            missing_marked_deleted = 0
-            if is_full:
-                missing_marked_deleted = await transaction.external_events.mark_missing_deleted(
-                    source.id,
-                    seen_source_keys,
-                    deleted_at=completed_at,
-                )
-            await transaction.calendar_sources.mark_sync_succeeded(
-                source.id,
-                sync_token=next_sync_token,
-                sync_token_query_key=self._client.sync_query_key,
-                completed_at=completed_at,
-                was_full_sync=is_full,
+        synced_at: datetime,
+        policy: CalendarSyncPolicy,
+    ) -> None:
+        self._transaction = transaction
+        self._source = source
+        self._mode = mode
+        self._synced_at = synced_at
+        self._is_full = mode is not CalendarSyncMode.INCREMENTAL
+        self._writes = _PendingSyncWrites(
+            transaction.external_events,
+            source.id,
+            synced_at=synced_at,
+            batch_size=policy.apply_batch_size,
+        )
+        self._series_candidates: set[uuid.UUID] = set()
+        self._pages = 0
+        self._received = 0
+        self._next_sync_token: str | None = None
+        self._missing_marked_deleted = 0
+        self.series_identity_warnings: frozenset[uuid.UUID] = frozenset()
+
+    async def apply_page(self, page: CalendarEventPage, *, provider_pages: int = 1) -> None:
+        self._pages += provider_pages
+        self._received += len(page.events)
+        self._next_sync_token = page.next_sync_token
+        normalized_events: list[ExternalEventRecord | None] = [
+            None
+            if event.status is ExternalEventStatus.CANCELLED
+            else normalize_provider_event(event, self._source, synced_at=self._synced_at)
+            for event in page.events
+        ]
+        source_keys = tuple(
+            dict.fromkeys(record.source_key for record in normalized_events if record is not None)
+        )
+        existing_by_source_key = {
+            event.source_key: event
+            for event in await self._transaction.external_events.list_by_source_keys(source_keys)
+        }
+        for event, normalized in zip(page.events, normalized_events, strict=True):
+            if normalized is None:
+                await self._writes.cancel(event.provider_event_id)
+                continue
+            existing = existing_by_source_key.get(normalized.source_key)
+            if existing is not None and existing.series_key != normalized.series_key:
+                self._series_candidates.add(existing.id)
+            await self._writes.upsert(normalized)
+        if self._is_full:
+            await self._transaction.external_events.remember_seen_source_keys(source_keys)
+
+    async def finish(self, *, sync_query_key: str) -> None:
+        if self._next_sync_token is None:
+            raise CalendarPayloadError("last Google page has no nextSyncToken")
+        await self._writes.flush()
+        self.series_identity_warnings = frozenset(
+            override.external_event_id
+            for override in await self._transaction.event_overrides.list_for_events(
+                tuple(sorted(self._series_candidates))
             )
-
-        for event_id in series_identity_warnings:
-            try:
-                await self._alerts.calendar_series_identity_changed(
-                    guild_id=source.guild_id,
-                    source_id=source.id,
-                    event_id=event_id,
-                )
-            except Exception as alert_error:
-                logger.warning(
-                    "calendar_series_alert_failed",
-                    source_id=str(source.id),
-                    event_id=str(event_id),
-                    alert_error=type(alert_error).__name__,
+        )
+        if self._is_full:
+            self._missing_marked_deleted = (
+                await self._transaction.external_events.mark_missing_deleted(
+                    self._source.id, deleted_at=self._synced_at
                 )
+            )
+        await self._transaction.calendar_sources.mark_sync_succeeded(
+            self._source.id,
+            sync_token=self._next_sync_token,
+            sync_token_query_key=sync_query_key,
+            completed_at=self._synced_at,
+            was_full_sync=self._is_full,
+        )
 
+    def result(self) -> CalendarSyncResult:
         return CalendarSyncResult(
-            source_id=source.id,
-            mode=mode,
-            pages=pages,
-            received=len(events),
-            created=created,
-            updated=updated,
-            cancelled=cancelled,
-            ignored_cancellations=ignored_cancellations,
-            missing_marked_deleted=missing_marked_deleted,
-            series_identity_warnings=len(series_identity_warnings),
-            completed_at=completed_at,
+            source_id=self._source.id,
+            mode=self._mode,
+            pages=self._pages,
+            received=self._received,
+            created=self._writes.created,
+            updated=self._writes.updated,
+            unchanged=self._writes.unchanged,
+            cancelled=self._writes.cancelled,
+            ignored_cancellations=self._writes.ignored_cancellations,
+            missing_marked_deleted=self._missing_marked_deleted,
+            series_identity_warnings=len(self.series_identity_warnings),
+            completed_at=self._synced_at,
         )
 
-    def _aware_now(self) -> datetime:
-        value = self._clock()
-        if value.utcoffset() is None:
-            raise ValueError("calendar sync clock must return an aware datetime")
-        return value
+
+class _PendingSyncWrites:
+    """Buffer provider changes into set-based statements without reordering effects.
+
+    A batch is flushed early whenever the next change touches an identity that is
+    already pending, so counters and final row state match one-by-one application.
+    """
+
+    def __init__(
+        self,
+        events: ExternalEventRepository,
+        source_id: uuid.UUID,
+        *,
+        synced_at: datetime,
+        batch_size: int,
+    ) -> None:
+        self._events = events
+        self._source_id = source_id
+        self._synced_at = synced_at
+        self._batch_size = batch_size
+        self._upserts: dict[str, ExternalEventRecord] = {}
+        self._upsert_provider_ids: set[str] = set()
+        self._cancellations: dict[str, None] = {}
+        self.created = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.cancelled = 0
+        self.ignored_cancellations = 0
+
+    async def upsert(self, record: ExternalEventRecord) -> None:
+        if record.source_key in self._upserts:
+            await self._flush_upserts()
+        if record.provider_event_id in self._cancellations:
+            await self._flush_cancellations()
+        self._upserts[record.source_key] = record
+        self._upsert_provider_ids.add(record.provider_event_id)
+        if len(self._upserts) >= self._batch_size:
+            await self._flush_upserts()
+
+    async def cancel(self, provider_event_id: str) -> None:
+        if provider_event_id in self._cancellations:
+            await self._flush_cancellations()
+        if provider_event_id in self._upsert_provider_ids:
+            await self._flush_upserts()
+        self._cancellations[provider_event_id] = None
+        if len(self._cancellations) >= self._batch_size:
+            await self._flush_cancellations()
+
+    async def flush(self) -> None:
+        await self._flush_upserts()
+        await self._flush_cancellations()
+
+    async def _flush_upserts(self) -> None:
+        if not self._upserts:
+            return
+        written = await self._events.upsert_many_from_sync(tuple(self._upserts.values()))
+        # Rows the provider reports unchanged only record that they were seen.
+        unchanged = tuple(key for key in self._upserts if key not in written)
+        await self._events.mark_many_synced(unchanged, synced_at=self._synced_at)
+        inserted = sum(written.values())
+        self.created += inserted
+        self.updated += len(written) - inserted
+        self.unchanged += len(unchanged)
+        self._upserts.clear()
+        self._upsert_provider_ids.clear()
+
+    async def _flush_cancellations(self) -> None:
+        if not self._cancellations:
+            return
+        requested = tuple(self._cancellations)
+        known = await self._events.cancel_many_by_provider_event_ids(
+            self._source_id, requested, synced_at=self._synced_at
+        )
+        self.cancelled += len(known)
+        self.ignored_cancellations += len(requested) - len(known)
+        self._cancellations.clear()
+
+
+def _is_newer(candidate: ProviderCalendarEvent, current: ProviderCalendarEvent) -> bool:
+    return (
+        candidate.updated_at is not None
+        and current.updated_at is not None
+        and candidate.updated_at > current.updated_at
+    )
 
 
-def _safe_error_code(exc: Exception) -> str:
+def safe_sync_error_code(exc: BaseException) -> str:
     if isinstance(exc, CalendarIntegrationError):
         return type(exc).__name__
+    if isinstance(exc, asyncio.CancelledError):
+        return "CalendarSyncCancelled"
     return "CalendarSyncInternalError"
@@ -0,0 +1,200 @@
+"""Google Calendar push-notification channels and their webhook pings."""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import secrets
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+import structlog
+
+from domcek_bot.application.calendar.contracts import CalendarNotFoundError, CalendarWatchClient
+from domcek_bot.application.records import CalendarSourceRecord, CalendarWatchChannelRecord
+from domcek_bot.application.unit_of_work import UnitOfWork
+
+logger = structlog.get_logger(__name__)
+
+# Google sends this state once when a channel is created; it carries no change.
+SYNC_HANDSHAKE_STATE = "sync"
+
+
+@dataclass(frozen=True, slots=True)
+class CalendarWatchRenewal:
+    created: int
+    stopped: int
+    failed: int
+
+
+class CalendarNotificationReceiver:
+    """Turn an authenticated change ping into an immediately due source sync."""
+
+    def __init__(
+        self,
+        unit_of_work: UnitOfWork,
+        *,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        self._unit_of_work = unit_of_work
+        self._clock = clock
+
+    async def receive(
+        self,
+        *,
+        channel_id: str | None,
+        token: str | None,
+        resource_id: str | None,
+        resource_state: str | None,
+    ) -> bool:
+        """Return whether the ping belongs to a live channel this process created."""
+
+        try:
+            parsed_id = uuid.UUID(channel_id or "")
+        except ValueError:
+            return False
+        received_at = self._clock()
+        async with self._unit_of_work.transaction() as repositories:
+            channel = await repositories.calendar_watch_channels.get(parsed_id)
+            if (
+                channel is None
+                or channel.expires_at <= received_at
+                or not hmac.compare_digest(channel.resource_id, resource_id or "")
+                or not hmac.compare_digest(channel.token_hash, _token_hash(token or ""))
+            ):
+                return False
+            if resource_state != SYNC_HANDSHAKE_STATE:
+                await repositories.calendar_sources.schedule_next_sync(
+                    channel.calendar_source_id, due_at=received_at
+                )
+                await repositories.worker_wakeups.notify("calendar_watch")
+        return True
+
+
+class CalendarWatchRenewer:
+    """Keep one live channel per active source and retire the rest.
+
+    A channel is replaced ``renew_before`` its expiry. When creating a channel
+    fails the source simply has none, so its adaptive polling takes over.
+    """
+
+    def __init__(
+        self,
+        unit_of_work: UnitOfWork,
+        client: CalendarWatchClient,
+        *,
+        address: str,
+        ttl: timedelta = timedelta(hours=24),
+        renew_before: timedelta = timedelta(hours=1),
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        if renew_before >= ttl:
+            raise ValueError("watch renewal must start before the channel lifetime ends")
+        self._unit_of_work = unit_of_work
+        self._client = client
+        self._address = address
+        self._ttl = ttl
+        self._renew_before = renew_before
+        self._clock = clock
+
+    async def renew_due(self) -> CalendarWatchRenewal:
+        now = self._clock()
+        async with self._unit_of_work.transaction() as repositories:
+            sources = [
+                source
+                for guild in await repositories.guild_configs.list_all()
+                for source in await repositories.calendar_sources.list_for_guild(guild.guild_id)
+                if source.active
+            ]
+            channels = await repositories.calendar_watch_channels.list_all()
+
+        created = failed = 0
+        renewed_at = now + self._renew_before
+        for source in sources:
+            if any(
+                channel.calendar_source_id == source.id and channel.expires_at > renewed_at
+                for channel in channels
+            ):
+                continue
+            try:
+                channels.append(await self._create(source, now))
+                created += 1
+            except Exception as exc:
+                failed += 1
+                await logger.awarning(
+                    "calendar_watch_failed",
+                    source_id=str(source.id),
+                    error_type=type(exc).__name__,
+                )
+                if any(channel.calendar_source_id == source.id for channel in channels):
+                    # The source was relying on pushes and may be backed off to
+                    # the watched ceiling; poll now and let the cadence restart.
+                    await self._poll_now(source, now)
+
+        active_ids = {source.id for source in sources}
+        newest: dict[uuid.UUID, CalendarWatchChannelRecord] = {}
+        for channel in channels:
+            current = newest.get(channel.calendar_source_id)
+            if current is None or channel.expires_at > current.expires_at:
+                newest[channel.calendar_source_id] = channel
+        retired = [
+            channel
+            for channel in channels
+            if channel.calendar_source_id not in active_ids
+            or channel.expires_at <= now
+            or newest[channel.calendar_source_id].id != channel.id
+        ]
+        for channel in retired:
+            await self._stop(channel)
+        return CalendarWatchRenewal(created=created, stopped=len(retired), failed=failed)
+
+    async def _create(
+        self, source: CalendarSourceRecord, now: datetime
+    ) -> CalendarWatchChannelRecord:
+        channel_id = uuid.uuid4()
+        token = secrets.token_urlsafe(32)
+        granted = await self._client.watch_events(
+            source.external_calendar_id,
+            channel_id=str(channel_id),
+            token=token,
+            address=self._address,
+            expires_at=now + self._ttl,
+        )
+        record = CalendarWatchChannelRecord(
+            id=channel_id,
+            calendar_source_id=source.id,
+            resource_id=granted.resource_id,
+            token_hash=_token_hash(token),
+            expires_at=granted.expires_at,
+            created_at=now,
+        )
+        async with self._unit_of_work.transaction() as repositories:
+            await repositories.calendar_watch_channels.add(record)
+        return record
+
+    async def _poll_now(self, source: CalendarSourceRecord, now: datetime) -> None:
+        async with self._unit_of_work.transaction() as repositories:
+            await repositories.calendar_sources.schedule_next_sync(source.id, due_at=now)
+
+    async def _stop(self, channel: CalendarWatchChannelRecord) -> None:
+        if channel.expires_at > self._clock():
+            try:
+                await self._client.stop_watch(str(channel.id), channel.resource_id)
+            except CalendarNotFoundError:
+                pass
+            except Exception as exc:
+                # The record is dropped anyway; Google expires the channel and
+                # pings for an unknown channel are rejected.
+                await logger.awarning(
+                    "calendar_watch_stop_failed",
+                    channel_id=str(channel.id),
+                    error_type=type(exc).__name__,
+                )
+        async with self._unit_of_work.transaction() as repositories:
+            await repositories.calendar_watch_channels.delete(channel.id)
+
+
+def _token_hash(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
@@ -9,6 +9,7 @@ from typing import Protocol
 from domcek_bot.application.alerts import ModeratorAlertTransport
 from domcek_bot.application.audit import AuditWriter
 from domcek_bot.application.auth.authorization import Capability, Principal
+from domcek_bot.application.auth.principals import PrincipalCache
 from domcek_bot.application.records import UndoOperationRecord
 from domcek_bot.application.repositories import AuditLogRepository
 from domcek_bot.application.unit_of_work import UnitOfWork
@@ -95,10 +96,12 @@ class DiscordAdministrationService:
         unit_of_work: UnitOfWork,
         discord: DiscordAdministrationGateway,
         alerts: ModeratorAlertTransport | None = None,
+        principals: PrincipalCache | None = None,
     ) -> None:
         self._unit_of_work = unit_of_work
         self._discord = discord
         self._alerts = alerts
+        self._principals = principals
 
     async def directory(self, principal: Principal) -> DiscordDirectory:
         if not (
@@ -285,6 +288,9 @@ class DiscordAdministrationService:
                             correlation_id=correlation_id,
                             after_value={"role": role},
                         )
+        if undo_id is not None and self._principals is not None:
+            # Also after a failure: Discord may have applied the change anyway.
+            self._principals.invalidate_user(member_id)
         if denial is not None:
             raise denial
         if failure is not None:
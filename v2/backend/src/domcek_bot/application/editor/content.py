@@ -155,6 +155,11 @@ class ContentEditorialService:
         async with self._unit_of_work.transaction() as repositories:
             return await repositories.manual_events.list_for_guild(principal.guild_id)
 
+    async def manual_fingerprint(self, *, principal: Principal) -> str:
+        principal.require(Capability.EDIT_CONTENT)
+        async with self._unit_of_work.transaction() as repositories:
+            return await repositories.manual_events.list_fingerprint(principal.guild_id)
+
     async def create_manual(
         self,
         command: CreateManualEvent,
@@ -298,6 +303,11 @@ class ContentEditorialService:
         async with self._unit_of_work.transaction() as repositories:
             return await repositories.info_announcements.list_for_guild(principal.guild_id)
 
+    async def info_fingerprint(self, *, principal: Principal) -> str:
+        principal.require(Capability.EDIT_CONTENT)
+        async with self._unit_of_work.transaction() as repositories:
+            return await repositories.info_announcements.list_fingerprint(principal.guild_id)
+
     async def create_info(
         self,
         command: CreateInfoAnnouncement,
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -78,8 +79,24 @@ class OperationsSummary:
 
 
 class RuntimeOperationsService:
-    def __init__(self, unit_of_work: UnitOfWork) -> None:
+    """Record runtime heartbeats and summarize them per guild.
+
+    A heartbeat whose state and details match the stored row is only written
+    once that row is older than ``heartbeat_refresh``. Keep it well below the
+    ``stale_after`` freshness used by the health checks so a steady process
+    never looks stale between two writes.
+    """
+
+    def __init__(
+        self,
+        unit_of_work: UnitOfWork,
+        *,
+        heartbeat_refresh: timedelta = timedelta(seconds=45),
+    ) -> None:
+        if heartbeat_refresh < timedelta(0):
+            raise ValueError("runtime heartbeat refresh must not be negative")
         self._unit_of_work = unit_of_work
+        self._heartbeat_refresh = heartbeat_refresh
 
     async def heartbeat(
         self,
@@ -92,26 +109,65 @@ class RuntimeOperationsService:
         observed_at: datetime | None = None,
         details: dict[str, Any] | None = None,
     ) -> None:
+        await self.heartbeat_guilds(
+            guild_ids=(guild_id,),
+            process_name=process_name,
+            instance_id=instance_id,
+            state=state,
+            started_at=started_at,
+            observed_at=observed_at,
+            details=details,
+        )
+
+    async def heartbeat_guilds(
+        self,
+        *,
+        guild_ids: Iterable[int] | None,
+        process_name: str,
+        instance_id: uuid.UUID,
+        state: str,
+        started_at: datetime,
+        observed_at: datetime | None = None,
+        details: dict[str, Any] | None = None,
+    ) -> int:
+        """Record one process heartbeat for several guilds in a single upsert.
+
+        ``None`` means every configured guild. Returns how many rows were
+        written; unchanged fresh rows are skipped.
+        """
+
         timestamp = _aware(observed_at or datetime.now(UTC))
+        started = _aware(started_at)
         clean_process = process_name.strip().lower()
         clean_state = state.strip().lower()
         if not clean_process or len(clean_process) > 32:
             raise ValueError("runtime process name is invalid")
         if not clean_state or len(clean_state) > 32:
             raise ValueError("runtime state is invalid")
-        identity = uuid.uuid5(HEARTBEAT_NAMESPACE, f"{guild_id}:{clean_process}:{instance_id}")
-        record = RuntimeHeartbeatRecord(
-            id=identity,
-            guild_id=guild_id,
-            process_name=clean_process,
-            instance_id=instance_id,
-            state=clean_state,
-            started_at=_aware(started_at),
-            last_seen_at=timestamp,
-            details=dict(details or {}),
-        )
         async with self._unit_of_work.transaction() as repositories:
-            await repositories.runtime_heartbeats.upsert(record)
+            targets = (
+                [guild.guild_id for guild in await repositories.guild_configs.list_all()]
+                if guild_ids is None
+                else list(dict.fromkeys(guild_ids))
+            )
+            return await repositories.runtime_heartbeats.upsert_many(
+                [
+                    RuntimeHeartbeatRecord(
+                        id=uuid.uuid5(
+                            HEARTBEAT_NAMESPACE, f"{guild_id}:{clean_process}:{instance_id}"
+                        ),
+                        guild_id=guild_id,
+                        process_name=clean_process,
+                        instance_id=instance_id,
+                        state=clean_state,
+                        started_at=started,
+                        last_seen_at=timestamp,
+                        details=dict(details or {}),
+                    )
+                    for guild_id in targets
+                ],
+                refresh_before=timestamp - self._heartbeat_refresh,
+            )
 
     async def process_health(
         self,
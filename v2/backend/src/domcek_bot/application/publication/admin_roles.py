@@ -0,0 +1,90 @@
+"""Persistent Discord role-membership index for publication guard recipients."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime, timedelta
+
+from domcek_bot.application.publication.guard import PublicationGuardDiscordGateway
+from domcek_bot.application.unit_of_work import UnitOfWork
+
+
+class RoleMembershipIndex:
+    """Role holders kept current by gateway member events and refreshed on expiry.
+
+    The bot applies every member role change it sees. Any process can read the
+    index; an unknown or expired role is loaded once from Discord and stored,
+    which also bounds drift from events missed while the bot was offline. A
+    load is not stored when a member event arrived while it ran, because the
+    scan may predate the event; the role stays expired for the next reader.
+    """
+
+    def __init__(
+        self,
+        unit_of_work: UnitOfWork,
+        *,
+        ttl: timedelta = timedelta(hours=6),
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        self._unit_of_work = unit_of_work
+        self._ttl = ttl
+        self._clock = clock
+
+    async def members(
+        self, guild_id: int, role_id: int, discord: PublicationGuardDiscordGateway
+    ) -> tuple[int, ...]:
+        async with self._unit_of_work.transaction() as repositories:
+            indexed = await repositories.discord_role_members.list_members(
+                guild_id, role_id, refreshed_after=self._clock() - self._ttl
+            )
+            if indexed is not None:
+                return indexed
+            generation = await repositories.discord_role_members.begin_refresh(guild_id, role_id)
+        loaded = await discord.admin_member_ids(guild_id, role_id)
+        async with self._unit_of_work.transaction() as repositories:
+            await repositories.discord_role_members.replace_members(
+                guild_id, role_id, loaded, refreshed_at=self._clock(), generation=generation
+            )
+        return loaded
+
+    async def record_member_roles(
+        self, guild_id: int, user_id: int, role_ids: Iterable[int]
+    ) -> None:
+        async with self._unit_of_work.transaction() as repositories:
+            await repositories.discord_role_members.apply_member_roles(
+                guild_id, user_id, frozenset(role_ids)
+            )
+
+    async def invalidate(self, guild_id: int) -> None:
+        async with self._unit_of_work.transaction() as repositories:
+            await repositories.discord_role_members.invalidate(guild_id)
+
+
+class IndexedGuardDiscordGateway:
+    """Guard gateway that answers role membership from the index."""
+
+    def __init__(self, discord: PublicationGuardDiscordGateway, index: RoleMembershipIndex) -> None:
+        self._discord = discord
+        self._index = index
+
+    async def admin_member_ids(self, guild_id: int, admin_role_id: int) -> tuple[int, ...]:
+        return await self._index.members(guild_id, admin_role_id, self._discord)
+
+    async def send_guard_dm(
+        self,
+        *,
+        recipient_user_id: int,
+        run_id: uuid.UUID,
+        release_at: datetime,
+        nonce: str,
+    ) -> tuple[int, int]:
+        return await self._discord.send_guard_dm(
+            recipient_user_id=recipient_user_id,
+            run_id=run_id,
+            release_at=release_at,
+            nonce=nonce,
+        )
+
+    async def delete_guard_dm(self, *, channel_id: int, message_id: int) -> None:
+        await self._discord.delete_guard_dm(channel_id=channel_id, message_id=message_id)
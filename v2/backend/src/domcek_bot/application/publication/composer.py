@@ -30,9 +30,14 @@ from domcek_bot.application.publication.models import (
     PublicationComposeSnapshot,
     PublicationDraft,
     PublicationDraftItem,
+    PublicationSelection,
     ValueOrigin,
 )
-from domcek_bot.application.records import EventOverrideRecord, ExternalEventRecord
+from domcek_bot.application.records import (
+    EventOverrideRecord,
+    ExternalEventRecord,
+    GuildConfigRecord,
+)
 from domcek_bot.domain.calendar import parse_calendar_description
 from domcek_bot.domain.enums import DescriptionState, ExternalEventStatus, InclusionDecision
 from domcek_bot.domain.errors import DomainValidationError
@@ -79,18 +84,13 @@ class PublicationCompositionError(DomainValidationError):
 
 
 def compose_publication(snapshot: PublicationComposeSnapshot) -> PublicationDraft:
-    reference_time = require_aware(snapshot.reference_time, "reference_time")
-    schedule = PublicationSchedule(
-        weekday=snapshot.guild.publication_weekday,
-        local_time=snapshot.guild.publication_time,
-        timezone_name=snapshot.guild.timezone,
-    )
-    slot = next_unprocessed_slot(
-        schedule,
-        GuildId(snapshot.guild.guild_id),
-        reference_time,
-        snapshot.completed_slot_keys,
-    )
+    return render_publication(select_publication_items(snapshot), intro_text=snapshot.intro_text)
+
+
+def select_publication_items(snapshot: PublicationComposeSnapshot) -> PublicationSelection:
+    """Resolve the slot, overrides and item order; the expensive, intro-free stage."""
+
+    slot = next_guild_slot(snapshot.guild, snapshot.reference_time, snapshot.completed_slot_keys)
     window = PublicationWindow.from_slot(slot)
     source_by_id = {
         source.id: source
@@ -158,40 +158,74 @@ def compose_publication(snapshot: PublicationComposeSnapshot) -> PublicationDraf
     editor_events.sort(key=lambda item: _event_sort_key(item, snapshot.guild.timezone))
     event_items.sort(key=lambda item: _event_sort_key(item, snapshot.guild.timezone))
     info_items.sort(key=_info_sort_key)
-    public_items = tuple([*info_items, *event_items])
-    intro = _safe_required_text(snapshot.intro_text, "intro text")
-    outro = _safe_optional_text(snapshot.guild.closing_message)
-    messages = plan_discord_messages(
-        guild_id=snapshot.guild.guild_id,
+    return PublicationSelection(
+        guild=snapshot.guild,
         slot_key=slot.key,
+        scheduled_for=slot.instant,
+        scheduled_local=slot.local_datetime,
+        window_starts_at=window.starts_at,
+        window_ends_at=window.ends_at,
+        outro_text=_safe_optional_text(snapshot.guild.closing_message),
+        editor_events=tuple(editor_events),
+        public_items=tuple([*info_items, *event_items]),
+        warnings=tuple(sorted(warnings, key=lambda warning: (warning.code, warning.source_id))),
+        seen_reaction_emoji=snapshot.seen_reaction_emoji,
+    )
+
+
+def render_publication(selection: PublicationSelection, *, intro_text: str) -> PublicationDraft:
+    """Substitute the intro and plan Discord messages for an already selected slot."""
+
+    intro = _safe_required_text(intro_text, "intro text")
+    messages = plan_discord_messages(
+        guild_id=selection.guild.guild_id,
+        slot_key=selection.slot_key,
         intro_text=intro,
-        outro_text=outro,
+        outro_text=selection.outro_text,
         # Product invariant: every publication addresses @everyone exactly once.
         # The persisted flag remains for backwards-compatible configuration reads,
         # but cannot weaken the canonical message plan.
         everyone_enabled=True,
-        items=public_items,
-        palette_month=slot.local_datetime.month,
-        seen_reaction_emoji=snapshot.seen_reaction_emoji,
+        items=selection.public_items,
+        palette_month=selection.scheduled_local.month,
+        seen_reaction_emoji=selection.seen_reaction_emoji,
     )
     return PublicationDraft(
         composer_version=COMPOSER_VERSION,
-        guild_id=snapshot.guild.guild_id,
-        slot_key=slot.key,
-        scheduled_for=slot.instant,
-        scheduled_local=slot.local_datetime,
-        timezone=snapshot.guild.timezone,
-        window_starts_at=window.starts_at,
-        window_ends_at=window.ends_at,
+        guild_id=selection.guild.guild_id,
+        slot_key=selection.slot_key,
+        scheduled_for=selection.scheduled_for,
+        scheduled_local=selection.scheduled_local,
+        timezone=selection.guild.timezone,
+        window_starts_at=selection.window_starts_at,
+        window_ends_at=selection.window_ends_at,
         intro_text=intro,
-        outro_text=outro,
-        editor_events=tuple(editor_events),
-        public_items=public_items,
-        warnings=tuple(sorted(warnings, key=lambda warning: (warning.code, warning.source_id))),
+        outro_text=selection.outro_text,
+        editor_events=selection.editor_events,
+        public_items=selection.public_items,
+        warnings=selection.warnings,
         messages=messages,
     )
 
 
+def next_guild_slot(
+    guild: GuildConfigRecord,
+    reference_time: datetime,
+    completed_slot_keys: frozenset[str],
+) -> PublicationSlot:
+    schedule = PublicationSchedule(
+        weekday=guild.publication_weekday,
+        local_time=guild.publication_time,
+        timezone_name=guild.timezone,
+    )
+    return next_unprocessed_slot(
+        schedule,
+        GuildId(guild.guild_id),
+        require_aware(reference_time, "reference_time"),
+        completed_slot_keys,
+    )
+
+
 def next_unprocessed_slot(
     schedule: PublicationSchedule,
     guild_id: GuildId,
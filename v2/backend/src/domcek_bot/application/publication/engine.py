@@ -10,8 +10,8 @@ from datetime import UTC, datetime, timedelta
 from typing import Protocol
 
 from domcek_bot.application.audit import AuditWriter
-from domcek_bot.application.publication.composer import compose_publication
-from domcek_bot.application.publication.intro import FALLBACK_TEXT, IntroResult, IntroService
+from domcek_bot.application.publication.composer import render_publication
+from domcek_bot.application.publication.intro import IntroResult, IntroService
 from domcek_bot.application.publication.models import (
     DiscordEmbedPlan,
     PublicationDraft,
@@ -124,6 +124,13 @@ class PublicationResult:
     warning_codes: tuple[str, ...] = ()
 
 
+@dataclass(frozen=True, slots=True)
+class _SentMessage:
+    message_id: uuid.UUID
+    discord_message_id: int
+    sent_at: datetime
+
+
 @dataclass(frozen=True, slots=True)
 class PublicationGuardResult:
     run_id: uuid.UUID
@@ -164,23 +171,18 @@ class PublicationEngine:
         expected_draft_sha256: str | None = None,
         intro_override: IntroResult | None = None,
     ) -> PreparedPublication:
-        base_snapshot = await self._draft_service.load_next_snapshot(
-            guild_id,
-            reference_time=reference_time,
-            intro_text=FALLBACK_TEXT,
-        )
-        provisional = compose_publication(base_snapshot)
-        if expected_slot_key is not None and provisional.slot_key != expected_slot_key:
+        selection = await self._draft_service.select_next(guild_id, reference_time=reference_time)
+        if expected_slot_key is not None and selection.slot_key != expected_slot_key:
             raise PublicationSlotChanged("publication slot changed")
         intro = intro_override or await self._intro_service.create(
-            enabled=base_snapshot.guild.generated_intro_enabled,
-            scheduled_local=provisional.scheduled_local,
-            event_titles=tuple(item.title for item in provisional.public_items),
+            enabled=selection.guild.generated_intro_enabled,
+            scheduled_local=selection.scheduled_local,
+            event_titles=tuple(item.title for item in selection.public_items),
         )
-        draft = compose_publication(replace(base_snapshot, intro_text=intro.text))
+        draft = render_publication(selection, intro_text=intro.text)
         if expected_draft_sha256 is not None and _draft_sha256(draft) != expected_draft_sha256:
             raise PublicationSlotChanged("publication draft changed")
-        channel_id = base_snapshot.guild.announcement_channel_id
+        channel_id = selection.guild.announcement_channel_id
         if channel_id is None:
             raise PublicationChannelMissing("announcement channel is not configured")
 
@@ -225,19 +227,14 @@ class PublicationEngine:
         return PreparedPublication(run, True, len(messages), len(items))
 
     async def preview(self, guild_id: int, *, reference_time: datetime) -> PublicationPreview:
-        snapshot = await self._draft_service.load_next_snapshot(
-            guild_id,
-            reference_time=reference_time,
-            intro_text=FALLBACK_TEXT,
-        )
-        provisional = compose_publication(snapshot)
+        selection = await self._draft_service.select_next(guild_id, reference_time=reference_time)
         intro = await self._intro_service.create(
-            enabled=snapshot.guild.generated_intro_enabled,
-            scheduled_local=provisional.scheduled_local,
-            event_titles=tuple(item.title for item in provisional.public_items),
+            enabled=selection.guild.generated_intro_enabled,
+            scheduled_local=selection.scheduled_local,
+            event_titles=tuple(item.title for item in selection.public_items),
         )
-        draft = compose_publication(replace(snapshot, intro_text=intro.text))
-        return PublicationPreview(draft, intro, snapshot.guild.announcement_channel_id)
+        draft = render_publication(selection, intro_text=intro.text)
+        return PublicationPreview(draft, intro, selection.guild.announcement_channel_id)
 
     async def publish(
         self,
@@ -296,25 +293,37 @@ class PublicationEngine:
 
         sent_ids: list[int] = []
         warnings = list(run.warning_codes)
+        # A confirmed send is recorded together with the next message's claim,
+        # so consecutive Discord posts are separated by a single transaction.
+        unrecorded: _SentMessage | None = None
         for initial_message in messages:
-            message = await self._reload_message(run.id, initial_message.id)
-            if message.discord_message_id is not None:
-                sent_ids.append(message.discord_message_id)
+            if initial_message.discord_message_id is not None:
+                sent_ids.append(initial_message.discord_message_id)
                 continue
-            if message.state is PublicationMessageState.SENDING:
-                summary = "Výsledok predchádzajúceho odoslania nie je možné bezpečne určiť."
-                await self._mark_uncertain(
-                    run, message, correlation_id, summary, guild.moderator_channel_id
-                )
-                return PublicationResult(
-                    run.id, PublicationState.PARTIALLY_PUBLISHED, tuple(sent_ids), tuple(warnings)
-                )
-            if message.state is PublicationMessageState.UNCERTAIN:
-                return PublicationResult(
-                    run.id, PublicationState.PARTIALLY_PUBLISHED, tuple(sent_ids), tuple(warnings)
-                )
-            claimed = await self._claim(message.id)
+            message, claimed = await self._record_and_claim(run.id, unrecorded, initial_message.id)
+            unrecorded = None
             if not claimed:
+                if message.discord_message_id is not None:
+                    sent_ids.append(message.discord_message_id)
+                    continue
+                if message.state is PublicationMessageState.SENDING:
+                    summary = "Výsledok predchádzajúceho odoslania nie je možné bezpečne určiť."
+                    await self._mark_uncertain(
+                        run, message, correlation_id, summary, guild.moderator_channel_id
+                    )
+                    return PublicationResult(
+                        run.id,
+                        PublicationState.PARTIALLY_PUBLISHED,
+                        tuple(sent_ids),
+                        tuple(warnings),
+                    )
+                if message.state is PublicationMessageState.UNCERTAIN:
+                    return PublicationResult(
+                        run.id,
+                        PublicationState.PARTIALLY_PUBLISHED,
+                        tuple(sent_ids),
+                        tuple(warnings),
+                    )
                 raise PublicationAlreadyRunning("publication message is already being delivered")
             try:
                 discord_message_id = await self._send_with_retry(
@@ -385,35 +394,22 @@ class PublicationEngine:
                     tuple(sent_ids),
                     tuple(warnings),
                 )
-            async with self._unit_of_work.transaction() as repositories:
-                await repositories.publication_runs.mark_message_sent(
-                    message.id,
-                    discord_message_id=discord_message_id,
-                    sent_at=datetime.now(UTC),
-                )
+            unrecorded = _SentMessage(message.id, discord_message_id, datetime.now(UTC))
             sent_ids.append(discord_message_id)
 
         seen_target = next((message for message in reversed(messages) if message.seen_target), None)
-        seen_emoji = seen_target.reaction_emoji if seen_target is not None else None
-        if seen_target is not None and sent_ids and seen_emoji is not None:
-            try:
-                target_id = next(
-                    message_id
-                    for message, message_id in zip(messages, sent_ids, strict=True)
-                    if message.id == seen_target.id
-                )
-                await self._discord.add_reaction(
-                    channel_id=seen_target.discord_channel_id,
-                    message_id=target_id,
-                    emoji=seen_emoji,
-                )
-            except Exception as exc:
-                warning = "seen_reaction_failed"
-                warnings.append(warning)
-                async with self._unit_of_work.transaction() as repositories:
-                    await repositories.publication_runs.mark_reaction_warning(
-                        seen_target.id, detail=_safe_error(exc)
-                    )
+        reaction_error: str | None = None
+        if unrecorded is not None:
+            # Ordering no longer constrains the last send's record, so it is
+            # written while the seen reaction travels to Discord.
+            _, reaction_error = await asyncio.gather(
+                self._record_sent(unrecorded),
+                self._add_seen_reaction(seen_target, messages, sent_ids),
+            )
+        else:
+            reaction_error = await self._add_seen_reaction(seen_target, messages, sent_ids)
+        if reaction_error is not None:
+            warnings.append("seen_reaction_failed")
 
         completed_state = (
             PublicationState.SUCCEEDED_MANUAL
@@ -422,6 +418,10 @@ class PublicationEngine:
         )
         completed_at = datetime.now(UTC)
         async with self._unit_of_work.transaction() as repositories:
+            if seen_target is not None and reaction_error is not None:
+                await repositories.publication_runs.mark_reaction_warning(
+                    seen_target.id, detail=reaction_error
+                )
             await repositories.publication_runs.set_state(
                 run.id,
                 completed_state,
@@ -484,6 +484,7 @@ class PublicationEngine:
                         "grace_seconds": grace_seconds,
                     },
                 )
+                await repositories.worker_wakeups.notify("publication_guard")
                 return PublicationGuardResult(
                     run.id, PublicationState.WAITING_FOR_RELEASE, release_at
                 )
@@ -610,19 +611,60 @@ class PublicationEngine:
             for run in runs
         ]
 
-    async def _reload_message(
-        self, run_id: uuid.UUID, message_id: uuid.UUID
-    ) -> PublicationMessageRecord:
+    async def _record_and_claim(
+        self,
+        run_id: uuid.UUID,
+        sent: _SentMessage | None,
+        message_id: uuid.UUID,
+    ) -> tuple[PublicationMessageRecord, bool]:
         async with self._unit_of_work.transaction() as repositories:
+            if sent is not None:
+                await repositories.publication_runs.mark_message_sent(
+                    sent.message_id,
+                    discord_message_id=sent.discord_message_id,
+                    sent_at=sent.sent_at,
+                )
+            claimed = await repositories.publication_runs.claim_message(
+                message_id, attempted_at=datetime.now(UTC)
+            )
+            if claimed is not None:
+                return claimed, True
             messages = await repositories.publication_runs.list_messages(run_id)
-        return next(message for message in messages if message.id == message_id)
+        return next(message for message in messages if message.id == message_id), False
 
-    async def _claim(self, message_id: uuid.UUID) -> bool:
+    async def _record_sent(self, sent: _SentMessage) -> None:
         async with self._unit_of_work.transaction() as repositories:
-            return await repositories.publication_runs.claim_message(
-                message_id, attempted_at=datetime.now(UTC)
+            await repositories.publication_runs.mark_message_sent(
+                sent.message_id,
+                discord_message_id=sent.discord_message_id,
+                sent_at=sent.sent_at,
             )
 
+    async def _add_seen_reaction(
+        self,
+        seen_target: PublicationMessageRecord | None,
+        messages: list[PublicationMessageRecord],
+        sent_ids: list[int],
+    ) -> str | None:
+        """Add the seen reaction and return a safe error detail when it fails."""
+
+        if seen_target is None or not sent_ids or seen_target.reaction_emoji is None:
+            return None
+        try:
+            target_id = next(
+                message_id
+                for message, message_id in zip(messages, sent_ids, strict=True)
+                if message.id == seen_target.id
+            )
+            await self._discord.add_reaction(
+                channel_id=seen_target.discord_channel_id,
+                message_id=target_id,
+                emoji=seen_target.reaction_emoji,
+            )
+        except Exception as exc:
+            return _safe_error(exc)
+        return None
+
     async def _send_with_retry(
         self,
         run: PublicationRunRecord,
@@ -631,15 +673,16 @@ class PublicationEngine:
         correlation_id: str,
     ) -> int:
         for attempt in range(1, self._max_safe_retries + 1):
-            if attempt > 1:
-                async with self._unit_of_work.transaction() as repositories:
-                    await repositories.publication_runs.increment_message_attempt(
-                        message.id, attempted_at=datetime.now(UTC)
-                    )
             try:
                 return await self._discord.send_message(message)
             except DiscordTransientError as exc:
+                delay = max(0.0, exc.retry_after)
                 async with self._unit_of_work.transaction() as repositories:
+                    if attempt < self._max_safe_retries:
+                        await repositories.publication_runs.increment_message_attempt(
+                            message.id,
+                            attempted_at=datetime.now(UTC) + timedelta(seconds=delay),
+                        )
                     await AuditWriter(repositories.audit_logs).failure(
                         guild_id=run.guild_id,
                         actor_user_id=run.initiated_by_user_id,
@@ -655,7 +698,7 @@ class PublicationEngine:
                     )
                 if attempt == self._max_safe_retries:
                     raise
-                await asyncio.sleep(max(0.0, exc.retry_after))
+                await asyncio.sleep(delay)
         raise AssertionError("retry loop exhausted")
 
     async def _mark_uncertain(
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import uuid
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Protocol
 
@@ -14,7 +16,7 @@ from domcek_bot.application.publication.engine import (
     PublicationGuardResult,
     PublicationResult,
 )
-from domcek_bot.application.records import PublicationGuardNoticeRecord
+from domcek_bot.application.records import PublicationGuardNoticeRecord, PublicationRunRecord
 from domcek_bot.application.unit_of_work import UnitOfWork
 from domcek_bot.domain.enums import PublicationState
 
@@ -34,18 +36,36 @@ class PublicationGuardDiscordGateway(Protocol):
     async def delete_guard_dm(self, *, channel_id: int, message_id: int) -> None: ...
 
 
+@dataclass(frozen=True, slots=True)
+class _NoticeDelivery:
+    notice: PublicationGuardNoticeRecord
+    message: tuple[int, int] | None
+    error_type: str | None = None
+
+
 class PublicationGuardService:
+    """Fan guard DMs out concurrently, recording each outcome as soon as it is known.
+
+    A stop or release can clean up while the fan-out is still running, so every
+    delivered DM must already be visible as ``sent`` to that cleanup.
+    """
+
     def __init__(
         self,
         unit_of_work: UnitOfWork,
         engine: PublicationEngine,
         discord: PublicationGuardDiscordGateway,
         alerts: ModeratorAlertGateway,
+        *,
+        max_concurrency: int = 5,
     ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("guard DM concurrency must be positive")
         self._unit_of_work = unit_of_work
         self._engine = engine
         self._discord = discord
         self._alerts = alerts
+        self._max_concurrency = max_concurrency
 
     async def notify(self, run_id: uuid.UUID, *, correlation_id: str) -> int:
         async with self._unit_of_work.transaction() as repositories:
@@ -75,43 +95,38 @@ class PublicationGuardService:
         if notices:
             async with self._unit_of_work.transaction() as repositories:
                 await repositories.publication_runs.add_guard_notices(notices)
-        sent = 0
-        for notice in (*existing, *notices):
-            if notice.state in {"sent", "deleted"}:
-                continue
-            try:
-                channel_id, message_id = await self._discord.send_guard_dm(
-                    recipient_user_id=notice.recipient_user_id,
-                    run_id=run.id,
-                    release_at=run.release_at,
-                    nonce=notice.nonce,
-                )
-            except Exception as exc:
-                async with self._unit_of_work.transaction() as repositories:
-                    await repositories.publication_runs.mark_guard_notice_failed(
-                        notice.id, detail=type(exc).__name__
-                    )
-                await self._alerts.send_alert(
-                    guild_id=run.guild_id,
-                    moderator_channel_id=config.moderator_channel_id,
-                    title="Ochranná správa sa nedoručila",
-                    summary=(
-                        "Publikovanie pokračuje podľa plánu, ale jeden z oprávnených "
-                        "príjemcov nedostal dočasnú súkromnú správu."
-                    ),
-                    correlation_id=correlation_id,
-                    run_id=run.id,
-                )
-                continue
-            async with self._unit_of_work.transaction() as repositories:
-                await repositories.publication_runs.mark_guard_notice_sent(
-                    notice.id,
-                    channel_id=channel_id,
-                    message_id=message_id,
-                    sent_at=datetime.now(UTC),
-                )
-            sent += 1
-        return sent
+        pending = [
+            notice for notice in (*existing, *notices) if notice.state not in {"sent", "deleted"}
+        ]
+        limit = asyncio.Semaphore(self._max_concurrency)
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(self._send_notice(run, run.release_at, notice, limit))
+                for notice in pending
+            ]
+        deliveries = [task.result() for task in tasks]
+        if not deliveries:
+            return 0
+        async with self._unit_of_work.transaction() as repositories:
+            current = await repositories.publication_runs.get(run.id)
+        if current is None or current.state is not PublicationState.WAITING_FOR_RELEASE:
+            # The run was stopped or released mid fan-out; that cleanup could
+            # not see DMs recorded after it, so delete them now.
+            await self.cleanup(run.id)
+        failed = sum(delivery.message is None for delivery in deliveries)
+        if failed:
+            await self._alerts.send_alert(
+                guild_id=run.guild_id,
+                moderator_channel_id=config.moderator_channel_id,
+                title="Ochranná správa sa nedoručila",
+                summary=(
+                    "Publikovanie pokračuje podľa plánu, ale dočasná súkromná správa sa "
+                    f"nedoručila {failed} z {len(deliveries)} oprávnených príjemcov."
+                ),
+                correlation_id=correlation_id,
+                run_id=run.id,
+            )
+        return len(deliveries) - failed
 
     async def stop_for_user(
         self,
@@ -147,23 +162,24 @@ class PublicationGuardService:
     async def cleanup(self, run_id: uuid.UUID) -> None:
         async with self._unit_of_work.transaction() as repositories:
             notices = await repositories.publication_runs.list_guard_notices(run_id)
-        for notice in notices:
-            if (
-                notice.state != "sent"
-                or notice.discord_channel_id is None
-                or notice.discord_message_id is None
-            ):
-                continue
-            try:
-                await self._discord.delete_guard_dm(
-                    channel_id=notice.discord_channel_id,
-                    message_id=notice.discord_message_id,
-                )
-            except Exception:  # noqa: S112 - cleanup cannot change the terminal decision
-                continue
-            async with self._unit_of_work.transaction() as repositories:
+        delivered = [
+            notice
+            for notice in notices
+            if notice.state == "sent"
+            and notice.discord_channel_id is not None
+            and notice.discord_message_id is not None
+        ]
+        limit = asyncio.Semaphore(self._max_concurrency)
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(self._delete_notice(notice, limit)) for notice in delivered]
+        deleted = [notice for notice, task in zip(delivered, tasks, strict=True) if task.result()]
+        if not deleted:
+            return
+        deleted_at = datetime.now(UTC)
+        async with self._unit_of_work.transaction() as repositories:
+            for notice in deleted:
                 await repositories.publication_runs.mark_guard_notice_deleted(
-                    notice.id, deleted_at=datetime.now(UTC)
+                    notice.id, deleted_at=deleted_at
                 )
 
     async def release_due(
@@ -174,3 +190,52 @@ class PublicationGuardService:
             if result.state is not PublicationState.WAITING_FOR_RELEASE:
                 await self.cleanup(result.run_id)
         return results
+
+    async def _send_notice(
+        self,
+        run: PublicationRunRecord,
+        release_at: datetime,
+        notice: PublicationGuardNoticeRecord,
+        limit: asyncio.Semaphore,
+    ) -> _NoticeDelivery:
+        async with limit:
+            try:
+                message = await self._discord.send_guard_dm(
+                    recipient_user_id=notice.recipient_user_id,
+                    run_id=run.id,
+                    release_at=release_at,
+                    nonce=notice.nonce,
+                )
+            except Exception as exc:
+                delivery = _NoticeDelivery(notice, None, type(exc).__name__)
+            else:
+                delivery = _NoticeDelivery(notice, message)
+        async with self._unit_of_work.transaction() as repositories:
+            if delivery.message is None:
+                await repositories.publication_runs.mark_guard_notice_failed(
+                    notice.id, detail=delivery.error_type or "Exception"
+                )
+            else:
+                channel_id, message_id = delivery.message
+                await repositories.publication_runs.mark_guard_notice_sent(
+                    notice.id,
+                    channel_id=channel_id,
+                    message_id=message_id,
+                    sent_at=datetime.now(UTC),
+                )
+        return delivery
+
+    async def _delete_notice(
+        self, notice: PublicationGuardNoticeRecord, limit: asyncio.Semaphore
+    ) -> bool:
+        if notice.discord_channel_id is None or notice.discord_message_id is None:
+            return False
+        async with limit:
+            try:
+                await self._discord.delete_guard_dm(
+                    channel_id=notice.discord_channel_id,
+                    message_id=notice.discord_message_id,
+                )
+            except Exception:  # cleanup cannot change the terminal decision
+                return False
+        return True
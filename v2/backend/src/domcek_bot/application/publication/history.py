@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
 import uuid
+from collections import defaultdict
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
@@ -24,6 +27,40 @@ class PublicationHistoryEntry:
     messages: tuple[PublicationMessageRecord, ...]
 
 
+class InvalidHistoryCursor(ValueError):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class PublicationHistoryCursor:
+    """Position after the last run of a page, newest runs first."""
+
+    scheduled_for: datetime
+    run_id: uuid.UUID
+
+    def encode(self) -> str:
+        value = f"{self.scheduled_for.isoformat()}|{self.run_id}".encode()
+        return base64.urlsafe_b64encode(value).rstrip(b"=").decode()
+
+    @classmethod
+    def decode(cls, token: str) -> PublicationHistoryCursor:
+        try:
+            value = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+            scheduled_for, run_id = value.split("|")
+            cursor = cls(datetime.fromisoformat(scheduled_for), uuid.UUID(run_id))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+            raise InvalidHistoryCursor("publication history cursor is malformed") from exc
+        if cursor.scheduled_for.utcoffset() is None:
+            raise InvalidHistoryCursor("publication history cursor is malformed")
+        return cursor
+
+
+@dataclass(frozen=True, slots=True)
+class PublicationHistoryPage:
+    entries: tuple[PublicationHistoryEntry, ...]
+    next_cursor: PublicationHistoryCursor | None
+
+
 @dataclass(frozen=True, slots=True)
 class DashboardSummary:
     automatic_publication_enabled: bool
@@ -59,20 +96,45 @@ class PublicationHistoryService:
         self._clock = clock or (lambda: datetime.now(UTC))
 
     async def list(
-        self, principal: Principal, *, limit: int = 50
-    ) -> tuple[PublicationHistoryEntry, ...]:
+        self,
+        principal: Principal,
+        *,
+        limit: int = 50,
+        before: PublicationHistoryCursor | None = None,
+        include_details: bool = True,
+    ) -> PublicationHistoryPage:
+        """Return one page of runs with their items and messages.
+
+        Items and messages of the whole page are read with one query each.
+        Without ``include_details`` the entries carry only the runs.
+        """
+
         principal.require(Capability.VIEW_ADMIN)
         safe_limit = min(max(limit, 1), 100)
+        items: defaultdict[uuid.UUID, list[PublicationItemRecord]] = defaultdict(list)
+        messages: defaultdict[uuid.UUID, list[PublicationMessageRecord]] = defaultdict(list)
         async with self._unit_of_work.transaction() as repositories:
             runs = await repositories.publication_runs.list_for_guild(
-                principal.guild_id, limit=safe_limit
+                principal.guild_id,
+                limit=safe_limit + 1,
+                before=None if before is None else (before.scheduled_for, before.run_id),
             )
-            entries: list[PublicationHistoryEntry] = []
-            for run in runs:
-                items = await repositories.publication_runs.list_items(run.id)
-                messages = await repositories.publication_runs.list_messages(run.id)
-                entries.append(PublicationHistoryEntry(run, tuple(items), tuple(messages)))
-        return tuple(entries)
+            page = runs[:safe_limit]
+            if include_details and page:
+                run_ids = tuple(run.id for run in page)
+                for item in await repositories.publication_runs.list_items_for_runs(run_ids):
+                    items[item.publication_run_id].append(item)
+                for message in await repositories.publication_runs.list_messages_for_runs(run_ids):
+                    messages[message.publication_run_id].append(message)
+        entries = tuple(
+            PublicationHistoryEntry(run, tuple(items[run.id]), tuple(messages[run.id]))
+            for run in page
+        )
+        last = page[-1] if len(runs) > safe_limit else None
+        return PublicationHistoryPage(
+            entries,
+            None if last is None else PublicationHistoryCursor(last.scheduled_for, last.id),
+        )
 
     async def get(self, run_id: uuid.UUID, principal: Principal) -> PublicationHistoryEntry | None:
         principal.require(Capability.VIEW_ADMIN)
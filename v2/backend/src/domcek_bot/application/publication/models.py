@@ -150,6 +150,23 @@ class PublicationDraftItem:
     series_public_description: str | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class PublicationSelection:
+    """Everything in a draft that does not depend on the intro text."""
+
+    guild: GuildConfigRecord
+    slot_key: str
+    scheduled_for: datetime
+    scheduled_local: datetime
+    window_starts_at: datetime
+    window_ends_at: datetime
+    outro_text: str | None
+    editor_events: tuple[PublicationDraftItem, ...]
+    public_items: tuple[PublicationDraftItem, ...]
+    warnings: tuple[DraftWarning, ...]
+    seen_reaction_emoji: str | None
+
+
 @dataclass(frozen=True, slots=True)
 class DiscordEmbedPlan:
     item_kind: DraftItemKind
@@ -2,22 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
 import uuid
+from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Protocol
 
+import structlog
+
 from domcek_bot.application.audit import AuditWriter
 from domcek_bot.application.publication.engine import (
     ModeratorAlertGateway,
     PublicationAlreadyRunning,
     PublicationEngine,
 )
+from domcek_bot.application.records import GuildConfigRecord
 from domcek_bot.application.unit_of_work import UnitOfWork
 from domcek_bot.domain.enums import PublicationMode, PublicationState
 from domcek_bot.domain.ids import GuildId
 from domcek_bot.domain.time import PublicationSchedule, PublicationSlot
 
+logger = structlog.get_logger(__name__)
+
 
 @dataclass(frozen=True, slots=True)
 class SchedulerDecision:
@@ -32,6 +39,15 @@ class FinalCalendarSynchronizer(Protocol):
 
 
 class PublicationScheduler:
+    """Decide and start each guild's due publication work.
+
+    Guilds are checked concurrently up to ``max_concurrency``. Each guild's
+    final calendar sync and snapshot preparation run under its own timeout,
+    and a failure or timeout becomes that guild's decision instead of
+    delaying or aborting the others. Decisions are
+    returned in ``list_all`` order whatever order the guilds finish in.
+    """
+
     def __init__(
         self,
         unit_of_work: UnitOfWork,
@@ -43,7 +59,11 @@ class PublicationScheduler:
         final_calendar_sync: FinalCalendarSynchronizer,
         reminder_alerts: ModeratorAlertGateway | None = None,
         reminder_lead: timedelta = timedelta(hours=24),
+        max_concurrency: int = 4,
+        guild_timeout: timedelta = timedelta(minutes=10),
     ) -> None:
+        if max_concurrency < 1 or guild_timeout <= timedelta(0):
+            raise ValueError("scheduler concurrency and guild timeout must be positive")
         self._unit_of_work = unit_of_work
         self._engine = engine
         self._alerts = alerts
@@ -52,6 +72,8 @@ class PublicationScheduler:
         self._final_calendar_sync = final_calendar_sync
         self._reminder_alerts = reminder_alerts
         self._reminder_lead = reminder_lead
+        self._guild_limit = asyncio.Semaphore(max_concurrency)
+        self._guild_timeout = guild_timeout
 
     async def send_upcoming_reminders(
         self, *, now: datetime | None = None, correlation_id: str | None = None
@@ -61,38 +83,10 @@ class PublicationScheduler:
         correlation = correlation_id or str(uuid.uuid4())
         async with self._unit_of_work.transaction() as repositories:
             guilds = await repositories.guild_configs.list_all()
-        decisions: list[SchedulerDecision] = []
-        for guild in guilds:
-            if (
-                self._reminder_alerts is None
-                or not guild.automatic_publication_enabled
-                or not guild.alert_publication_reminder_enabled
-                or guild.moderator_channel_id is None
-            ):
-                decisions.append(SchedulerDecision(guild.guild_id, None, "reminder_disabled"))
-                continue
-            schedule = PublicationSchedule(
-                guild.publication_weekday, guild.publication_time, guild.timezone
-            )
-            slot = schedule.next_slot(GuildId(guild.guild_id), checked_at, inclusive=True)
-            time_until_slot = slot.instant - checked_at
-            if not timedelta(0) < time_until_slot <= self._reminder_lead:
-                decisions.append(SchedulerDecision(guild.guild_id, slot.key, "reminder_not_due"))
-                continue
-            sent = await self._send_reminder_once(
-                guild.guild_id,
-                guild.moderator_channel_id,
-                slot,
-                correlation,
-            )
-            decisions.append(
-                SchedulerDecision(
-                    guild.guild_id,
-                    slot.key,
-                    "reminder_sent" if sent else "reminder_already_sent",
-                )
-            )
-        return decisions
+        return await self._for_each_guild(
+            guilds,
+            lambda guild: self._remind_guild(guild, checked_at, correlation),
+        )
 
     async def run_due(
         self, *, now: datetime | None = None, correlation_id: str | None = None
@@ -101,141 +95,188 @@ class PublicationScheduler:
         correlation = correlation_id or str(uuid.uuid4())
         async with self._unit_of_work.transaction() as repositories:
             guilds = await repositories.guild_configs.list_all()
-        decisions: list[SchedulerDecision] = []
-        for guild in guilds:
-            if not guild.automatic_publication_enabled:
-                decisions.append(SchedulerDecision(guild.guild_id, None, "automatic_disabled"))
-                continue
-            schedule = PublicationSchedule(
-                guild.publication_weekday, guild.publication_time, guild.timezone
-            )
-            slot = _latest_due_slot(schedule, GuildId(guild.guild_id), checked_at)
-            if slot is None:
-                decisions.append(SchedulerDecision(guild.guild_id, None, "not_due"))
-                continue
-            async with self._unit_of_work.transaction() as repositories:
-                existing = await repositories.publication_runs.get_for_slot(
-                    guild.guild_id, slot.key
-                )
-            if existing is not None:
-                if existing.state in {
-                    PublicationState.PREPARING,
-                    PublicationState.RETRY_PENDING,
-                }:
-                    try:
-                        resumed = await self._engine.publish(
-                            existing.id, correlation_id=correlation
-                        )
-                    except PublicationAlreadyRunning:
-                        decisions.append(
-                            SchedulerDecision(
-                                guild.guild_id,
-                                slot.key,
-                                "publication_in_progress",
-                                existing.id,
-                            )
-                        )
-                        continue
-                    decisions.append(
-                        SchedulerDecision(
-                            guild.guild_id, slot.key, resumed.state.value, resumed.run_id
-                        )
-                    )
-                    continue
-                if existing.state is PublicationState.WAITING_FOR_RELEASE:
-                    released = await self._engine.release_guard(
+        return await self._for_each_guild(
+            guilds, lambda guild: self._run_due_guild(guild, checked_at, correlation)
+        )
+
+    async def _for_each_guild(
+        self,
+        guilds: Sequence[GuildConfigRecord],
+        check: Callable[[GuildConfigRecord], Awaitable[SchedulerDecision]],
+    ) -> list[SchedulerDecision]:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(self._check_guild(guild, check)) for guild in guilds]
+        return [task.result() for task in tasks]
+
+    async def _check_guild(
+        self,
+        guild: GuildConfigRecord,
+        check: Callable[[GuildConfigRecord], Awaitable[SchedulerDecision]],
+    ) -> SchedulerDecision:
+        async with self._guild_limit:
+            try:
+                return await check(guild)
+            except TimeoutError:
+                action = "guild_timed_out"
+                error_type = "TimeoutError"
+            except Exception as exc:
+                action = "guild_failed"
+                error_type = type(exc).__name__
+        await logger.aerror(
+            "publication_scheduler_guild_failed",
+            guild_id=guild.guild_id,
+            action=action,
+            error_type=error_type,
+        )
+        return SchedulerDecision(guild.guild_id, None, action)
+
+    async def _remind_guild(
+        self, guild: GuildConfigRecord, checked_at: datetime, correlation: str
+    ) -> SchedulerDecision:
+        if (
+            self._reminder_alerts is None
+            or not guild.automatic_publication_enabled
+            or not guild.alert_publication_reminder_enabled
+            or guild.moderator_channel_id is None
+        ):
+            return SchedulerDecision(guild.guild_id, None, "reminder_disabled")
+        schedule = PublicationSchedule(
+            guild.publication_weekday, guild.publication_time, guild.timezone
+        )
+        slot = schedule.next_slot(GuildId(guild.guild_id), checked_at, inclusive=True)
+        time_until_slot = slot.instant - checked_at
+        if not timedelta(0) < time_until_slot <= self._reminder_lead:
+            return SchedulerDecision(guild.guild_id, slot.key, "reminder_not_due")
+        sent = await self._send_reminder_once(
+            guild.guild_id,
+            guild.moderator_channel_id,
+            slot,
+            correlation,
+        )
+        return SchedulerDecision(
+            guild.guild_id,
+            slot.key,
+            "reminder_sent" if sent else "reminder_already_sent",
+        )
+
+    async def _run_due_guild(
+        self, guild: GuildConfigRecord, checked_at: datetime, correlation: str
+    ) -> SchedulerDecision:
+        if not guild.automatic_publication_enabled:
+            return SchedulerDecision(guild.guild_id, None, "automatic_disabled")
+        schedule = PublicationSchedule(
+            guild.publication_weekday, guild.publication_time, guild.timezone
+        )
+        slot = _latest_due_slot(schedule, GuildId(guild.guild_id), checked_at)
+        if slot is None:
+            return SchedulerDecision(guild.guild_id, None, "not_due")
+        async with self._unit_of_work.transaction() as repositories:
+            existing = await repositories.publication_runs.get_for_slot(guild.guild_id, slot.key)
+        if existing is not None:
+            if existing.state in {
+                PublicationState.PREPARING,
+                PublicationState.RETRY_PENDING,
+            }:
+                try:
+                    resumed = await self._engine.publish(existing.id, correlation_id=correlation)
+                except PublicationAlreadyRunning:
+                    return SchedulerDecision(
+                        guild.guild_id,
+                        slot.key,
+                        "publication_in_progress",
                         existing.id,
-                        correlation_id=correlation,
-                        now=checked_at,
                     )
-                    decisions.append(
-                        SchedulerDecision(
-                            guild.guild_id,
-                            slot.key,
-                            released.state.value,
-                            released.run_id,
-                        )
-                    )
-                    continue
-                if existing.state is PublicationState.SUCCEEDED_MANUAL:
-                    action = "skipped_after_manual"
-                elif existing.state is PublicationState.PUBLISHING:
-                    action = "publication_in_progress"
-                elif existing.state is PublicationState.FAILED:
-                    action = "publication_failed_requires_admin"
-                else:
-                    action = "already_materialized"
-                decisions.append(SchedulerDecision(guild.guild_id, slot.key, action, existing.id))
-                continue
-            if checked_at - slot.instant > self._grace_period:
-                newly_recorded = await self._audit_skip(
-                    guild.guild_id, slot, "missed_slot_outside_grace", correlation
+                return SchedulerDecision(
+                    guild.guild_id, slot.key, resumed.state.value, resumed.run_id
                 )
-                if newly_recorded:
-                    await self._alerts.send_alert(
-                        guild_id=guild.guild_id,
-                        moderator_channel_id=guild.moderator_channel_id,
-                        title="Carlo nepublikoval starý zmeškaný termín",
-                        summary="Termín je mimo bezpečnej doby automatického dobehnutia.",
-                        correlation_id=correlation,
-                        run_id=None,
-                    )
-                decisions.append(SchedulerDecision(guild.guild_id, slot.key, "outside_grace"))
-                continue
+            if existing.state is PublicationState.WAITING_FOR_RELEASE:
+                released = await self._engine.release_guard(
+                    existing.id,
+                    correlation_id=correlation,
+                    now=checked_at,
+                )
+                return SchedulerDecision(
+                    guild.guild_id,
+                    slot.key,
+                    released.state.value,
+                    released.run_id,
+                )
+            if existing.state is PublicationState.SUCCEEDED_MANUAL:
+                action = "skipped_after_manual"
+            elif existing.state is PublicationState.PUBLISHING:
+                action = "publication_in_progress"
+            elif existing.state is PublicationState.FAILED:
+                action = "publication_failed_requires_admin"
+            else:
+                action = "already_materialized"
+            return SchedulerDecision(guild.guild_id, slot.key, action, existing.id)
+        if checked_at - slot.instant > self._grace_period:
+            newly_recorded = await self._audit_skip(
+                guild.guild_id, slot, "missed_slot_outside_grace", correlation
+            )
+            if newly_recorded:
+                await self._alerts.send_alert(
+                    guild_id=guild.guild_id,
+                    moderator_channel_id=guild.moderator_channel_id,
+                    title="Carlo nepublikoval starý zmeškaný termín",
+                    summary="Termín je mimo bezpečnej doby automatického dobehnutia.",
+                    correlation_id=correlation,
+                    run_id=None,
+                )
+            return SchedulerDecision(guild.guild_id, slot.key, "outside_grace")
+        # The timeout bounds only the final sync and snapshot preparation;
+        # guard and delivery steps are not cut off halfway.
+        deadline = asyncio.get_running_loop().time() + self._guild_timeout.total_seconds()
+        async with asyncio.timeout_at(deadline):
             final_sync_succeeded = await self._final_calendar_sync.synchronize_guild(
                 guild.guild_id, correlation_id=correlation
             )
             calendar_is_safe = await self._calendar_is_safe(guild.guild_id, checked_at)
-            if not final_sync_succeeded and not (
-                guild.allow_stale_calendar_cache and calendar_is_safe
-            ):
-                newly_recorded = await self._audit_skip(
-                    guild.guild_id, slot, "final_calendar_sync_failed", correlation
-                )
-                if newly_recorded:
-                    await self._alerts.send_alert(
-                        guild_id=guild.guild_id,
-                        moderator_channel_id=guild.moderator_channel_id,
-                        title="Carlo zablokoval publikovanie",
-                        summary=(
-                            "Finálna synchronizácia kalendára zlyhala a núdzové použitie "
-                            "posledných dát nie je povolené alebo už nie je bezpečné."
-                        ),
-                        correlation_id=correlation,
-                        run_id=None,
-                    )
-                decisions.append(
-                    SchedulerDecision(guild.guild_id, slot.key, "final_calendar_sync_failed")
-                )
-                continue
-            if not calendar_is_safe:
-                newly_recorded = await self._audit_skip(
-                    guild.guild_id, slot, "calendar_stale", correlation
-                )
-                if newly_recorded:
-                    await self._alerts.send_alert(
-                        guild_id=guild.guild_id,
-                        moderator_channel_id=guild.moderator_channel_id,
-                        title="Carlo zablokoval publikovanie",
-                        summary="Kalendárové údaje nie sú dostatočne čerstvé.",
-                        correlation_id=correlation,
-                        run_id=None,
-                    )
-                decisions.append(SchedulerDecision(guild.guild_id, slot.key, "calendar_stale"))
-                continue
-            if not final_sync_succeeded:
-                await self._audit_stale_cache_acceptance(guild.guild_id, slot, correlation)
+        if not final_sync_succeeded and not (guild.allow_stale_calendar_cache and calendar_is_safe):
+            newly_recorded = await self._audit_skip(
+                guild.guild_id, slot, "final_calendar_sync_failed", correlation
+            )
+            if newly_recorded:
                 await self._alerts.send_alert(
                     guild_id=guild.guild_id,
                     moderator_channel_id=guild.moderator_channel_id,
-                    title="Carlo použil posledné bezpečne čerstvé dáta",
+                    title="Carlo zablokoval publikovanie",
                     summary=(
-                        "Finálna synchronizácia zlyhala; publikovanie pokračovalo iba na základe "
-                        "výslovného nastavenia Admina."
+                        "Finálna synchronizácia kalendára zlyhala a núdzové použitie "
+                        "posledných dát nie je povolené alebo už nie je bezpečné."
                     ),
                     correlation_id=correlation,
                     run_id=None,
                 )
+            return SchedulerDecision(guild.guild_id, slot.key, "final_calendar_sync_failed")
+        if not calendar_is_safe:
+            newly_recorded = await self._audit_skip(
+                guild.guild_id, slot, "calendar_stale", correlation
+            )
+            if newly_recorded:
+                await self._alerts.send_alert(
+                    guild_id=guild.guild_id,
+                    moderator_channel_id=guild.moderator_channel_id,
+                    title="Carlo zablokoval publikovanie",
+                    summary="Kalendárové údaje nie sú dostatočne čerstvé.",
+                    correlation_id=correlation,
+                    run_id=None,
+                )
+            return SchedulerDecision(guild.guild_id, slot.key, "calendar_stale")
+        if not final_sync_succeeded:
+            await self._audit_stale_cache_acceptance(guild.guild_id, slot, correlation)
+            await self._alerts.send_alert(
+                guild_id=guild.guild_id,
+                moderator_channel_id=guild.moderator_channel_id,
+                title="Carlo použil posledné bezpečne čerstvé dáta",
+                summary=(
+                    "Finálna synchronizácia zlyhala; publikovanie pokračovalo iba na základe "
+                    "výslovného nastavenia Admina."
+                ),
+                correlation_id=correlation,
+                run_id=None,
+            )
+        async with asyncio.timeout_at(deadline):
             prepared = await self._engine.prepare(
                 guild.guild_id,
                 reference_time=slot.instant,
@@ -243,30 +284,27 @@ class PublicationScheduler:
                 initiated_by_user_id=None,
                 correlation_id=correlation,
             )
-            try:
-                guarded = await self._engine.begin_guard(
-                    prepared.run.id,
-                    correlation_id=correlation,
-                    now=checked_at,
-                )
-            except PublicationAlreadyRunning:
-                decisions.append(
-                    SchedulerDecision(
-                        guild.guild_id,
-                        slot.key,
-                        "publication_in_progress",
-                        prepared.run.id,
-                    )
-                )
-                continue
-            decisions.append(
-                SchedulerDecision(guild.guild_id, slot.key, guarded.state.value, guarded.run_id)
+        try:
+            guarded = await self._engine.begin_guard(
+                prepared.run.id,
+                correlation_id=correlation,
+                now=checked_at,
             )
-        return decisions
+        except PublicationAlreadyRunning:
+            return SchedulerDecision(
+                guild.guild_id,
+                slot.key,
+                "publication_in_progress",
+                prepared.run.id,
+            )
+
+        return SchedulerDecision(guild.guild_id, slot.key, guarded.state.value, guarded.run_id)
 
     async def _audit_stale_cache_acceptance(
         self, guild_id: int, slot: PublicationSlot, correlation_id: str
     ) -> None:
+        # Running on stale data is an explicit admin override; its audit row
+        # must commit or fail visibly, never be dropped by a background queue.
         async with self._unit_of_work.transaction() as repositories:
             await AuditWriter(repositories.audit_logs).success(
                 guild_id=guild_id,
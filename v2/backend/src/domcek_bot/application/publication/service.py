@@ -2,29 +2,68 @@
 
 from __future__ import annotations
 
+import hashlib
+import uuid
+from dataclasses import dataclass, field
 from datetime import datetime
 
-from domcek_bot.application.publication.composer import compose_publication
+from domcek_bot.application.publication.composer import (
+    next_guild_slot,
+    render_publication,
+    select_publication_items,
+)
+from domcek_bot.application.publication.intro import FALLBACK_TEXT
 from domcek_bot.application.publication.models import (
     EventSeriesOverrideInput,
     InfoAnnouncementInput,
     ManualEventInput,
     PublicationComposeSnapshot,
     PublicationDraft,
+    PublicationSelection,
 )
-from domcek_bot.application.unit_of_work import UnitOfWork
+from domcek_bot.application.unit_of_work import RepositorySet, UnitOfWork
+from domcek_bot.domain.time import PublicationWindow
 
 
 class PublicationConfigurationNotFound(LookupError):
     """Raised when a guild has no persisted publication configuration."""
 
 
+@dataclass(frozen=True, slots=True)
+class _WindowBounds:
+    source_ids: tuple[uuid.UUID, ...]
+    window: PublicationWindow
+
+
+@dataclass(slots=True)
+class _SelectedSlot:
+    fingerprint: str
+    window: _WindowBounds
+    window_fingerprint: str
+    completed_slot_keys: frozenset[str]
+    selection: PublicationSelection
+    drafts: dict[str, PublicationDraft] = field(default_factory=dict)
+    serialized: dict[str, tuple[str, str]] = field(default_factory=dict)
+
+
 class PublicationDraftService:
-    """Load one consistent database snapshot and compose the next publication."""
+    """Load one consistent database snapshot and compose the next publication.
+
+    The item selection for a guild is kept and reused while the guild's
+    compose fingerprint and its window's event fingerprint are unchanged and
+    the reference time still resolves to the same slot; the fingerprints are
+    read before the rows they cover, so a concurrent write can only make the
+    cached selection newer than its key, never older. Drafts rendered from it
+    are kept per intro text.
+    """
 
     def __init__(self, unit_of_work: UnitOfWork, *, default_seen_emoji: str = "✅") -> None:
         self._unit_of_work = unit_of_work
         self._default_seen_emoji = default_seen_emoji
+        self._selected: dict[int, _SelectedSlot] = {}
+
+    async def select_next(self, guild_id: int, *, reference_time: datetime) -> PublicationSelection:
+        return (await self._select_next(guild_id, reference_time=reference_time)).selection
 
     async def compose_next(
         self,
@@ -33,10 +72,61 @@ class PublicationDraftService:
         reference_time: datetime,
         intro_text: str,
     ) -> PublicationDraft:
-        snapshot = await self.load_next_snapshot(
-            guild_id, reference_time=reference_time, intro_text=intro_text
+        selected = await self._select_next(guild_id, reference_time=reference_time)
+        return self._render(selected, intro_text)
+
+    async def compose_next_canonical(
+        self,
+        guild_id: int,
+        *,
+        reference_time: datetime,
+        intro_text: str,
+    ) -> tuple[str, str]:
+        """Return the next draft's canonical JSON and its SHA-256 digest."""
+
+        selected = await self._select_next(guild_id, reference_time=reference_time)
+        serialized = selected.serialized.get(intro_text)
+        if serialized is None:
+            canonical = self._render(selected, intro_text).canonical_json()
+            serialized = (canonical, hashlib.sha256(canonical.encode("utf-8")).hexdigest())
+            selected.serialized[intro_text] = serialized
+        return serialized
+
+    def _render(self, selected: _SelectedSlot, intro_text: str) -> PublicationDraft:
+        draft = selected.drafts.get(intro_text)
+        if draft is None:
+            draft = render_publication(selected.selection, intro_text=intro_text)
+            selected.drafts[intro_text] = draft
+        return draft
+
+    async def _select_next(self, guild_id: int, *, reference_time: datetime) -> _SelectedSlot:
+        cached = self._selected.get(guild_id)
+        async with self._unit_of_work.transaction() as repositories:
+            fingerprint = await repositories.publication_runs.compose_fingerprint(guild_id)
+            if (
+                cached is not None
+                and cached.fingerprint == fingerprint
+                and next_guild_slot(
+                    cached.selection.guild, reference_time, cached.completed_slot_keys
+                ).key
+                == cached.selection.slot_key
+                and await _window_fingerprint(repositories, cached.window)
+                == cached.window_fingerprint
+            ):
+                return cached
+        # The intro only affects rendering, never the selected items.
+        snapshot, window, window_fingerprint = await self._load_next(
+            guild_id, reference_time=reference_time, intro_text=FALLBACK_TEXT
+        )
+        selected = _SelectedSlot(
+            fingerprint=fingerprint,
+            window=window,
+            window_fingerprint=window_fingerprint,
+            completed_slot_keys=snapshot.completed_slot_keys,
+            selection=select_publication_items(snapshot),
         )
-        return compose_publication(snapshot)
+        self._selected[guild_id] = selected
+        return selected
 
     async def load_next_snapshot(
         self,
@@ -45,30 +135,48 @@ class PublicationDraftService:
         reference_time: datetime,
         intro_text: str,
     ) -> PublicationComposeSnapshot:
+        snapshot, _, _ = await self._load_next(
+            guild_id, reference_time=reference_time, intro_text=intro_text
+        )
+        return snapshot
+
+    async def _load_next(
+        self,
+        guild_id: int,
+        *,
+        reference_time: datetime,
+        intro_text: str,
+    ) -> tuple[PublicationComposeSnapshot, _WindowBounds, str]:
         async with self._unit_of_work.transaction() as repositories:
-            guild = await repositories.guild_configs.get(guild_id)
-            if guild is None:
+            inputs = await repositories.publication_snapshots.load_guild_inputs(guild_id)
+            if inputs is None:
                 raise PublicationConfigurationNotFound(
                     f"publication configuration not found for guild {guild_id}"
                 )
+            guild = inputs.guild
+            completed = inputs.completed_slot_keys
+            # The composer resolves the same slot from the same inputs; resolving it
+            # here lets PostgreSQL discard events outside the publication window.
+            window = PublicationWindow.from_slot(next_guild_slot(guild, reference_time, completed))
+            window_starts_on, window_ends_on = window.local_dates()
+            bounds = _WindowBounds(
+                tuple(source.id for source in inputs.calendar_sources if source.active), window
+            )
+            window_fingerprint = await _window_fingerprint(repositories, bounds)
+            window_events = await repositories.publication_snapshots.load_window_events(
+                bounds.source_ids,
+                starts_at=window.starts_at,
+                ends_at=window.ends_at,
+                starts_on=window_starts_on,
+                ends_on=window_ends_on,
+            )
 
-            sources = await repositories.calendar_sources.list_for_guild(guild_id)
-            source_ids = tuple(source.id for source in sources)
-            events = await repositories.external_events.list_for_sources(source_ids)
-            event_ids = tuple(event.id for event in events)
-            overrides = await repositories.event_overrides.list_for_events(event_ids)
-            series = await repositories.event_series_overrides.list_for_sources(source_ids)
-            manual = await repositories.manual_events.list_for_guild(guild_id)
-            info = await repositories.info_announcements.list_for_guild(guild_id)
-            reactions = await repositories.reaction_configs.get(guild_id)
-            completed = await repositories.publication_runs.completed_slot_keys(guild_id)
-
-        return PublicationComposeSnapshot(
+        snapshot = PublicationComposeSnapshot(
             guild=guild,
             reference_time=reference_time,
-            calendar_sources=tuple(sources),
-            external_events=tuple(events),
-            event_overrides=tuple(overrides),
+            calendar_sources=inputs.calendar_sources,
+            external_events=window_events.external_events,
+            event_overrides=window_events.event_overrides,
             series_overrides=tuple(
                 EventSeriesOverrideInput(
                     id=item.id,
@@ -83,7 +191,7 @@ class PublicationDraftService:
                     public_description=item.public_description,
                     version=item.version,
                 )
-                for item in series
+                for item in inputs.series_overrides
             ),
             manual_events=tuple(
                 ManualEventInput(
@@ -101,7 +209,7 @@ class PublicationDraftService:
                     active=item.active,
                     deleted_at=item.deleted_at,
                 )
-                for item in manual
+                for item in inputs.manual_events
             ),
             info_announcements=tuple(
                 InfoAnnouncementInput(
@@ -116,14 +224,26 @@ class PublicationDraftService:
                     active=item.active,
                     deleted_at=item.deleted_at,
                 )
-                for item in info
+                for item in inputs.info_announcements
             ),
             completed_slot_keys=completed,
             intro_text=intro_text,
             seen_reaction_emoji=_seen_reaction_emoji(
-                reactions, default_emoji=self._default_seen_emoji
+                inputs.reaction_config, default_emoji=self._default_seen_emoji
             ),
         )
+        return snapshot, bounds, window_fingerprint
+
+
+async def _window_fingerprint(repositories: RepositorySet, bounds: _WindowBounds) -> str:
+    starts_on, ends_on = bounds.window.local_dates()
+    return await repositories.publication_snapshots.window_fingerprint(
+        bounds.source_ids,
+        starts_at=bounds.window.starts_at,
+        ends_at=bounds.window.ends_at,
+        starts_on=starts_on,
+        ends_on=ends_on,
+    )
 
 
 def _seen_reaction_emoji(config: object | None, *, default_emoji: str) -> str | None:
@@ -5,19 +5,30 @@ from __future__ import annotations
 import hashlib
 import json
 import uuid
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 
 from domcek_bot.application.auth.authorization import Capability, Principal
 from domcek_bot.application.publication.intro import FALLBACK_TEXT
+from domcek_bot.application.publication.models import PublicationDraft
 from domcek_bot.application.publication.service import PublicationDraftService
-from domcek_bot.application.records import ShadowPublicationRecord
+from domcek_bot.application.records import ShadowPublicationDraftRecord, ShadowPublicationRecord
 from domcek_bot.application.unit_of_work import UnitOfWork
 
 
+@dataclass(frozen=True, slots=True)
+class ShadowPublicationEntry:
+    capture: ShadowPublicationRecord
+    draft_json: dict[str, Any] | None
+
+
 class ShadowPublicationService:
     def __init__(self, unit_of_work: UnitOfWork, drafts: PublicationDraftService) -> None:
         self._unit_of_work = unit_of_work
         self._drafts = drafts
+        # The draft service returns the same object while nothing changed.
+        self._serialized: dict[int, tuple[PublicationDraft, str, str]] = {}
 
     async def capture_next(
         self,
@@ -31,7 +42,7 @@ class ShadowPublicationService:
             reference_time=observed_at,
             intro_text=FALLBACK_TEXT,
         )
-        canonical = draft.canonical_json()
+        canonical, digest = self._serialize(guild_id, draft)
         payload: object = json.loads(canonical)
         if not isinstance(payload, dict):  # canonical draft root is an invariant
             raise TypeError("publication draft must serialize to an object")
@@ -73,8 +84,7 @@ class ShadowPublicationService:
             first_observed_at=observed_at,
             last_observed_at=observed_at,
             observation_count=1,
-            draft_sha256=hashlib.sha256(canonical.encode("utf-8")).hexdigest(),
-            draft_json=payload,
+            draft_sha256=digest,
             item_count=len(draft.public_items),
             message_count=len(draft.messages),
             calendar_sync_valid=sync_valid,
@@ -82,15 +92,64 @@ class ShadowPublicationService:
             warning_codes=tuple(warning.code.value for warning in draft.warnings),
         )
         async with self._unit_of_work.transaction() as repositories:
-            return await repositories.shadow_publications.record(capture)
+            return await repositories.shadow_publications.record(
+                capture, ShadowPublicationDraftRecord(sha256=digest, draft_json=payload)
+            )
+
+    def _serialize(self, guild_id: int, draft: PublicationDraft) -> tuple[str, str]:
+        cached = self._serialized.get(guild_id)
+        if cached is not None and cached[0] is draft:
+            return cached[1], cached[2]
+        canonical = draft.canonical_json()
+        digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        self._serialized[guild_id] = (draft, canonical, digest)
+        return canonical, digest
 
     async def list(
-        self, principal: Principal, *, limit: int = 20
-    ) -> tuple[ShadowPublicationRecord, ...]:
+        self, principal: Principal, *, limit: int = 20, include_drafts: bool = True
+    ) -> tuple[ShadowPublicationEntry, ...]:
+        """List recent captures, each distinct draft body read once.
+
+        Without ``include_drafts`` only metadata and hashes are returned; the
+        body of one capture is then available from ``draft``.
+        """
+
         principal.require(Capability.VIEW_ADMIN)
         safe_limit = min(max(limit, 1), 100)
+        drafts: dict[str, dict[str, Any]] = {}
         async with self._unit_of_work.transaction() as repositories:
             captures = await repositories.shadow_publications.list_for_guild(
                 principal.guild_id, limit=safe_limit
             )
-        return tuple(captures)
+            if include_drafts and captures:
+                hashes = tuple(dict.fromkeys(capture.draft_sha256 for capture in captures))
+                for draft in await repositories.shadow_publications.list_drafts(hashes):
+                    drafts[draft.sha256] = draft.draft_json
+        return tuple(
+            ShadowPublicationEntry(
+                capture, drafts.get(capture.draft_sha256) if include_drafts else None
+            )
+            for capture in captures
+        )
+
+    async def get(
+        self, capture_id: uuid.UUID, principal: Principal
+    ) -> ShadowPublicationRecord | None:
+        principal.require(Capability.VIEW_ADMIN)
+        async with self._unit_of_work.transaction() as repositories:
+            capture = await repositories.shadow_publications.get(capture_id)
+        if capture is None or capture.guild_id != principal.guild_id:
+            return None
+        return capture
+
+    async def draft(
+        self, capture: ShadowPublicationRecord, principal: Principal
+    ) -> ShadowPublicationDraftRecord | None:
+        """Return the draft body a capture references by hash."""
+
+        principal.require(Capability.VIEW_ADMIN)
+        if capture.guild_id != principal.guild_id:
+            return None
+        async with self._unit_of_work.transaction() as repositories:
+            drafts = await repositories.shadow_publications.list_drafts((capture.draft_sha256,))
+        return drafts[0] if drafts else None
@@ -10,6 +10,7 @@ from typing import Any
 from domcek_bot.domain.enums import (
     ArchiveState,
     AuditResult,
+    CalendarSyncRequestState,
     DescriptionState,
     ExternalEventStatus,
     InclusionDecision,
@@ -69,9 +70,34 @@ class CalendarSourceRecord:
     last_sync_success_at: datetime | None = None
     last_full_sync_at: datetime | None = None
     last_sync_error: str | None = None
+    next_sync_due_at: datetime | None = None
     version: int = 1
 
 
+@dataclass(frozen=True, slots=True)
+class CalendarWatchChannelRecord:
+    id: uuid.UUID
+    calendar_source_id: uuid.UUID
+    resource_id: str
+    token_hash: str
+    expires_at: datetime
+    created_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class CalendarSyncRequestRecord:
+    id: uuid.UUID
+    calendar_source_id: uuid.UUID
+    state: CalendarSyncRequestState
+    requested_at: datetime
+    force_full: bool = False
+    requesters: int = 1
+    started_at: datetime | None = None
+    completed_at: datetime | None = None
+    result_value: dict[str, Any] | None = None
+    error_code: str | None = None
+
+
 @dataclass(frozen=True, slots=True)
 class ReactionConfigRecord:
     guild_id: int
@@ -203,6 +229,25 @@ class PublicationRunRecord:
     decision_reason: str | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class PublicationGuildInputs:
+    """Window-independent compose inputs of one guild, read in one statement."""
+
+    guild: GuildConfigRecord
+    completed_slot_keys: frozenset[str]
+    calendar_sources: tuple[CalendarSourceRecord, ...]
+    series_overrides: tuple[EventSeriesOverrideRecord, ...]
+    manual_events: tuple[ManualEventRecord, ...]
+    info_announcements: tuple[InfoAnnouncementRecord, ...]
+    reaction_config: ReactionConfigRecord | None
+
+
+@dataclass(frozen=True, slots=True)
+class PublicationWindowEvents:
+    external_events: tuple[ExternalEventRecord, ...]
+    event_overrides: tuple[EventOverrideRecord, ...]
+
+
 @dataclass(frozen=True, slots=True)
 class PublicationItemRecord:
     id: uuid.UUID
@@ -271,7 +316,6 @@ class ShadowPublicationRecord:
     last_observed_at: datetime
     observation_count: int
     draft_sha256: str
-    draft_json: dict[str, Any]
     item_count: int
     message_count: int
     calendar_sync_valid: bool
@@ -279,6 +323,12 @@ class ShadowPublicationRecord:
     warning_codes: tuple[str, ...] = ()
 
 
+@dataclass(frozen=True, slots=True)
+class ShadowPublicationDraftRecord:
+    sha256: str
+    draft_json: dict[str, Any]
+
+
 @dataclass(frozen=True, slots=True)
 class RuntimeHeartbeatRecord:
     id: uuid.UUID
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime
+from collections.abc import Mapping, Sequence
+from datetime import date, datetime
 from typing import Any, Protocol
 
 from domcek_bot.application.records import (
     AuditLogRecord,
     CalendarSourceRecord,
+    CalendarSyncRequestRecord,
+    CalendarWatchChannelRecord,
     ChannelArchiveRequestRecord,
     EventOverrideRecord,
     EventSeriesOverrideRecord,
@@ -18,16 +21,24 @@ from domcek_bot.application.records import (
     IntegrationTaskRecord,
     ManualEventRecord,
     PublicationGuardNoticeRecord,
+    PublicationGuildInputs,
     PublicationItemRecord,
     PublicationMessageRecord,
     PublicationRunRecord,
+    PublicationWindowEvents,
     ReactionConfigRecord,
     RuntimeHeartbeatRecord,
+    ShadowPublicationDraftRecord,
     ShadowPublicationRecord,
     UndoOperationRecord,
     WebSessionRecord,
 )
-from domcek_bot.domain.enums import ArchiveState, IntegrationTaskState, PublicationState
+from domcek_bot.domain.enums import (
+    ArchiveState,
+    CalendarSyncRequestState,
+    IntegrationTaskState,
+    PublicationState,
+)
 
 
 class GuildConfigRepository(Protocol):
@@ -73,6 +84,70 @@ class CalendarSourceRepository(Protocol):
         self, source_id: uuid.UUID, *, attempted_at: datetime, error_code: str
     ) -> None: ...
 
+    async def schedule_next_sync(self, source_id: uuid.UUID, *, due_at: datetime) -> None: ...
+
+    async def next_sync_due_at(self, *, after: datetime) -> datetime | None: ...
+
+
+class CalendarWatchChannelRepository(Protocol):
+    async def add(self, record: CalendarWatchChannelRecord) -> None: ...
+
+    async def get(self, channel_id: uuid.UUID) -> CalendarWatchChannelRecord | None: ...
+
+    async def list_all(self) -> list[CalendarWatchChannelRecord]: ...
+
+    async def delete(self, channel_id: uuid.UUID) -> bool: ...
+
+
+class DiscordRoleMembershipRepository(Protocol):
+    async def list_members(
+        self, guild_id: int, role_id: int, *, refreshed_after: datetime
+    ) -> tuple[int, ...] | None: ...
+
+    async def begin_refresh(self, guild_id: int, role_id: int) -> int: ...
+
+    async def replace_members(
+        self,
+        guild_id: int,
+        role_id: int,
+        user_ids: tuple[int, ...],
+        *,
+        refreshed_at: datetime,
+        generation: int,
+    ) -> bool: ...
+
+    async def apply_member_roles(
+        self, guild_id: int, user_id: int, role_ids: frozenset[int]
+    ) -> None: ...
+
+    async def invalidate(self, guild_id: int) -> None: ...
+
+
+class CalendarSyncRequestRepository(Protocol):
+    async def enqueue(self, record: CalendarSyncRequestRecord) -> CalendarSyncRequestRecord: ...
+
+    async def get(self, request_id: uuid.UUID) -> CalendarSyncRequestRecord | None: ...
+
+    async def claim(
+        self,
+        request_id: uuid.UUID,
+        *,
+        started_at: datetime,
+        stale_before: datetime,
+    ) -> CalendarSyncRequestRecord | None: ...
+
+    async def complete(
+        self,
+        request_id: uuid.UUID,
+        *,
+        state: CalendarSyncRequestState,
+        completed_at: datetime,
+        result_value: dict[str, Any] | None = None,
+        error_code: str | None = None,
+    ) -> None: ...
+
+    async def list_pending_source_ids(self) -> list[uuid.UUID]: ...
+
 
 class ReactionConfigRepository(Protocol):
     async def get(self, guild_id: int) -> ReactionConfigRecord | None: ...
@@ -91,27 +166,43 @@ class ExternalEventRepository(Protocol):
 
     async def list_for_source(self, source_id: uuid.UUID) -> list[ExternalEventRecord]: ...
 
+    async def list_by_source_keys(
+        self, source_keys: tuple[str, ...]
+    ) -> list[ExternalEventRecord]: ...
+
     async def list_for_sources(
         self, source_ids: tuple[uuid.UUID, ...]
     ) -> list[ExternalEventRecord]: ...
 
-    async def upsert_from_sync(self, record: ExternalEventRecord) -> bool: ...
-
-    async def cancel_by_provider_event_id(
+    async def list_active_in_window(
         self,
-        source_id: uuid.UUID,
-        provider_event_id: str,
+        source_ids: tuple[uuid.UUID, ...],
         *,
-        synced_at: datetime,
-    ) -> bool: ...
+        starts_at: datetime,
+        ends_at: datetime,
+        starts_on: date,
+        ends_on: date,
+    ) -> list[ExternalEventRecord]: ...
 
-    async def mark_missing_deleted(
+    async def upsert_many_from_sync(
+        self, records: tuple[ExternalEventRecord, ...]
+    ) -> dict[str, bool]: ...
+
+    async def mark_many_synced(
+        self, source_keys: tuple[str, ...], *, synced_at: datetime
+    ) -> int: ...
+
+    async def cancel_many_by_provider_event_ids(
         self,
         source_id: uuid.UUID,
-        seen_source_keys: set[str],
+        provider_event_ids: tuple[str, ...],
         *,
-        deleted_at: datetime,
-    ) -> int: ...
+        synced_at: datetime,
+    ) -> frozenset[str]: ...
+
+    async def remember_seen_source_keys(self, source_keys: tuple[str, ...]) -> None: ...
+
+    async def mark_missing_deleted(self, source_id: uuid.UUID, *, deleted_at: datetime) -> int: ...
 
     async def mark_deleted(self, event_id: uuid.UUID, deleted_at: datetime) -> bool: ...
 
@@ -154,6 +245,8 @@ class ManualEventRepository(Protocol):
 
     async def list_for_guild(self, guild_id: int) -> list[ManualEventRecord]: ...
 
+    async def list_fingerprint(self, guild_id: int) -> str: ...
+
 
 class InfoAnnouncementRepository(Protocol):
     async def get(self, announcement_id: uuid.UUID) -> InfoAnnouncementRecord | None: ...
@@ -164,6 +257,32 @@ class InfoAnnouncementRepository(Protocol):
 
     async def list_for_guild(self, guild_id: int) -> list[InfoAnnouncementRecord]: ...
 
+    async def list_fingerprint(self, guild_id: int) -> str: ...
+
+
+class PublicationSnapshotRepository(Protocol):
+    async def load_guild_inputs(self, guild_id: int) -> PublicationGuildInputs | None: ...
+
+    async def load_window_events(
+        self,
+        source_ids: tuple[uuid.UUID, ...],
+        *,
+        starts_at: datetime,
+        ends_at: datetime,
+        starts_on: date,
+        ends_on: date,
+    ) -> PublicationWindowEvents: ...
+
+    async def window_fingerprint(
+        self,
+        source_ids: tuple[uuid.UUID, ...],
+        *,
+        starts_at: datetime,
+        ends_at: datetime,
+        starts_on: date,
+        ends_on: date,
+    ) -> str: ...
+
 
 class PublicationRunRepository(Protocol):
     async def get(self, run_id: uuid.UUID) -> PublicationRunRecord | None: ...
@@ -172,16 +291,26 @@ class PublicationRunRepository(Protocol):
 
     async def completed_slot_keys(self, guild_id: int) -> frozenset[str]: ...
 
+    async def compose_fingerprint(self, guild_id: int) -> str: ...
+
     async def lock_slot(self, guild_id: int, slot_key: str) -> None: ...
 
     async def get_for_slot(self, guild_id: int, slot_key: str) -> PublicationRunRecord | None: ...
 
     async def list_for_guild(
-        self, guild_id: int, *, limit: int = 50
+        self,
+        guild_id: int,
+        *,
+        limit: int = 50,
+        before: tuple[datetime, uuid.UUID] | None = None,
     ) -> list[PublicationRunRecord]: ...
 
     async def list_items(self, run_id: uuid.UUID) -> list[PublicationItemRecord]: ...
 
+    async def list_items_for_runs(
+        self, run_ids: tuple[uuid.UUID, ...]
+    ) -> list[PublicationItemRecord]: ...
+
     async def add_snapshot(
         self,
         run: PublicationRunRecord,
@@ -191,7 +320,13 @@ class PublicationRunRepository(Protocol):
 
     async def list_messages(self, run_id: uuid.UUID) -> list[PublicationMessageRecord]: ...
 
-    async def claim_message(self, message_id: uuid.UUID, *, attempted_at: datetime) -> bool: ...
+    async def list_messages_for_runs(
+        self, run_ids: tuple[uuid.UUID, ...]
+    ) -> list[PublicationMessageRecord]: ...
+
+    async def claim_message(
+        self, message_id: uuid.UUID, *, attempted_at: datetime
+    ) -> PublicationMessageRecord | None: ...
 
     async def increment_message_attempt(
         self, message_id: uuid.UUID, *, attempted_at: datetime
@@ -258,6 +393,8 @@ class PublicationRunRepository(Protocol):
 
     async def list_waiting_release_due(self, *, now: datetime) -> list[PublicationRunRecord]: ...
 
+    async def next_release_at(self, *, after: datetime) -> datetime | None: ...
+
     async def get_waiting_guard(
         self, guild_id: int, *, now: datetime, run_id: uuid.UUID | None = None
     ) -> PublicationRunRecord | None: ...
@@ -285,7 +422,13 @@ class PublicationRunRepository(Protocol):
 
 
 class ShadowPublicationRepository(Protocol):
-    async def record(self, capture: ShadowPublicationRecord) -> ShadowPublicationRecord: ...
+    async def record(
+        self, capture: ShadowPublicationRecord, draft: ShadowPublicationDraftRecord
+    ) -> ShadowPublicationRecord: ...
+
+    async def get(self, capture_id: uuid.UUID) -> ShadowPublicationRecord | None: ...
+
+    async def list_drafts(self, sha256s: tuple[str, ...]) -> list[ShadowPublicationDraftRecord]: ...
 
     async def list_for_guild(
         self, guild_id: int, *, limit: int = 20
@@ -293,13 +436,19 @@ class ShadowPublicationRepository(Protocol):
 
 
 class RuntimeHeartbeatRepository(Protocol):
-    async def upsert(self, heartbeat: RuntimeHeartbeatRecord) -> None: ...
+    async def upsert_many(
+        self, heartbeats: Sequence[RuntimeHeartbeatRecord], *, refresh_before: datetime
+    ) -> int: ...
 
     async def list_for_guild(
         self, guild_id: int, *, limit: int = 50
     ) -> list[RuntimeHeartbeatRecord]: ...
 
 
+class WorkerWakeupRepository(Protocol):
+    async def notify(self, reason: str) -> None: ...
+
+
 class IntegrationTaskRepository(Protocol):
     async def claim(self, record: IntegrationTaskRecord) -> IntegrationTaskRecord: ...
 
@@ -394,7 +543,7 @@ class WebSessionRepository(Protocol):
         self, token_hash: str, *, now: datetime
     ) -> WebSessionRecord | None: ...
 
-    async def touch(self, session_id: uuid.UUID, *, seen_at: datetime) -> None: ...
+    async def touch_many(self, seen: Mapping[uuid.UUID, datetime]) -> None: ...
 
     async def revoke(self, session_id: uuid.UUID, *, revoked_at: datetime) -> bool: ...
 
@@ -12,6 +12,7 @@ from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from domcek_bot.application.audit import AuditWriter
 from domcek_bot.application.auth.authorization import Capability, Principal
+from domcek_bot.application.auth.principals import PrincipalCache
 from domcek_bot.application.calendar.sync import CalendarSyncResult
 from domcek_bot.application.records import (
     CalendarSourceRecord,
@@ -66,11 +67,13 @@ class SettingsService:
         synchronizer: CalendarSynchronizer | None = None,
         reaction_validator: ReactionTargetValidator | None = None,
         discord_settings_validator: DiscordSettingsTargetValidator | None = None,
+        principals: PrincipalCache | None = None,
     ) -> None:
         self._unit_of_work = unit_of_work
         self._synchronizer = synchronizer
         self._reaction_validator = reaction_validator
         self._discord_settings_validator = discord_settings_validator
+        self._principals = principals
 
     async def get(self, principal: Principal) -> SettingsSnapshot:
         principal.require(Capability.MANAGE_SETTINGS)
@@ -207,6 +210,9 @@ class SettingsService:
                 before_value=_safe_record(current),
                 after_value=_safe_record(replace(updated, version=version)),
             )
+            await repositories.worker_wakeups.notify("settings")
+        if self._principals is not None:
+            self._principals.invalidate_all()
         return replace(updated, version=version)
 
     async def add_calendar(
@@ -240,6 +246,7 @@ class SettingsService:
                 correlation_id=correlation_id,
                 after_value=_safe_record(record),
             )
+            await repositories.worker_wakeups.notify("calendar_source")
         return record
 
     async def update_calendar(
@@ -271,6 +278,11 @@ class SettingsService:
                 sync_token=None if identity_changed else current.sync_token,
                 sync_token_query_key=None if identity_changed else current.sync_token_query_key,
                 last_sync_error=None if identity_changed else current.last_sync_error,
+                next_sync_due_at=(
+                    None
+                    if identity_changed or active != current.active
+                    else current.next_sync_due_at
+                ),
             )
             version = await repositories.calendar_sources.update(
                 updated, expected_version=expected_version
@@ -285,6 +297,7 @@ class SettingsService:
                 before_value=_safe_record(current),
                 after_value=_safe_record(replace(updated, version=version)),
             )
+            await repositories.worker_wakeups.notify("calendar_source")
         return replace(updated, version=version)
 
     async def update_reactions(
@@ -8,6 +8,7 @@ from datetime import UTC, datetime
 
 from domcek_bot.application.audit import AuditWriter
 from domcek_bot.application.auth.authorization import Capability, Principal
+from domcek_bot.application.auth.principals import PrincipalCache
 from domcek_bot.application.channels import ChannelOperationError, DiscordChannelGateway
 from domcek_bot.application.discord_admin import (
     DiscordAdministrationError,
@@ -38,10 +39,12 @@ class UndoService:
         unit_of_work: UnitOfWork,
         discord_admin: DiscordAdministrationGateway,
         channels: DiscordChannelGateway,
+        principals: PrincipalCache | None = None,
     ) -> None:
         self._unit_of_work = unit_of_work
         self._discord_admin = discord_admin
         self._channels = channels
+        self._principals = principals
 
     async def list_available(
         self, *, principal: Principal, scope: str
@@ -166,13 +169,17 @@ class UndoService:
             <= 1
         ):
             raise UndoUnavailable("last_admin_protection")
-        await self._discord_admin.set_member_role(
-            principal.guild_id,
-            member_id,
-            config_role_id,
-            enabled=target_enabled,
-            reason=f"Carlo undo {correlation_id} by {principal.user_id}",
-        )
+        try:
+            await self._discord_admin.set_member_role(
+                principal.guild_id,
+                member_id,
+                config_role_id,
+                enabled=target_enabled,
+                reason=f"Carlo undo {correlation_id} by {principal.user_id}",
+            )
+        finally:
+            if self._principals is not None:
+                self._principals.invalidate_user(member_id)
 
     async def _configured_role_id(self, guild_id: int, role: str) -> int:
         async with self._unit_of_work.transaction() as repositories:
@@ -8,7 +8,10 @@ from typing import Protocol
 from domcek_bot.application.repositories import (
     AuditLogRepository,
     CalendarSourceRepository,
+    CalendarSyncRequestRepository,
+    CalendarWatchChannelRepository,
     ChannelArchiveRequestRepository,
+    DiscordRoleMembershipRepository,
     EventOverrideRepository,
     EventSeriesOverrideRepository,
     ExternalEventRepository,
@@ -17,11 +20,13 @@ from domcek_bot.application.repositories import (
     IntegrationTaskRepository,
     ManualEventRepository,
     PublicationRunRepository,
+    PublicationSnapshotRepository,
     ReactionConfigRepository,
     RuntimeHeartbeatRepository,
     ShadowPublicationRepository,
     UndoOperationRepository,
     WebSessionRepository,
+    WorkerWakeupRepository,
 )
 
 
@@ -32,9 +37,18 @@ class RepositorySet(Protocol):
     @property
     def calendar_sources(self) -> CalendarSourceRepository: ...
 
+    @property
+    def calendar_watch_channels(self) -> CalendarWatchChannelRepository: ...
+
+    @property
+    def calendar_sync_requests(self) -> CalendarSyncRequestRepository: ...
+
     @property
     def reaction_configs(self) -> ReactionConfigRepository: ...
 
+    @property
+    def discord_role_members(self) -> DiscordRoleMembershipRepository: ...
+
     @property
     def external_events(self) -> ExternalEventRepository: ...
 
@@ -50,6 +64,9 @@ class RepositorySet(Protocol):
     @property
     def info_announcements(self) -> InfoAnnouncementRepository: ...
 
+    @property
+    def publication_snapshots(self) -> PublicationSnapshotRepository: ...
+
     @property
     def publication_runs(self) -> PublicationRunRepository: ...
 
@@ -59,6 +76,9 @@ class RepositorySet(Protocol):
     @property
     def runtime_heartbeats(self) -> RuntimeHeartbeatRepository: ...
 
+    @property
+    def worker_wakeups(self) -> WorkerWakeupRepository: ...
+
     @property
     def integration_tasks(self) -> IntegrationTaskRepository: ...
 
@@ -0,0 +1,58 @@
+"""Next instant at which the worker has scheduled work to do."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from domcek_bot.application.records import GuildConfigRecord
+from domcek_bot.application.unit_of_work import UnitOfWork
+from domcek_bot.domain.ids import GuildId
+from domcek_bot.domain.time import PublicationSchedule
+
+
+class WorkerWakeupPlanner:
+    """Compute the earliest future deadline from stored schedules.
+
+    Deadlines are publication slots, reminder instants, guard releases and
+    calendar sync due times. Only instants after ``now`` count: work that was
+    already due when the worker last looked either ran then or is retried by
+    the worker's idle recheck instead of waking it again immediately.
+    """
+
+    def __init__(
+        self,
+        unit_of_work: UnitOfWork,
+        *,
+        reminder_lead: timedelta | None,
+        publications: bool = True,
+    ) -> None:
+        self._unit_of_work = unit_of_work
+        self._reminder_lead = reminder_lead
+        self._publications = publications
+
+    async def next_wakeup(self, now: datetime) -> datetime | None:
+        async with self._unit_of_work.transaction() as repositories:
+            candidates = [await repositories.calendar_sources.next_sync_due_at(after=now)]
+            if self._publications:
+                candidates.append(await repositories.publication_runs.next_release_at(after=now))
+                for guild in await repositories.guild_configs.list_all():
+                    candidates.extend(self._guild_deadlines(guild, now))
+        return min((instant for instant in candidates if instant is not None), default=None)
+
+    def _guild_deadlines(self, guild: GuildConfigRecord, now: datetime) -> list[datetime]:
+        if not guild.automatic_publication_enabled:
+            return []
+        schedule = PublicationSchedule(
+            guild.publication_weekday, guild.publication_time, guild.timezone
+        )
+        slot = schedule.next_slot(GuildId(guild.guild_id), now)
+        deadlines = [slot.instant]
+        if (
+            self._reminder_lead is not None
+            and guild.alert_publication_reminder_enabled
+            and guild.moderator_channel_id is not None
+        ):
+            reminder_at = slot.instant - self._reminder_lead
+            if reminder_at > now:
+                deadlines.append(reminder_at)
+        return deadlines
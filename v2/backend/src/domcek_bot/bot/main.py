@@ -37,6 +37,10 @@ from domcek_bot.application.channels import (
     normalize_channel_name,
 )
 from domcek_bot.application.operations import RuntimeOperationsService
+from domcek_bot.application.publication.admin_roles import (
+    IndexedGuardDiscordGateway,
+    RoleMembershipIndex,
+)
 from domcek_bot.application.publication.engine import (
     DiscordAmbiguousError,
     DiscordDefinitiveError,
@@ -929,10 +933,16 @@ class CarloClient(discord.Client):
             secret=settings.session_secret_value(),
             publication_enabled=settings.manual_publication_enabled,
         )
+        self.role_index = RoleMembershipIndex(
+            unit_of_work, ttl=timedelta(minutes=settings.discord_role_index_ttl_minutes)
+        )
         self.publication_guard = PublicationGuardService(
             unit_of_work,
             engine,
-            DiscordPyPublicationGuardGateway(self, settings.frontend_base_url),
+            IndexedGuardDiscordGateway(
+                DiscordPyPublicationGuardGateway(self, settings.frontend_base_url),
+                self.role_index,
+            ),
             publication_alerts,
         )
         self.channel_management = ChannelManagementService(
@@ -974,6 +984,9 @@ class CarloClient(discord.Client):
 
     async def on_ready(self) -> None:
         await self._record_runtime_state("connected")
+        # A new session may follow missed member events; the next reader reloads.
+        for guild in self.guilds:
+            await self.role_index.invalidate(guild.id)
         if not self._archives_recovered:
             guild_id = self.settings.discord_guild_id
             if guild_id is not None:
@@ -1020,6 +1033,15 @@ class CarloClient(discord.Client):
                 )
             return
 
+    async def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
+        if {role.id for role in before.roles} != {role.id for role in after.roles}:
+            await self.role_index.record_member_roles(
+                after.guild.id, after.id, (role.id for role in after.roles)
+            )
+
+    async def on_member_remove(self, member: discord.Member) -> None:
+        await self.role_index.record_member_roles(member.guild.id, member.id, ())
+
     async def on_resumed(self) -> None:
         await self._record_runtime_state("connected")
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import warnings
 from enum import StrEnum
 from pathlib import Path
 from urllib.parse import urlsplit
@@ -63,7 +64,9 @@ class Settings(BaseSettings):
     session_secret: SecretStr | None = None
     session_secret_file: Path | None = None
     session_lifetime_hours: int = Field(default=12, ge=1, le=168)
+    session_touch_granularity_seconds: int = Field(default=60, ge=1, le=3600)
     oauth_state_lifetime_minutes: int = Field(default=10, ge=1, le=30)
+    principal_cache_ttl_seconds: int = Field(default=30, ge=0, le=300)
     api_rate_limit_window_seconds: int = Field(default=60, ge=1, le=3600)
     api_oauth_rate_limit: int = Field(default=20, ge=1, le=1000)
     api_mutation_rate_limit: int = Field(default=120, ge=1, le=10000)
@@ -99,9 +102,22 @@ class Settings(BaseSettings):
     calendar_stale_warning_minutes: int = Field(default=120, ge=1, le=10080)
     calendar_max_safe_age_minutes: int = Field(default=360, ge=1, le=20160)
     worker_poll_interval_seconds: float = Field(default=30.0, ge=1, le=3600)
+    worker_idle_recheck_seconds: float = Field(default=300.0, ge=1, le=3600)
     calendar_sync_interval_seconds: float = Field(default=300.0, ge=30, le=86400)
+    calendar_sync_max_interval_seconds: float = Field(default=3600.0, ge=30, le=86400)
+    calendar_sync_concurrency: int = Field(default=4, ge=1, le=16)
+    calendar_sync_guild_concurrency: int = Field(default=2, ge=1, le=16)
+    calendar_sync_stream_pages: bool = False
+    calendar_sync_full_partitions: int = Field(default=1, ge=1, le=16)
+    calendar_watch_webhook_url: str | None = None
+    calendar_watch_ttl_hours: int = Field(default=24, ge=1, le=168)
+    calendar_watch_renew_before_minutes: int = Field(default=60, ge=5, le=1440)
+    calendar_sync_watched_max_interval_seconds: float = Field(default=5400.0, ge=30, le=86400)
     publication_grace_period_minutes: int = Field(default=120, ge=1, le=1440)
     publication_reminder_lead_hours: int = Field(default=24, ge=1, le=168)
+    publication_scheduler_concurrency: int = Field(default=4, ge=1, le=32)
+    publication_scheduler_guild_timeout_seconds: int = Field(default=600, ge=30, le=3600)
+    discord_role_index_ttl_minutes: int = Field(default=360, ge=5, le=10080)
     publication_execution_mode: PublicationExecutionMode = PublicationExecutionMode.PAUSED
     allow_manual_publication_in_shadow: bool = False
     publication_recovery_stale_seconds: int = Field(default=90, ge=10, le=3600)
@@ -125,6 +141,61 @@ class Settings(BaseSettings):
             )
         return self
 
+    @model_validator(mode="after")
+    def validate_calendar_sync_backoff(self) -> Settings:
+        # Configs written before the backoff existed may set a long interval or a
+        # short warning age; clamp the new ceiling to them instead of rejecting.
+        interval = self.calendar_sync_interval_seconds
+        ceiling = max(interval, self.calendar_stale_warning_minutes * 60 - interval)
+        clamped = min(max(self.calendar_sync_max_interval_seconds, interval), ceiling)
+        if clamped != self.calendar_sync_max_interval_seconds:
+            warnings.warn(
+                "CALENDAR_SYNC_MAX_INTERVAL_SECONDS clamped to "
+                f"{clamped:g}s to stay between CALENDAR_SYNC_INTERVAL_SECONDS and "
+                "CALENDAR_STALE_WARNING_MINUTES",
+                stacklevel=2,
+            )
+            self.calendar_sync_max_interval_seconds = clamped
+        return self
+
+    @model_validator(mode="after")
+    def validate_worker_wakeups(self) -> Settings:
+        if self.worker_idle_recheck_seconds < self.worker_poll_interval_seconds:
+            raise ValueError(
+                "WORKER_IDLE_RECHECK_SECONDS must be at least WORKER_POLL_INTERVAL_SECONDS"
+            )
+        return self
+
+    @model_validator(mode="after")
+    def validate_calendar_sync_mode(self) -> Settings:
+        if self.calendar_sync_stream_pages and self.calendar_sync_full_partitions > 1:
+            raise ValueError(
+                "CALENDAR_SYNC_STREAM_PAGES cannot be combined with CALENDAR_SYNC_FULL_PARTITIONS"
+            )
+        return self
+
+    @model_validator(mode="after")
+    def validate_calendar_watch(self) -> Settings:
+        if self.calendar_watch_webhook_url is None:
+            return self
+        parsed = urlsplit(self.calendar_watch_webhook_url)
+        if parsed.scheme != "https" or not parsed.hostname or parsed.username or parsed.fragment:
+            raise ValueError("CALENDAR_WATCH_WEBHOOK_URL must be an absolute HTTPS URL")
+        if self.calendar_watch_renew_before_minutes >= self.calendar_watch_ttl_hours * 60:
+            raise ValueError(
+                "CALENDAR_WATCH_RENEW_BEFORE_MINUTES must be shorter than CALENDAR_WATCH_TTL_HOURS"
+            )
+        if not (
+            self.calendar_sync_max_interval_seconds
+            <= self.calendar_sync_watched_max_interval_seconds
+            < self.calendar_stale_warning_minutes * 60
+        ):
+            raise ValueError(
+                "CALENDAR_SYNC_WATCHED_MAX_INTERVAL_SECONDS must be at least "
+                "CALENDAR_SYNC_MAX_INTERVAL_SECONDS and below CALENDAR_STALE_WARNING_MINUTES"
+            )
+        return self
+
     @model_validator(mode="after")
     def validate_manual_shadow_publication(self) -> Settings:
         if self.allow_manual_publication_in_shadow and not (
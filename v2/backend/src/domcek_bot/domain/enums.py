@@ -56,6 +56,13 @@ class SyncStatus(StrEnum):
     FAILED = "failed"
 
 
+class CalendarSyncRequestState(StrEnum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
 class PublicationItemType(StrEnum):
     INTRO = "intro"
     INFO = "info"
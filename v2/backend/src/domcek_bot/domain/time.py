@@ -139,13 +139,17 @@ class PublicationWindow:
             raise DomainValidationError("event end must be after start")
         return start < self.ends_at and end > self.starts_at
 
+    def local_dates(self) -> tuple[date, date]:
+        """Return the half-open local calendar-date range used for all-day events."""
+
+        zone = timezone(self.timezone_name)
+        return self.starts_at.astimezone(zone).date(), self.ends_at.astimezone(zone).date()
+
     def overlaps_all_day(self, starts_on: date, ends_on: date | None) -> bool:
         end = ends_on or starts_on + timedelta(days=1)
         if end <= starts_on:
             raise DomainValidationError("all-day event end must be after start")
-        zone = timezone(self.timezone_name)
-        window_start_date = self.starts_at.astimezone(zone).date()
-        window_end_date = self.ends_at.astimezone(zone).date()
+        window_start_date, window_end_date = self.local_dates()
         return starts_on < window_end_date and end > window_start_date
 
 
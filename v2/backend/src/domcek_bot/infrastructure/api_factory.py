@@ -12,10 +12,13 @@ from domcek_bot.api.dependencies import ApiServices
 from domcek_bot.application.alerts import AlertCategory, ConfiguredModeratorAlerts
 from domcek_bot.application.audit import AuditQueryService
 from domcek_bot.application.auth.oauth_state import OAuthStateCodec
+from domcek_bot.application.auth.principals import PrincipalCache
 from domcek_bot.application.auth.service import AuthService
 from domcek_bot.application.auth.session import SessionService
 from domcek_bot.application.bootstrap import ensure_guild_config
+from domcek_bot.application.calendar.requests import CalendarSyncRequestQueue
 from domcek_bot.application.calendar.sync import CalendarSyncService
+from domcek_bot.application.calendar.watch import CalendarNotificationReceiver
 from domcek_bot.application.channels import ChannelManagementService
 from domcek_bot.application.discord_admin import DiscordAdministrationService
 from domcek_bot.application.editor.content import ContentEditorialService
@@ -40,6 +43,7 @@ from domcek_bot.infrastructure.discord_publication import (
     DiscordHttpPublicationGateway,
     DiscordModeratorAlertGateway,
 )
+from domcek_bot.infrastructure.discord_rate_limit import DiscordRateLimiter
 from domcek_bot.infrastructure.gemini_intro import GeminiIntroGenerator
 from domcek_bot.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
 
@@ -54,17 +58,23 @@ def create_runtime_app() -> FastAPI:
         unit_of_work,
         secret=settings.session_secret_value(),
         lifetime=timedelta(hours=settings.session_lifetime_hours),
+        touch_granularity=timedelta(seconds=settings.session_touch_granularity_seconds),
+        defer_touches=True,
     )
+    # One limiter per process: every REST gateway spends the same bot budget.
+    discord_rate_limiter = DiscordRateLimiter()
     discord = DiscordHttpIdentityClient(
         client_id=settings.resolved_discord_oauth_client_id,
         client_secret=settings.discord_oauth_secret_value(),
         redirect_uri=settings.discord_oauth_redirect_uri,
         bot_token=settings.discord_token_value(),
+        rate_limiter=discord_rate_limiter,
     )
     guild_id = settings.discord_guild_id
     if guild_id is None:
         raise RuntimeError("validated API settings have no Discord guild ID")
-    auth = AuthService(unit_of_work, discord, sessions, guild_id=guild_id)
+    principals = PrincipalCache(ttl=timedelta(seconds=settings.principal_cache_ttl_seconds))
+    auth = AuthService(unit_of_work, discord, sessions, guild_id=guild_id, principals=principals)
     draft_service = PublicationDraftService(
         unit_of_work, default_seen_emoji=settings.publication_seen_emoji
     )
@@ -78,10 +88,13 @@ def create_runtime_app() -> FastAPI:
         if intro_key is not None
         else None
     )
-    publication_gateway = DiscordHttpPublicationGateway(bot_token=settings.discord_token_value())
+    publication_gateway = DiscordHttpPublicationGateway(
+        bot_token=settings.discord_token_value(), rate_limiter=discord_rate_limiter
+    )
     alert_gateway = DiscordModeratorAlertGateway(
         bot_token=settings.discord_token_value(),
         frontend_base_url=settings.frontend_base_url,
+        rate_limiter=discord_rate_limiter,
     )
     publication_alerts = ConfiguredModeratorAlerts(
         unit_of_work, alert_gateway, AlertCategory.PUBLICATION
@@ -100,7 +113,7 @@ def create_runtime_app() -> FastAPI:
     google_calendar = build_google_calendar_client(settings)
     calendar_sync = CalendarSyncService(unit_of_work, google_calendar)
     discord_admin_gateway = DiscordHttpAdministrationGateway(
-        bot_token=settings.discord_token_value()
+        bot_token=settings.discord_token_value(), rate_limiter=discord_rate_limiter
     )
     channel_service = ChannelManagementService(unit_of_work, discord_admin_gateway, channel_alerts)
     api_services = ApiServices(
@@ -123,13 +136,14 @@ def create_runtime_app() -> FastAPI:
         publication_recovery=PublicationRecoveryService(unit_of_work, publication_engine),
         settings=SettingsService(
             unit_of_work,
-            calendar_sync,
+            CalendarSyncRequestQueue(unit_of_work, calendar_sync),
             reaction_validator=discord_admin_gateway,
             discord_settings_validator=discord_admin_gateway,
+            principals=principals,
         ),
         channels=channel_service,
         discord_admin=DiscordAdministrationService(
-            unit_of_work, discord_admin_gateway, role_alerts
+            unit_of_work, discord_admin_gateway, role_alerts, principals=principals
         ),
         publication_history=PublicationHistoryService(
             unit_of_work,
@@ -138,7 +152,12 @@ def create_runtime_app() -> FastAPI:
         ),
         shadow_publications=ShadowPublicationService(unit_of_work, draft_service),
         operations=RuntimeOperationsService(unit_of_work),
-        undo=UndoService(unit_of_work, discord_admin_gateway, discord_admin_gateway),
+        undo=UndoService(
+            unit_of_work, discord_admin_gateway, discord_admin_gateway, principals=principals
+        ),
+        calendar_notifications=CalendarNotificationReceiver(unit_of_work)
+        if settings.calendar_watch_webhook_url is not None
+        else None,
         resources=tuple(
             resource
             for resource in (
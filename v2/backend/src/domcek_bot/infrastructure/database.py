@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
-from typing import Protocol
+from typing import Any, Protocol
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
@@ -62,5 +62,35 @@ class Database:
         async with self._sessions() as session:
             yield session
 
+    @asynccontextmanager
+    async def listen(
+        self, channel: str, received: Callable[[str], None]
+    ) -> AsyncIterator[asyncio.Event]:
+        """Subscribe a dedicated connection to a NOTIFY channel for the block.
+
+        ``received`` is called with each payload. The yielded event is set when
+        the connection is lost; the caller has to subscribe again after that.
+        """
+
+        lost = asyncio.Event()
+
+        def on_notification(_connection: Any, _pid: int, _channel: str, payload: str) -> None:
+            received(payload)
+
+        def on_termination(_connection: Any) -> None:
+            lost.set()
+
+        async with self._engine.connect() as connection:
+            raw = await connection.get_raw_connection()
+            driver: Any = raw.driver_connection
+            driver.add_termination_listener(on_termination)
+            await driver.add_listener(channel, on_notification)
+            try:
+                yield lost
+            finally:
+                driver.remove_termination_listener(on_termination)
+                if not lost.is_set():
+                    await driver.remove_listener(channel, on_notification)
+
     async def close(self) -> None:
         await self._engine.dispose()
@@ -22,6 +22,7 @@ from domcek_bot.application.discord_admin import (
     DiscordMemberOption,
     DiscordRoleOption,
 )
+from domcek_bot.infrastructure.discord_rate_limit import DiscordRateLimiter, rate_limited_transport
 
 DISCORD_API = "https://discord.com/api/v10"
 MANAGE_ROLES = 1 << 28
@@ -39,8 +40,11 @@ class DiscordHttpAdministrationGateway:
         *,
         bot_token: str,
         client: httpx.AsyncClient | None = None,
+        rate_limiter: DiscordRateLimiter | None = None,
     ) -> None:
-        self._client = client or httpx.AsyncClient(timeout=15.0)
+        self._client = client or httpx.AsyncClient(
+            timeout=15.0, transport=rate_limited_transport(rate_limiter)
+        )
         self._owns_client = client is None
         self._headers = {"Authorization": f"Bot {bot_token}"}
 
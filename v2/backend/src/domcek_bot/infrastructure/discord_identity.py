@@ -14,6 +14,7 @@ from domcek_bot.application.auth.contracts import (
     DiscordOAuthToken,
     DiscordUser,
 )
+from domcek_bot.infrastructure.discord_rate_limit import DiscordRateLimiter, rate_limited_transport
 
 DISCORD_API = "https://discord.com/api/v10"
 DISCORD_TOKEN_URL = "https://discord.com/api/oauth2/token"  # noqa: S105
@@ -28,12 +29,15 @@ class DiscordHttpIdentityClient:
         redirect_uri: str,
         bot_token: str,
         client: httpx.AsyncClient | None = None,
+        rate_limiter: DiscordRateLimiter | None = None,
     ) -> None:
         self._client_id = str(client_id)
         self._client_secret = client_secret
         self._redirect_uri = redirect_uri
         self._bot_token = bot_token
-        self._client = client or httpx.AsyncClient(timeout=10.0)
+        self._client = client or httpx.AsyncClient(
+            timeout=10.0, transport=rate_limited_transport(rate_limiter)
+        )
         self._owns_client = client is None
 
     async def exchange_code(self, code: str) -> DiscordOAuthToken:
@@ -15,16 +15,24 @@ from domcek_bot.application.publication.engine import (
     DiscordTransientError,
 )
 from domcek_bot.application.records import PublicationMessageRecord
+from domcek_bot.infrastructure.discord_rate_limit import DiscordRateLimiter, rate_limited_transport
 
 DISCORD_API_BASE = "https://discord.com/api/v10"
 
 
 class DiscordHttpPublicationGateway:
-    def __init__(self, *, bot_token: str, timeout_seconds: float = 15.0) -> None:
+    def __init__(
+        self,
+        *,
+        bot_token: str,
+        timeout_seconds: float = 15.0,
+        rate_limiter: DiscordRateLimiter | None = None,
+    ) -> None:
         self._client = httpx.AsyncClient(
             base_url=DISCORD_API_BASE,
             headers={"Authorization": f"Bot {bot_token}"},
             timeout=timeout_seconds,
+            transport=rate_limited_transport(rate_limiter),
         )
 
     async def send_message(self, message: PublicationMessageRecord) -> int:
@@ -87,13 +95,19 @@ class DiscordHttpPublicationGateway:
 
 class DiscordHttpPublicationGuardGateway:
     def __init__(
-        self, *, bot_token: str, frontend_base_url: str, timeout_seconds: float = 10.0
+        self,
+        *,
+        bot_token: str,
+        frontend_base_url: str,
+        timeout_seconds: float = 10.0,
+        rate_limiter: DiscordRateLimiter | None = None,
     ) -> None:
         self._frontend_base_url = frontend_base_url.rstrip("/")
         self._client = httpx.AsyncClient(
             base_url=DISCORD_API_BASE,
             headers={"Authorization": f"Bot {bot_token}"},
             timeout=timeout_seconds,
+            transport=rate_limited_transport(rate_limiter),
         )
 
     async def admin_member_ids(self, guild_id: int, admin_role_id: int) -> tuple[int, ...]:
@@ -192,12 +206,14 @@ class DiscordModeratorAlertGateway:
         bot_token: str,
         frontend_base_url: str,
         timeout_seconds: float = 10.0,
+        rate_limiter: DiscordRateLimiter | None = None,
     ) -> None:
         self._frontend_base_url = frontend_base_url.rstrip("/")
         self._client = httpx.AsyncClient(
             base_url=DISCORD_API_BASE,
             headers={"Authorization": f"Bot {bot_token}"},
             timeout=timeout_seconds,
+            transport=rate_limited_transport(rate_limiter),
         )
 
     async def send_alert(
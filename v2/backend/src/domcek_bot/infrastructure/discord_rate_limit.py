@@ -0,0 +1,273 @@
+"""Process-wide Discord REST rate-limit scheduling shared by every HTTP gateway."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import re
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass
+
+import httpx
+
+# Discord scopes bucket limits per value of these top-level resources.
+_MAJOR_RESOURCES = frozenset({"channels", "guilds", "webhooks"})
+_SNOWFLAKE = re.compile(r"^\d{15,22}$")
+_API_PREFIX = re.compile(r"^/api(?:/v\d+)?")
+# User OAuth tokens each get their own buckets; idle ones are pruned past this.
+_MAX_IDLE_BUCKETS = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class DiscordRateLimitStats:
+    queued: int
+    delayed_requests: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+    rate_limited_responses: int
+
+
+@dataclass(slots=True)
+class _Bucket:
+    lock: asyncio.Lock
+    remaining: int | None = None
+    reset_at: float = 0.0
+    # Set once a response carried no bucket headers; such routes are not probed.
+    unlimited: bool = False
+    # Pending while the one request sent into an unknown window is in flight.
+    probe: asyncio.Event | None = None
+
+
+class DiscordRateLimiter:
+    """Schedule Discord REST calls from observed bucket headers.
+
+    Requests wait for their bucket's reset instead of being sent into a 429.
+    Routes are mapped to Discord's ``X-RateLimit-Bucket`` hash once a response
+    names it; until then the normalized route is its own bucket. While a
+    bucket's window is unknown, before its first response or after its reset
+    passed, one request goes out alone and the rest wait for its headers
+    instead of bursting together. Bot requests also share the global
+    per-second budget. A wait longer than ``max_wait``
+    is not taken: the request is sent and the caller's existing 429 handling
+    decides, so a long reset never stalls a publication silently.
+    """
+
+    def __init__(
+        self,
+        *,
+        global_per_second: int = 50,
+        max_wait: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        if global_per_second < 1 or max_wait < 0:
+            raise ValueError("Discord rate limits must be positive")
+        self._global_per_second = global_per_second
+        self._max_wait = max_wait
+        self._clock = clock
+        self._sleep = sleep
+        self._bucket_hashes: dict[str, str] = {}
+        self._buckets: dict[str, _Bucket] = {}
+        self._global_lock = asyncio.Lock()
+        self._global_sent: deque[float] = deque()
+        self._global_blocked_until = 0.0
+        self._queued = 0
+        self._delayed = 0
+        self._total_wait = 0.0
+        self._max_observed_wait = 0.0
+        self._rate_limited = 0
+
+    def stats(self) -> DiscordRateLimitStats:
+        return DiscordRateLimitStats(
+            queued=self._queued,
+            delayed_requests=self._delayed,
+            total_wait_seconds=round(self._total_wait, 3),
+            max_wait_seconds=round(self._max_observed_wait, 3),
+            rate_limited_responses=self._rate_limited,
+        )
+
+    async def acquire(self, route: str, *, bot: bool) -> None:
+        self._queued += 1
+        try:
+            bucket = self._bucket(route)
+            async with bucket.lock:
+                waited = 0.0
+                if bucket.probe is not None:
+                    waited += await self._wait_for_probe(bucket.probe)
+                waited += await self._wait_until(bucket.reset_at if bucket.remaining == 0 else 0.0)
+                if bucket.remaining == 0 and bucket.reset_at <= self._clock():
+                    bucket.remaining = None
+                if bucket.remaining is None:
+                    if not bucket.unlimited:
+                        bucket.probe = asyncio.Event()
+                elif bucket.remaining > 0:
+                    bucket.remaining -= 1
+            if bot:
+                try:
+                    waited += await self._acquire_global()
+                except BaseException:
+                    # The transport never learns of a request that died here,
+                    # so the probe this request may hold is released now.
+                    self.abandon(route)
+                    raise
+        finally:
+            self._queued -= 1
+        if waited > 0:
+            self._delayed += 1
+            self._total_wait += waited
+            self._max_observed_wait = max(self._max_observed_wait, waited)
+
+    def observe(self, route: str, response: httpx.Response) -> None:
+        headers = response.headers
+        now = self._clock()
+        self.abandon(route)
+        bucket_hash = headers.get("X-RateLimit-Bucket")
+        if bucket_hash:
+            major, _, identity = route.split(" ", 1)[1].split("|")
+            self._bucket_hashes[route] = f"{bucket_hash}:{major}:{identity}"
+        bucket = self._bucket(route)
+        remaining = _float_header(headers, "X-RateLimit-Remaining")
+        reset_after = _float_header(headers, "X-RateLimit-Reset-After")
+        if remaining is not None and reset_after is not None:
+            bucket.remaining = int(remaining)
+            bucket.reset_at = now + reset_after
+            bucket.unlimited = False
+        elif response.status_code != 429:
+            bucket.unlimited = True
+        if response.status_code != 429:
+            return
+        self._rate_limited += 1
+        retry_after = _float_header(headers, "Retry-After") or reset_after or 1.0
+        if headers.get("X-RateLimit-Global") == "true" or headers.get("X-RateLimit-Scope") == (
+            "global"
+        ):
+            self._global_blocked_until = max(self._global_blocked_until, now + retry_after)
+        else:
+            bucket.remaining = 0
+            bucket.reset_at = max(bucket.reset_at, now + retry_after)
+
+    def abandon(self, route: str) -> None:
+        """Release requests waiting on ``route``'s probe; ``observe`` calls this."""
+
+        # A probe may have started before the route was mapped to its hash.
+        for key in {route, self._bucket_hashes.get(route, route)}:
+            bucket = self._buckets.get(key)
+            if bucket is not None and bucket.probe is not None:
+                bucket.probe.set()
+                bucket.probe = None
+
+    def _bucket(self, route: str) -> _Bucket:
+        key = self._bucket_hashes.get(route, route)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= _MAX_IDLE_BUCKETS:
+                self._prune(self._clock())
+            bucket = _Bucket(lock=asyncio.Lock())
+            self._buckets[key] = bucket
+        return bucket
+
+    def _prune(self, now: float) -> None:
+        idle = [
+            key
+            for key, bucket in self._buckets.items()
+            if bucket.reset_at <= now and not bucket.lock.locked()
+        ]
+        for key in idle:
+            del self._buckets[key]
+        learned = set(self._buckets)
+        self._bucket_hashes = {
+            route: key for route, key in self._bucket_hashes.items() if key in learned
+        }
+
+    async def _acquire_global(self) -> float:
+        async with self._global_lock:
+            waited = await self._wait_until(self._global_blocked_until)
+            now = self._clock()
+            while self._global_sent and self._global_sent[0] <= now - 1.0:
+                self._global_sent.popleft()
+            if len(self._global_sent) >= self._global_per_second:
+                waited += await self._wait_until(self._global_sent[0] + 1.0)
+                self._global_sent.popleft()
+            self._global_sent.append(self._clock())
+        return waited
+
+    async def _wait_for_probe(self, probe: asyncio.Event) -> float:
+        started = self._clock()
+        with suppress(TimeoutError):
+            await asyncio.wait_for(probe.wait(), self._max_wait)
+        return self._clock() - started
+
+    async def _wait_until(self, instant: float) -> float:
+        delay = instant - self._clock()
+        if not 0 < delay <= self._max_wait:
+            return 0.0
+        await self._sleep(delay)
+        return delay
+
+
+class DiscordRateLimitTransport(httpx.AsyncBaseTransport):
+    """httpx transport that routes every Discord request through a shared limiter."""
+
+    def __init__(
+        self,
+        limiter: DiscordRateLimiter,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self._limiter = limiter
+        self._transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        authorization = request.headers.get("Authorization", "")
+        route = discord_route(request.method, request.url.path, authorization)
+        await self._limiter.acquire(route, bot=authorization.startswith("Bot "))
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            self._limiter.abandon(route)
+            raise
+        self._limiter.observe(route, response)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def rate_limited_transport(
+    limiter: DiscordRateLimiter | None,
+) -> DiscordRateLimitTransport | None:
+    """Return the transport for a gateway client, or httpx's default without a limiter."""
+
+    return DiscordRateLimitTransport(limiter) if limiter is not None else None
+
+
+def discord_route(method: str, path: str, authorization: str) -> str:
+    """Return ``"<METHOD> <major>|<template>|<identity>"`` for bucket lookup."""
+
+    segments = [segment for segment in _API_PREFIX.sub("", path).split("/") if segment]
+    template: list[str] = []
+    major = ""
+    for index, segment in enumerate(segments):
+        previous = segments[index - 1] if index else ""
+        if index == 1 and previous in _MAJOR_RESOURCES:
+            major = f"{previous}/{segment}"
+            template.append(segment)
+        elif previous == "reactions" or _SNOWFLAKE.match(segment):
+            template.append("{id}")
+        else:
+            template.append(segment)
+    # Limits belong to the token, so bot and user OAuth calls never share one.
+    identity = hashlib.sha256(authorization.encode()).hexdigest()[:12]
+    return f"{method.upper()} {major}|/{'/'.join(template)}|{identity}"
+
+
+def _float_header(headers: httpx.Headers, name: str) -> float | None:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
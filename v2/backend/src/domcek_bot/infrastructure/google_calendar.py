@@ -28,6 +28,8 @@ from domcek_bot.application.calendar.contracts import (
     CalendarRateLimitError,
     CalendarSyncTokenExpired,
     CalendarTemporaryError,
+    CalendarWatchChannel,
+    CalendarWatchClient,
     ProviderCalendarEvent,
 )
 from domcek_bot.domain.enums import ExternalEventStatus
@@ -70,7 +72,7 @@ class GoogleServiceAccountTokenProvider:
             return token
 
 
-class GoogleCalendarClient(CalendarClient):
+class GoogleCalendarClient(CalendarClient, CalendarWatchClient):
     def __init__(
         self,
         token_provider: AccessTokenProvider,
@@ -173,20 +175,76 @@ class GoogleCalendarClient(CalendarClient):
             next_sync_token=_optional_string(payload, "nextSyncToken"),
         )
 
+    async def watch_events(
+        self,
+        calendar_id: str,
+        *,
+        channel_id: str,
+        token: str,
+        address: str,
+        expires_at: datetime,
+    ) -> CalendarWatchChannel:
+        encoded_id = quote(_nonempty(calendar_id, "calendar id"), safe="")
+        response = await self._request(
+            "POST",
+            f"/calendars/{encoded_id}/events/watch",
+            json_body={
+                "id": _nonempty(channel_id, "channel id"),
+                "type": "web_hook",
+                "address": _nonempty(address, "watch address"),
+                "token": token,
+                "expiration": str(int(expires_at.timestamp() * 1000)),
+            },
+        )
+        payload = _json_object(response)
+        expiration_raw = _optional_string(payload, "expiration")
+        try:
+            granted_at = (
+                expires_at
+                if expiration_raw is None
+                else datetime.fromtimestamp(int(expiration_raw) / 1000, tz=UTC)
+            )
+        except ValueError as exc:
+            raise CalendarPayloadError("Google channel expiration is invalid") from exc
+        return CalendarWatchChannel(
+            channel_id=_string(payload, "id"),
+            resource_id=_string(payload, "resourceId"),
+            expires_at=granted_at,
+        )
+
+    async def stop_watch(self, channel_id: str, resource_id: str) -> None:
+        await self._request(
+            "POST",
+            "/channels/stop",
+            json_body={"id": channel_id, "resourceId": resource_id},
+        )
+
     async def close(self) -> None:
         if self._owns_http_client:
             await self._http_client.aclose()
 
     async def _get_json(self, path: str, *, params: Mapping[str, str]) -> dict[str, Any]:
+        return _json_object(await self._request("GET", path, params=params))
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, str] | None = None,
+        json_body: Mapping[str, Any] | None = None,
+    ) -> httpx.Response:
         force_refresh = False
         last_retryable_status: int | None = None
         for attempt in range(self._retry_attempts):
             token = await self._token_provider.get_token(force_refresh=force_refresh)
             force_refresh = False
             try:
-                response = await self._http_client.get(
+                response = await self._http_client.request(
+                    method,
                     path,
                     params=params,
+                    json=json_body,
                     headers={"Authorization": f"Bearer {token}"},
                 )
             except (httpx.TimeoutException, httpx.TransportError) as exc:
@@ -220,14 +278,7 @@ class GoogleCalendarClient(CalendarClient):
                 raise CalendarIntegrationError(
                     f"Google Calendar returned HTTP {response.status_code}"
                 )
-
-            try:
-                payload = response.json()
-            except ValueError as exc:
-                raise CalendarPayloadError("Google Calendar returned invalid JSON") from exc
-            if not isinstance(payload, dict):
-                raise CalendarPayloadError("Google Calendar returned an invalid object")
-            return cast(dict[str, Any], payload)
+            return response
 
         raise CalendarTemporaryError(
             f"Google Calendar request exhausted retries ({last_retryable_status})"
@@ -244,6 +295,16 @@ class GoogleCalendarClient(CalendarClient):
         return float(min(self._retry_base_seconds * (2**attempt), 60.0))
 
 
+def _json_object(response: httpx.Response) -> dict[str, Any]:
+    try:
+        payload = response.json()
+    except ValueError as exc:
+        raise CalendarPayloadError("Google Calendar returned invalid JSON") from exc
+    if not isinstance(payload, dict):
+        raise CalendarPayloadError("Google Calendar returned an invalid object")
+    return cast(dict[str, Any], payload)
+
+
 def _parse_event(payload: Mapping[str, Any], calendar_timezone: str) -> ProviderCalendarEvent:
     status_value = _optional_string(payload, "status") or ExternalEventStatus.CONFIRMED.value
     try:
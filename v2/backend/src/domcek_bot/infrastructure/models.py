@@ -14,6 +14,7 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    ForeignKeyConstraint,
     Index,
     Integer,
     MetaData,
@@ -31,6 +32,7 @@ from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from domcek_bot.domain.enums import (
     ArchiveState,
     AuditResult,
+    CalendarSyncRequestState,
     DescriptionState,
     ExternalEventStatus,
     InclusionDecision,
@@ -157,6 +159,7 @@ class CalendarSourceModel(TimestampMixin, Base):
     last_sync_success_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     last_full_sync_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     last_sync_error: Mapped[str | None] = mapped_column(Text)
+    next_sync_due_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
 
     __mapper_args__: dict[str, Any] = {  # noqa: RUF012
@@ -165,6 +168,60 @@ class CalendarSourceModel(TimestampMixin, Base):
     }
 
 
+class CalendarWatchChannelModel(Base):
+    __tablename__ = "calendar_watch_channel"
+    __table_args__ = (
+        Index("ix_calendar_watch_channel_source_expires", "calendar_source_id", "expires_at"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    calendar_source_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("calendar_source.id", ondelete="CASCADE"), nullable=False
+    )
+    resource_id: Mapped[str] = mapped_column(String(512), nullable=False)
+    token_hash: Mapped[str] = mapped_column(String(128), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+
+class CalendarSyncRequestModel(Base):
+    __tablename__ = "calendar_sync_request"
+    __table_args__ = (
+        CheckConstraint(enum_check("state", CalendarSyncRequestState), name="state"),
+        CheckConstraint("requesters >= 1", name="positive_requesters"),
+        Index(
+            "uq_calendar_sync_request_pending_source",
+            "calendar_source_id",
+            unique=True,
+            postgresql_where=text("state = 'pending'"),
+        ),
+        Index(
+            "uq_calendar_sync_request_running_source",
+            "calendar_source_id",
+            unique=True,
+            postgresql_where=text("state = 'running'"),
+        ),
+        Index("ix_calendar_sync_request_state_requested", "state", "requested_at"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    calendar_source_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("calendar_source.id", ondelete="CASCADE"), nullable=False
+    )
+    state: Mapped[str] = mapped_column(
+        String(24), nullable=False, default=CalendarSyncRequestState.PENDING.value
+    )
+    force_full: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    requesters: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    requested_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    result_value: Mapped[dict[str, Any] | None] = mapped_column(JSONB)
+    error_code: Mapped[str | None] = mapped_column(String(100))
+
+
 class ExternalEventModel(TimestampMixin, Base):
     __tablename__ = "external_event"
     __table_args__ = (
@@ -195,6 +252,11 @@ class ExternalEventModel(TimestampMixin, Base):
             "series_key",
             "original_start_key",
         ),
+        Index(
+            "ix_external_event_source_provider_event",
+            "calendar_source_id",
+            "provider_event_id",
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -394,6 +456,7 @@ class PublicationRunModel(TimestampMixin, Base):
         CheckConstraint("attempt >= 1", name="positive_attempt"),
         Index("ix_publication_run_state_scheduled", "state", "scheduled_for"),
         Index("ix_publication_run_guard_release", "state", "release_at"),
+        Index("ix_publication_run_guild_scheduled", "guild_id", "scheduled_for", "id"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -427,6 +490,32 @@ class PublicationRunModel(TimestampMixin, Base):
     decision_reason: Mapped[str | None] = mapped_column(String(64))
 
 
+class DiscordRoleIndexModel(Base):
+    __tablename__ = "discord_role_index"
+
+    guild_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("guild_config.guild_id", ondelete="CASCADE"), primary_key=True
+    )
+    role_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    generation: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
+class DiscordRoleMemberModel(Base):
+    __tablename__ = "discord_role_member"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ("guild_id", "role_id"),
+            ("discord_role_index.guild_id", "discord_role_index.role_id"),
+            ondelete="CASCADE",
+        ),
+    )
+
+    guild_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    role_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    user_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+
+
 class PublicationGuardNoticeModel(TimestampMixin, Base):
     __tablename__ = "publication_guard_notice"
     __table_args__ = (
@@ -493,6 +582,16 @@ class PublicationItemModel(Base):
     )
 
 
+class ShadowPublicationDraftModel(Base):
+    __tablename__ = "shadow_publication_draft"
+
+    sha256: Mapped[str] = mapped_column(String(64), primary_key=True)
+    draft_json: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+
 class ShadowPublicationModel(Base):
     __tablename__ = "shadow_publication"
     __table_args__ = (
@@ -501,6 +600,7 @@ class ShadowPublicationModel(Base):
         CheckConstraint("item_count >= 0", name="nonnegative_item_count"),
         CheckConstraint("message_count >= 0", name="nonnegative_message_count"),
         Index("ix_shadow_publication_guild_scheduled", "guild_id", "scheduled_for"),
+        Index("ix_shadow_publication_draft_sha256", "draft_sha256"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -512,8 +612,9 @@ class ShadowPublicationModel(Base):
     first_observed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     last_observed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     observation_count: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
-    draft_sha256: Mapped[str] = mapped_column(String(64), nullable=False)
-    draft_json: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    draft_sha256: Mapped[str] = mapped_column(
+        String(64), ForeignKey("shadow_publication_draft.sha256"), nullable=False
+    )
     item_count: Mapped[int] = mapped_column(Integer, nullable=False)
     message_count: Mapped[int] = mapped_column(Integer, nullable=False)
     calendar_sync_valid: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
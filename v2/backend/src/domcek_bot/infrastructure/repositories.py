@@ -3,18 +3,49 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import asdict
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime, time
 from typing import Any, cast
 
-from sqlalchemy import delete, func, or_, select, text, update
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Date,
+    DateTime,
+    Select,
+    Time,
+    and_,
+    bindparam,
+    column,
+    delete,
+    exists,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+    tuple_,
+    type_coerce,
+    update,
+)
+from sqlalchemy import Uuid as UuidType
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy import values as sa_values
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by
 from sqlalchemy.dialects.postgresql import insert as postgresql_insert
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql.selectable import ScalarSelect
 
 from domcek_bot.application.records import (
     AuditLogRecord,
     CalendarSourceRecord,
+    CalendarSyncRequestRecord,
+    CalendarWatchChannelRecord,
     ChannelArchiveRequestRecord,
     EventOverrideRecord,
     EventSeriesOverrideRecord,
@@ -24,11 +55,14 @@ from domcek_bot.application.records import (
     IntegrationTaskRecord,
     ManualEventRecord,
     PublicationGuardNoticeRecord,
+    PublicationGuildInputs,
     PublicationItemRecord,
     PublicationMessageRecord,
     PublicationRunRecord,
+    PublicationWindowEvents,
     ReactionConfigRecord,
     RuntimeHeartbeatRecord,
+    ShadowPublicationDraftRecord,
     ShadowPublicationRecord,
     UndoOperationRecord,
     WebSessionRecord,
@@ -36,6 +70,7 @@ from domcek_bot.application.records import (
 from domcek_bot.domain.enums import (
     ArchiveState,
     AuditResult,
+    CalendarSyncRequestState,
     DescriptionState,
     ExternalEventStatus,
     InclusionDecision,
@@ -51,8 +86,13 @@ from domcek_bot.domain.enums import (
 from domcek_bot.domain.errors import OptimisticLockError
 from domcek_bot.infrastructure.models import (
     AuditLogModel,
+    Base,
     CalendarSourceModel,
+    CalendarSyncRequestModel,
+    CalendarWatchChannelModel,
     ChannelArchiveRequestModel,
+    DiscordRoleIndexModel,
+    DiscordRoleMemberModel,
     EventOverrideModel,
     EventSeriesOverrideModel,
     ExternalEventModel,
@@ -68,6 +108,7 @@ from domcek_bot.infrastructure.models import (
     ReactionConfigChannelModel,
     ReactionConfigModel,
     RuntimeHeartbeatModel,
+    ShadowPublicationDraftModel,
     ShadowPublicationModel,
     UndoOperationModel,
     WebSessionModel,
@@ -121,10 +162,39 @@ def _calendar_source_record(model: CalendarSourceModel) -> CalendarSourceRecord:
         last_sync_success_at=model.last_sync_success_at,
         last_full_sync_at=model.last_full_sync_at,
         last_sync_error=model.last_sync_error,
+        next_sync_due_at=model.next_sync_due_at,
         version=model.version,
     )
 
 
+def _calendar_sync_request_record(model: CalendarSyncRequestModel) -> CalendarSyncRequestRecord:
+    return CalendarSyncRequestRecord(
+        id=model.id,
+        calendar_source_id=model.calendar_source_id,
+        state=CalendarSyncRequestState(model.state),
+        requested_at=model.requested_at,
+        force_full=model.force_full,
+        requesters=model.requesters,
+        started_at=model.started_at,
+        completed_at=model.completed_at,
+        result_value=model.result_value,
+        error_code=model.error_code,
+    )
+
+
+def _calendar_watch_channel_record(
+    model: CalendarWatchChannelModel,
+) -> CalendarWatchChannelRecord:
+    return CalendarWatchChannelRecord(
+        id=model.id,
+        calendar_source_id=model.calendar_source_id,
+        resource_id=model.resource_id,
+        token_hash=model.token_hash,
+        expires_at=model.expires_at,
+        created_at=model.created_at,
+    )
+
+
 def _reaction_config_record(
     model: ReactionConfigModel, channel_ids: tuple[int, ...]
 ) -> ReactionConfigRecord:
@@ -154,7 +224,6 @@ def _shadow_publication_record(model: ShadowPublicationModel) -> ShadowPublicati
         last_observed_at=model.last_observed_at,
         observation_count=model.observation_count,
         draft_sha256=model.draft_sha256,
-        draft_json=dict(model.draft_json),
         item_count=model.item_count,
         message_count=model.message_count,
         calendar_sync_valid=model.calendar_sync_valid,
@@ -447,6 +516,123 @@ def _audit_record(model: AuditLogModel) -> AuditLogRecord:
     )
 
 
+def _active_in_window(
+    source_ids: tuple[uuid.UUID, ...],
+    *,
+    starts_at: datetime,
+    ends_at: datetime,
+    starts_on: date,
+    ends_on: date,
+) -> Select[tuple[ExternalEventModel]]:
+    # Mirrors PublicationWindow overlap rules; the composer re-checks every row,
+    # so these predicates only have to be a superset that the
+    # (calendar_source_id, deleted_at, starts_*) indexes can bound.
+    timed = and_(
+        ExternalEventModel.is_all_day.is_(False),
+        ExternalEventModel.starts_at < ends_at,
+        or_(
+            ExternalEventModel.ends_at > starts_at,
+            and_(
+                ExternalEventModel.ends_at.is_(None),
+                ExternalEventModel.starts_at >= starts_at,
+            ),
+        ),
+    )
+    all_day = and_(
+        ExternalEventModel.is_all_day.is_(True),
+        ExternalEventModel.starts_on < ends_on,
+        or_(
+            ExternalEventModel.ends_on > starts_on,
+            and_(
+                ExternalEventModel.ends_on.is_(None),
+                ExternalEventModel.starts_on >= starts_on,
+            ),
+        ),
+    )
+    return select(ExternalEventModel).where(
+        ExternalEventModel.calendar_source_id.in_(source_ids),
+        ExternalEventModel.deleted_at.is_(None),
+        ExternalEventModel.status != ExternalEventStatus.CANCELLED.value,
+        or_(timed, all_day),
+    )
+
+
+def _json_rows(query: Select[Any], *order_by: str) -> ScalarSelect[Any]:
+    """Aggregate whole rows of ``query`` into one ordered JSONB array."""
+
+    rows = query.subquery()
+    row = func.to_jsonb(rows.table_valued())
+    aggregated = aggregate_order_by(row, *(rows.c[name] for name in order_by)) if order_by else row
+    return select(
+        func.coalesce(func.jsonb_agg(aggregated), literal([], JSONB), type_=JSONB)
+    ).scalar_subquery()
+
+
+def _json_row(query: Select[Any]) -> ScalarSelect[Any]:
+    rows = query.subquery()
+    return select(type_coerce(func.to_jsonb(rows.table_valued()), JSONB)).scalar_subquery()
+
+
+def _model_from_json(model_type: type[Base], values: dict[str, Any]) -> Any:
+    """Rebuild a detached model from ``to_jsonb`` output so record mappers can be reused."""
+
+    attributes: dict[str, Any] = {}
+    for attribute in sa_inspect(model_type).column_attrs:
+        table_column = attribute.columns[0]
+        value = values[table_column.name]
+        if value is not None:
+            for column_type, decode in _JSON_DECODERS:
+                if isinstance(table_column.type, column_type):
+                    value = decode(value)
+                    break
+        attributes[attribute.key] = value
+    return model_type(**attributes)
+
+
+# JSON carries these as strings; timestamps are normalized to UTC like asyncpg's.
+_JSON_DECODERS: tuple[tuple[type[Any], Callable[[Any], Any]], ...] = (
+    (DateTime, lambda value: datetime.fromisoformat(value).astimezone(UTC)),
+    (Date, date.fromisoformat),
+    (Time, time.fromisoformat),
+    (UuidType, uuid.UUID),
+)
+
+
+def _rows_fingerprint(query: Select[Any], key: str, version: str) -> ScalarSelect[Any]:
+    """Digest the ordered ``key:version`` pairs of ``query``'s rows."""
+
+    rows = query.subquery()
+    return select(
+        func.md5(
+            func.coalesce(
+                func.string_agg(
+                    func.concat(rows.c[key], ":", rows.c[version]),
+                    aggregate_order_by(literal(","), rows.c[key]),
+                ),
+                "",
+            )
+        )
+    ).scalar_subquery()
+
+
+def _version_fingerprint(
+    model: type[ManualEventModel] | type[InfoAnnouncementModel], guild_id: int
+) -> Select[tuple[str]]:
+    # Every write to these rows bumps the version, so ids plus versions
+    # identify the exact list contents without reading the rows.
+    return select(
+        func.md5(
+            func.coalesce(
+                func.string_agg(
+                    func.concat(model.id, ":", model.version),
+                    aggregate_order_by(literal(","), model.id),
+                ),
+                "",
+            )
+        )
+    ).where(model.guild_id == guild_id)
+
+
 class SqlAlchemyGuildConfigRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -580,6 +766,23 @@ class SqlAlchemyCalendarSourceRepository:
             last_sync_error=error_code,
         )
 
+    async def schedule_next_sync(self, source_id: uuid.UUID, *, due_at: datetime) -> None:
+        # The due time is worker bookkeeping, so it does not bump the version
+        # an administrator's pending edit was loaded with.
+        await self._session.execute(
+            update(CalendarSourceModel)
+            .where(CalendarSourceModel.id == source_id)
+            .values(next_sync_due_at=due_at)
+        )
+
+    async def next_sync_due_at(self, *, after: datetime) -> datetime | None:
+        return await self._session.scalar(
+            select(func.min(CalendarSourceModel.next_sync_due_at)).where(
+                CalendarSourceModel.active.is_(True),
+                CalendarSourceModel.next_sync_due_at > after,
+            )
+        )
+
     async def _update_required(self, source_id: uuid.UUID, **values: Any) -> None:
         result = cast(
             CursorResult[Any],
@@ -593,6 +796,271 @@ class SqlAlchemyCalendarSourceRepository:
             raise LookupError(f"calendar source not found: {source_id}")
 
 
+class SqlAlchemyCalendarWatchChannelRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def add(self, record: CalendarWatchChannelRecord) -> None:
+        self._session.add(CalendarWatchChannelModel(**_record_values(record)))
+        await self._session.flush()
+
+    async def get(self, channel_id: uuid.UUID) -> CalendarWatchChannelRecord | None:
+        model = await self._session.get(CalendarWatchChannelModel, channel_id)
+        return None if model is None else _calendar_watch_channel_record(model)
+
+    async def list_all(self) -> list[CalendarWatchChannelRecord]:
+        result = await self._session.scalars(
+            select(CalendarWatchChannelModel).order_by(
+                CalendarWatchChannelModel.calendar_source_id,
+                CalendarWatchChannelModel.expires_at,
+            )
+        )
+        return [_calendar_watch_channel_record(model) for model in result]
+
+    async def delete(self, channel_id: uuid.UUID) -> bool:
+        result = cast(
+            CursorResult[Any],
+            await self._session.execute(
+                delete(CalendarWatchChannelModel).where(CalendarWatchChannelModel.id == channel_id)
+            ),
+        )
+        return result.rowcount == 1
+
+
+_NEVER_REFRESHED = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+class SqlAlchemyDiscordRoleMembershipRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def list_members(
+        self, guild_id: int, role_id: int, *, refreshed_after: datetime
+    ) -> tuple[int, ...] | None:
+        indexed = await self._session.scalar(
+            select(DiscordRoleIndexModel.refreshed_at).where(
+                DiscordRoleIndexModel.guild_id == guild_id,
+                DiscordRoleIndexModel.role_id == role_id,
+            )
+        )
+        if indexed is None or indexed <= refreshed_after:
+            return None
+        result = await self._session.scalars(
+            select(DiscordRoleMemberModel.user_id)
+            .where(
+                DiscordRoleMemberModel.guild_id == guild_id,
+                DiscordRoleMemberModel.role_id == role_id,
+            )
+            .order_by(DiscordRoleMemberModel.user_id)
+        )
+        return tuple(result)
+
+    async def begin_refresh(self, guild_id: int, role_id: int) -> int:
+        # A missing role gets a row that readers still treat as expired, so
+        # member events arriving during the scan are applied and counted.
+        await self._session.execute(
+            postgresql_insert(DiscordRoleIndexModel)
+            .values(guild_id=guild_id, role_id=role_id, refreshed_at=_NEVER_REFRESHED)
+            .on_conflict_do_nothing()
+        )
+        generation = await self._session.scalar(
+            select(DiscordRoleIndexModel.generation).where(
+                DiscordRoleIndexModel.guild_id == guild_id,
+                DiscordRoleIndexModel.role_id == role_id,
+            )
+        )
+        return -1 if generation is None else generation
+
+    async def replace_members(
+        self,
+        guild_id: int,
+        role_id: int,
+        user_ids: tuple[int, ...],
+        *,
+        refreshed_at: datetime,
+        generation: int,
+    ) -> bool:
+        refreshed = await self._session.scalar(
+            update(DiscordRoleIndexModel)
+            .where(
+                DiscordRoleIndexModel.guild_id == guild_id,
+                DiscordRoleIndexModel.role_id == role_id,
+                DiscordRoleIndexModel.generation == generation,
+            )
+            .values(refreshed_at=refreshed_at)
+            .returning(DiscordRoleIndexModel.role_id)
+        )
+        if refreshed is None:
+            return False
+        await self._session.execute(
+            delete(DiscordRoleMemberModel).where(
+                DiscordRoleMemberModel.guild_id == guild_id,
+                DiscordRoleMemberModel.role_id == role_id,
+            )
+        )
+        if user_ids:
+            await self._session.execute(
+                postgresql_insert(DiscordRoleMemberModel)
+                .values(
+                    [
+                        {"guild_id": guild_id, "role_id": role_id, "user_id": user_id}
+                        for user_id in dict.fromkeys(user_ids)
+                    ]
+                )
+                .on_conflict_do_nothing()
+            )
+        return True
+
+    async def apply_member_roles(
+        self, guild_id: int, user_id: int, role_ids: frozenset[int]
+    ) -> None:
+        # Only roles somebody already indexed are maintained; the rest are
+        # loaded on first use by a full refresh. The event cannot tell which
+        # roles a concurrent scan already read, so every indexed role of the
+        # guild moves to a new generation and such a scan is not stored.
+        await self._session.execute(
+            update(DiscordRoleIndexModel)
+            .where(DiscordRoleIndexModel.guild_id == guild_id)
+            .values(generation=DiscordRoleIndexModel.generation + 1)
+        )
+        await self._session.execute(
+            delete(DiscordRoleMemberModel).where(
+                DiscordRoleMemberModel.guild_id == guild_id,
+                DiscordRoleMemberModel.user_id == user_id,
+                DiscordRoleMemberModel.role_id.not_in(role_ids),
+            )
+        )
+        if not role_ids:
+            return
+        await self._session.execute(
+            postgresql_insert(DiscordRoleMemberModel)
+            .from_select(
+                ("guild_id", "role_id", "user_id"),
+                select(
+                    DiscordRoleIndexModel.guild_id,
+                    DiscordRoleIndexModel.role_id,
+                    literal(user_id, BigInteger),
+                ).where(
+                    DiscordRoleIndexModel.guild_id == guild_id,
+                    DiscordRoleIndexModel.role_id.in_(role_ids),
+                ),
+            )
+            .on_conflict_do_nothing()
+        )
+
+    async def invalidate(self, guild_id: int) -> None:
+        await self._session.execute(
+            delete(DiscordRoleIndexModel).where(DiscordRoleIndexModel.guild_id == guild_id)
+        )
+
+
+class SqlAlchemyCalendarSyncRequestRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def enqueue(self, record: CalendarSyncRequestRecord) -> CalendarSyncRequestRecord:
+        values = asdict(record)
+        values["state"] = record.state.value
+        inserted = postgresql_insert(CalendarSyncRequestModel).values(**values)
+        statement = inserted.on_conflict_do_update(
+            index_elements=(CalendarSyncRequestModel.calendar_source_id,),
+            index_where=CalendarSyncRequestModel.state == CalendarSyncRequestState.PENDING.value,
+            set_={
+                "force_full": or_(
+                    CalendarSyncRequestModel.force_full, inserted.excluded.force_full
+                ),
+                "requesters": CalendarSyncRequestModel.requesters + 1,
+            },
+        ).returning(CalendarSyncRequestModel)
+        model = (
+            await self._session.scalars(statement, execution_options={"populate_existing": True})
+        ).one()
+        return _calendar_sync_request_record(model)
+
+    async def get(self, request_id: uuid.UUID) -> CalendarSyncRequestRecord | None:
+        model = await self._session.get(
+            CalendarSyncRequestModel, request_id, populate_existing=True
+        )
+        return None if model is None else _calendar_sync_request_record(model)
+
+    async def claim(
+        self,
+        request_id: uuid.UUID,
+        *,
+        started_at: datetime,
+        stale_before: datetime,
+    ) -> CalendarSyncRequestRecord | None:
+        source_id = (
+            select(CalendarSyncRequestModel.calendar_source_id)
+            .where(CalendarSyncRequestModel.id == request_id)
+            .scalar_subquery()
+        )
+        # A runner that died mid-sync never completes its request; retire it
+        # so the next pending request for the source is not blocked forever.
+        await self._session.execute(
+            update(CalendarSyncRequestModel)
+            .where(
+                CalendarSyncRequestModel.calendar_source_id == source_id,
+                CalendarSyncRequestModel.state == CalendarSyncRequestState.RUNNING.value,
+                CalendarSyncRequestModel.started_at < stale_before,
+            )
+            .values(
+                state=CalendarSyncRequestState.FAILED.value,
+                completed_at=started_at,
+                error_code="CalendarSyncRequestAbandoned",
+            )
+        )
+        running = aliased(CalendarSyncRequestModel)
+        model = (
+            await self._session.scalars(
+                update(CalendarSyncRequestModel)
+                .where(
+                    CalendarSyncRequestModel.id == request_id,
+                    CalendarSyncRequestModel.state == CalendarSyncRequestState.PENDING.value,
+                    ~exists().where(
+                        running.calendar_source_id == CalendarSyncRequestModel.calendar_source_id,
+                        running.state == CalendarSyncRequestState.RUNNING.value,
+                    ),
+                )
+                .values(state=CalendarSyncRequestState.RUNNING.value, started_at=started_at)
+                .returning(CalendarSyncRequestModel),
+                execution_options={"populate_existing": True},
+            )
+        ).one_or_none()
+        return None if model is None else _calendar_sync_request_record(model)
+
+    async def complete(
+        self,
+        request_id: uuid.UUID,
+        *,
+        state: CalendarSyncRequestState,
+        completed_at: datetime,
+        result_value: dict[str, Any] | None = None,
+        error_code: str | None = None,
+    ) -> None:
+        await self._session.execute(
+            update(CalendarSyncRequestModel)
+            .where(
+                CalendarSyncRequestModel.id == request_id,
+                CalendarSyncRequestModel.state == CalendarSyncRequestState.RUNNING.value,
+            )
+            .values(
+                state=state.value,
+                completed_at=completed_at,
+                result_value=result_value,
+                error_code=error_code,
+            )
+        )
+
+    async def list_pending_source_ids(self) -> list[uuid.UUID]:
+        result = await self._session.scalars(
+            select(CalendarSyncRequestModel.calendar_source_id)
+            .where(CalendarSyncRequestModel.state == CalendarSyncRequestState.PENDING.value)
+            .order_by(CalendarSyncRequestModel.requested_at)
+        )
+        return list(result)
+
+
 class SqlAlchemyReactionConfigRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -643,6 +1111,11 @@ class SqlAlchemyReactionConfigRepository:
         return model.version
 
 
+# Transaction-scoped scratch table for the full-sync sweep; it is created on
+# demand in the sync transaction and dropped on commit, so it is not a model.
+_SEEN_SOURCE_KEYS = table("calendar_sync_seen_source_key", column("source_key"))
+
+
 class SqlAlchemyExternalEventRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -670,6 +1143,14 @@ class SqlAlchemyExternalEventRepository:
         )
         return [_external_event_record(model) for model in result]
 
+    async def list_by_source_keys(self, source_keys: tuple[str, ...]) -> list[ExternalEventRecord]:
+        if not source_keys:
+            return []
+        result = await self._session.scalars(
+            select(ExternalEventModel).where(ExternalEventModel.source_key.in_(source_keys))
+        )
+        return [_external_event_record(model) for model in result]
+
     async def list_for_sources(
         self, source_ids: tuple[uuid.UUID, ...]
     ) -> list[ExternalEventRecord]:
@@ -682,68 +1163,145 @@ class SqlAlchemyExternalEventRepository:
         )
         return [_external_event_record(model) for model in result]
 
-    async def upsert_from_sync(self, record: ExternalEventRecord) -> bool:
+    async def list_active_in_window(
+        self,
+        source_ids: tuple[uuid.UUID, ...],
+        *,
+        starts_at: datetime,
+        ends_at: datetime,
+        starts_on: date,
+        ends_on: date,
+    ) -> list[ExternalEventRecord]:
+        if not source_ids:
+            return []
         result = await self._session.scalars(
-            select(ExternalEventModel).where(ExternalEventModel.source_key == record.source_key)
+            _active_in_window(
+                source_ids,
+                starts_at=starts_at,
+                ends_at=ends_at,
+                starts_on=starts_on,
+                ends_on=ends_on,
+            ).order_by(ExternalEventModel.calendar_source_id, ExternalEventModel.source_key)
         )
-        model = result.one_or_none()
-        values = _external_event_values(record)
-        if model is None:
-            self._session.add(ExternalEventModel(**values))
-            await self._session.flush()
-            return True
+        return [_external_event_record(model) for model in result]
 
-        for field_name, value in values.items():
-            if field_name != "id":
-                setattr(model, field_name, value)
-        await self._session.flush()
-        return False
+    async def upsert_many_from_sync(
+        self, records: tuple[ExternalEventRecord, ...]
+    ) -> dict[str, bool]:
+        if not records:
+            return {}
+        if len({record.source_key for record in records}) != len(records):
+            raise ValueError("bulk sync upsert cannot touch one source key twice")
+        statement = postgresql_insert(ExternalEventModel).values(
+            [_external_event_values(record) for record in records]
+        )
+        updated_columns = {
+            column.name: statement.excluded[column.name]
+            for column in ExternalEventModel.__table__.columns
+            if column.name not in {"id", "source_key", "created_at", "updated_at"}
+        }
+        result = await self._session.execute(
+            statement.on_conflict_do_update(
+                index_elements=(ExternalEventModel.source_key,),
+                set_={**updated_columns, "updated_at": func.now()},
+                # A live row with the same provider etag and update time is
+                # already current; it is left untouched and not returned.
+                where=or_(
+                    ExternalEventModel.etag.is_(None),
+                    ExternalEventModel.etag.is_distinct_from(statement.excluded.etag),
+                    ExternalEventModel.provider_updated_at.is_distinct_from(
+                        statement.excluded.provider_updated_at
+                    ),
+                    ExternalEventModel.status.is_distinct_from(statement.excluded.status),
+                    ExternalEventModel.deleted_at.is_not(None),
+                ),
+            ).returning(
+                ExternalEventModel.source_key,
+                # xmax is zero only for tuples created by this statement.
+                literal_column("xmax = 0", Boolean),
+            )
+        )
+        return {source_key: bool(inserted) for source_key, inserted in result.tuples()}
 
-    async def cancel_by_provider_event_id(
-        self,
-        source_id: uuid.UUID,
-        provider_event_id: str,
-        *,
-        synced_at: datetime,
-    ) -> bool:
+    async def mark_many_synced(self, source_keys: tuple[str, ...], *, synced_at: datetime) -> int:
+        if not source_keys:
+            return 0
         result = cast(
             CursorResult[Any],
             await self._session.execute(
                 update(ExternalEventModel)
-                .where(
-                    ExternalEventModel.calendar_source_id == source_id,
-                    ExternalEventModel.provider_event_id == provider_event_id,
-                )
-                .values(
-                    status=ExternalEventStatus.CANCELLED.value,
-                    last_synced_at=synced_at,
-                    deleted_at=synced_at,
-                )
+                .where(ExternalEventModel.source_key.in_(source_keys))
+                # A confirmation is not a content change; updated_at keys the
+                # publication window fingerprint.
+                .values(last_synced_at=synced_at, updated_at=ExternalEventModel.updated_at)
             ),
         )
-        if result.rowcount > 1:
-            raise RuntimeError("provider event identity is not unique within calendar source")
-        return result.rowcount == 1
+        return result.rowcount
 
-    async def mark_missing_deleted(
+    async def cancel_many_by_provider_event_ids(
         self,
         source_id: uuid.UUID,
-        seen_source_keys: set[str],
+        provider_event_ids: tuple[str, ...],
         *,
-        deleted_at: datetime,
-    ) -> int:
-        statement = update(ExternalEventModel).where(
-            ExternalEventModel.calendar_source_id == source_id,
-            ExternalEventModel.deleted_at.is_(None),
+        synced_at: datetime,
+    ) -> frozenset[str]:
+        if not provider_event_ids:
+            return frozenset()
+        result = await self._session.scalars(
+            update(ExternalEventModel)
+            .where(
+                ExternalEventModel.calendar_source_id == source_id,
+                ExternalEventModel.provider_event_id.in_(provider_event_ids),
+            )
+            .values(
+                status=ExternalEventStatus.CANCELLED.value,
+                last_synced_at=synced_at,
+                deleted_at=synced_at,
+            )
+            .returning(ExternalEventModel.provider_event_id)
         )
-        if seen_source_keys:
-            statement = statement.where(ExternalEventModel.source_key.not_in(seen_source_keys))
+        cancelled = list(result)
+        if len(cancelled) != len(set(cancelled)):
+            raise RuntimeError("provider event identity is not unique within calendar source")
+        return frozenset(cancelled)
+
+    async def remember_seen_source_keys(self, source_keys: tuple[str, ...]) -> None:
+        await self._ensure_seen_source_keys()
+        if source_keys:
+            await self._session.execute(
+                postgresql_insert(_SEEN_SOURCE_KEYS)
+                .values([{"source_key": source_key} for source_key in source_keys])
+                .on_conflict_do_nothing()
+            )
+
+    async def mark_missing_deleted(self, source_id: uuid.UUID, *, deleted_at: datetime) -> int:
+        # Rows whose keys were not remembered earlier in this transaction
+        # disappeared from the provider's full listing.
+        await self._ensure_seen_source_keys()
         result = cast(
             CursorResult[Any],
-            await self._session.execute(statement.values(deleted_at=deleted_at)),
+            await self._session.execute(
+                update(ExternalEventModel)
+                .where(
+                    ExternalEventModel.calendar_source_id == source_id,
+                    ExternalEventModel.deleted_at.is_(None),
+                    ~exists().where(
+                        _SEEN_SOURCE_KEYS.c.source_key == ExternalEventModel.source_key
+                    ),
+                )
+                .values(deleted_at=deleted_at)
+            ),
         )
         return result.rowcount
 
+    async def _ensure_seen_source_keys(self) -> None:
+        await self._session.execute(
+            text(
+                "CREATE TEMPORARY TABLE IF NOT EXISTS calendar_sync_seen_source_key "
+                "(source_key text PRIMARY KEY) ON COMMIT DROP"
+            )
+        )
+
     async def mark_deleted(self, event_id: uuid.UUID, deleted_at: datetime) -> bool:
         result = cast(
             CursorResult[Any],
@@ -904,6 +1462,9 @@ class SqlAlchemyManualEventRepository:
         )
         return [_manual_event_record(model) for model in result]
 
+    async def list_fingerprint(self, guild_id: int) -> str:
+        return str(await self._session.scalar(_version_fingerprint(ManualEventModel, guild_id)))
+
 
 class SqlAlchemyInfoAnnouncementRepository:
     def __init__(self, session: AsyncSession) -> None:
@@ -949,6 +1510,169 @@ class SqlAlchemyInfoAnnouncementRepository:
         )
         return [_info_announcement_record(model) for model in result]
 
+    async def list_fingerprint(self, guild_id: int) -> str:
+        return str(
+            await self._session.scalar(_version_fingerprint(InfoAnnouncementModel, guild_id))
+        )
+
+
+class SqlAlchemyPublicationSnapshotRepository:
+    """Compose inputs read as JSON aggregates instead of one query per repository.
+
+    ``load_guild_inputs`` returns everything the slot resolution needs plus the
+    window-independent rows; ``load_window_events`` then returns the events of
+    the resolved window with their overrides. Rows are rebuilt through the same
+    record mappers as the per-table repositories.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def load_guild_inputs(self, guild_id: int) -> PublicationGuildInputs | None:
+        active_sources = select(CalendarSourceModel.id).where(
+            CalendarSourceModel.guild_id == guild_id, CalendarSourceModel.active.is_(True)
+        )
+        statement = select(
+            _json_row(select(GuildConfigModel).where(GuildConfigModel.guild_id == guild_id)),
+            select(func.array_agg(PublicationRunModel.slot_key))
+            .where(
+                PublicationRunModel.guild_id == guild_id,
+                PublicationRunModel.state.in_(SqlAlchemyPublicationRunRepository._COMPLETED_STATES),
+            )
+            .scalar_subquery(),
+            _json_rows(
+                select(CalendarSourceModel).where(CalendarSourceModel.guild_id == guild_id),
+                "priority",
+                "id",
+            ),
+            _json_rows(
+                select(EventSeriesOverrideModel).where(
+                    EventSeriesOverrideModel.calendar_source_id.in_(active_sources)
+                ),
+                "calendar_source_id",
+                "series_key",
+                "effective_from_key",
+                "id",
+            ),
+            _json_rows(
+                select(ManualEventModel).where(ManualEventModel.guild_id == guild_id),
+                "starts_on",
+                "starts_at",
+                "id",
+            ),
+            _json_rows(
+                select(InfoAnnouncementModel).where(InfoAnnouncementModel.guild_id == guild_id),
+                "valid_from",
+                "title",
+                "id",
+            ),
+            _json_row(select(ReactionConfigModel).where(ReactionConfigModel.guild_id == guild_id)),
+            select(
+                func.array_agg(
+                    aggregate_order_by(
+                        ReactionConfigChannelModel.discord_channel_id,
+                        ReactionConfigChannelModel.discord_channel_id,
+                    )
+                )
+            )
+            .where(ReactionConfigChannelModel.guild_id == guild_id)
+            .scalar_subquery(),
+        )
+        row: tuple[Any, ...] = tuple((await self._session.execute(statement)).one())
+        guild, completed, sources, series, manual, info, reactions, channel_ids = row
+        if guild is None:
+            return None
+        return PublicationGuildInputs(
+            guild=_guild_record(_model_from_json(GuildConfigModel, guild)),
+            completed_slot_keys=frozenset(completed or ()),
+            calendar_sources=tuple(
+                _calendar_source_record(_model_from_json(CalendarSourceModel, values))
+                for values in sources
+            ),
+            series_overrides=tuple(
+                _event_series_override_record(_model_from_json(EventSeriesOverrideModel, values))
+                for values in series
+            ),
+            manual_events=tuple(
+                _manual_event_record(_model_from_json(ManualEventModel, values))
+                for values in manual
+            ),
+            info_announcements=tuple(
+                _info_announcement_record(_model_from_json(InfoAnnouncementModel, values))
+                for values in info
+            ),
+            reaction_config=None
+            if reactions is None
+            else _reaction_config_record(
+                _model_from_json(ReactionConfigModel, reactions), tuple(channel_ids or ())
+            ),
+        )
+
+    async def window_fingerprint(
+        self,
+        source_ids: tuple[uuid.UUID, ...],
+        *,
+        starts_at: datetime,
+        ends_at: datetime,
+        starts_on: date,
+        ends_on: date,
+    ) -> str:
+        # Bulk upserts only touch rows whose content changed and sync
+        # confirmations keep updated_at, so this reads the few window rows
+        # through the same indexes as load_window_events.
+        if not source_ids:
+            return ""
+        events = _active_in_window(
+            source_ids, starts_at=starts_at, ends_at=ends_at, starts_on=starts_on, ends_on=ends_on
+        ).cte("window_events")
+        overrides = select(EventOverrideModel).where(
+            EventOverrideModel.external_event_id.in_(select(events.c.id))
+        )
+        statement = select(
+            func.concat_ws(
+                "/",
+                _rows_fingerprint(select(events), "id", "updated_at"),
+                _rows_fingerprint(overrides, "external_event_id", "version"),
+            )
+        )
+        return str(await self._session.scalar(statement))
+
+    async def load_window_events(
+        self,
+        source_ids: tuple[uuid.UUID, ...],
+        *,
+        starts_at: datetime,
+        ends_at: datetime,
+        starts_on: date,
+        ends_on: date,
+    ) -> PublicationWindowEvents:
+        if not source_ids:
+            return PublicationWindowEvents((), ())
+        events = _active_in_window(
+            source_ids, starts_at=starts_at, ends_at=ends_at, starts_on=starts_on, ends_on=ends_on
+        ).cte("window_events")
+        statement = select(
+            _json_rows(select(events), "calendar_source_id", "source_key"),
+            _json_rows(
+                select(EventOverrideModel).where(
+                    EventOverrideModel.external_event_id.in_(select(events.c.id))
+                ),
+                "external_event_id",
+            ),
+        )
+        row: tuple[Any, ...] = tuple((await self._session.execute(statement)).one())
+        event_rows, override_rows = row
+        return PublicationWindowEvents(
+            external_events=tuple(
+                _external_event_record(_model_from_json(ExternalEventModel, values))
+                for values in event_rows
+            ),
+            event_overrides=tuple(
+                _event_override_record(_model_from_json(EventOverrideModel, values))
+                for values in override_rows
+            ),
+        )
+
 
 class SqlAlchemyPublicationRunRepository:
     _COMPLETED_STATES = (
@@ -970,6 +1694,57 @@ class SqlAlchemyPublicationRunRepository:
         )
         return frozenset(result)
 
+    async def compose_fingerprint(self, guild_id: int) -> str:
+        # Every row update writes a new tuple with a new xmin, so count plus the
+        # xmin sum changes on any insert, update or delete, whichever code path
+        # made it. Calendar sources are reduced to the columns the composer
+        # reads because each sync attempt rewrites their status columns. Events
+        # and their overrides are keyed per publication window by
+        # SqlAlchemyPublicationSnapshotRepository.window_fingerprint.
+        statement = text(
+            """
+            SELECT concat_ws(
+                '/',
+                (SELECT xmin::text FROM guild_config WHERE guild_id = :guild_id),
+                (SELECT xmin::text FROM reaction_config WHERE guild_id = :guild_id),
+                (
+                    SELECT md5(coalesce(string_agg(
+                        id::text || ':' || active::text || ':' || priority::text,
+                        ',' ORDER BY id
+                    ), ''))
+                    FROM calendar_source
+                    WHERE guild_id = :guild_id
+                ),
+                (
+                    SELECT count(*) || ':' || coalesce(sum(series.xmin::text::bigint), 0)
+                    FROM event_series_override AS series
+                    JOIN calendar_source AS source ON source.id = series.calendar_source_id
+                    WHERE source.guild_id = :guild_id
+                ),
+                (
+                    SELECT count(*) || ':' || coalesce(sum(xmin::text::bigint), 0)
+                    FROM manual_event
+                    WHERE guild_id = :guild_id
+                ),
+                (
+                    SELECT count(*) || ':' || coalesce(sum(xmin::text::bigint), 0)
+                    FROM info_announcement
+                    WHERE guild_id = :guild_id
+                ),
+                (
+                    SELECT md5(coalesce(string_agg(slot_key, ',' ORDER BY slot_key), ''))
+                    FROM publication_run
+                    WHERE guild_id = :guild_id AND state IN :completed_states
+                )
+            )
+            """
+        ).bindparams(bindparam("completed_states", expanding=True))
+        fingerprint = await self._session.scalar(
+            statement,
+            {"guild_id": guild_id, "completed_states": list(self._COMPLETED_STATES)},
+        )
+        return str(fingerprint)
+
     async def lock_slot(self, guild_id: int, slot_key: str) -> None:
         await self._session.execute(
             text("SELECT pg_advisory_xact_lock(hashtextextended(:lock_key, 0))"),
@@ -1001,12 +1776,25 @@ class SqlAlchemyPublicationRunRepository:
         ).one_or_none()
         return None if model is None else _publication_run_record(model)
 
-    async def list_for_guild(self, guild_id: int, *, limit: int = 50) -> list[PublicationRunRecord]:
+    async def list_for_guild(
+        self,
+        guild_id: int,
+        *,
+        limit: int = 50,
+        before: tuple[datetime, uuid.UUID] | None = None,
+    ) -> list[PublicationRunRecord]:
+        statement = select(PublicationRunModel).where(PublicationRunModel.guild_id == guild_id)
+        if before is not None:
+            statement = statement.where(
+                tuple_(PublicationRunModel.scheduled_for, PublicationRunModel.id)
+                < tuple_(
+                    literal(before[0], DateTime(timezone=True)), literal(before[1], UuidType())
+                )
+            )
         result = await self._session.scalars(
-            select(PublicationRunModel)
-            .where(PublicationRunModel.guild_id == guild_id)
-            .order_by(PublicationRunModel.scheduled_for.desc(), PublicationRunModel.id.desc())
-            .limit(limit)
+            statement.order_by(
+                PublicationRunModel.scheduled_for.desc(), PublicationRunModel.id.desc()
+            ).limit(limit)
         )
         return [_publication_run_record(model) for model in result]
 
@@ -1018,6 +1806,18 @@ class SqlAlchemyPublicationRunRepository:
         )
         return [_publication_item_record(model) for model in result]
 
+    async def list_items_for_runs(
+        self, run_ids: tuple[uuid.UUID, ...]
+    ) -> list[PublicationItemRecord]:
+        if not run_ids:
+            return []
+        result = await self._session.scalars(
+            select(PublicationItemModel)
+            .where(PublicationItemModel.publication_run_id.in_(run_ids))
+            .order_by(PublicationItemModel.publication_run_id, PublicationItemModel.position)
+        )
+        return [_publication_item_record(model) for model in result]
+
     async def add_snapshot(
         self,
         run: PublicationRunRecord,
@@ -1114,10 +1914,23 @@ class SqlAlchemyPublicationRunRepository:
         )
         return [_publication_message_record(model) for model in result]
 
-    async def claim_message(self, message_id: uuid.UUID, *, attempted_at: datetime) -> bool:
-        result = cast(
-            CursorResult[Any],
-            await self._session.execute(
+    async def list_messages_for_runs(
+        self, run_ids: tuple[uuid.UUID, ...]
+    ) -> list[PublicationMessageRecord]:
+        if not run_ids:
+            return []
+        result = await self._session.scalars(
+            select(PublicationMessageModel)
+            .where(PublicationMessageModel.publication_run_id.in_(run_ids))
+            .order_by(PublicationMessageModel.publication_run_id, PublicationMessageModel.position)
+        )
+        return [_publication_message_record(model) for model in result]
+
+    async def claim_message(
+        self, message_id: uuid.UUID, *, attempted_at: datetime
+    ) -> PublicationMessageRecord | None:
+        model = (
+            await self._session.scalars(
                 update(PublicationMessageModel)
                 .where(
                     PublicationMessageModel.id == message_id,
@@ -1135,9 +1948,11 @@ class SqlAlchemyPublicationRunRepository:
                     last_attempt_at=attempted_at,
                     error_detail=None,
                 )
-            ),
-        )
-        return result.rowcount == 1
+                .returning(PublicationMessageModel),
+                execution_options={"populate_existing": True},
+            )
+        ).one_or_none()
+        return None if model is None else _publication_message_record(model)
 
     async def increment_message_attempt(
         self, message_id: uuid.UUID, *, attempted_at: datetime
@@ -1385,6 +2200,14 @@ class SqlAlchemyPublicationRunRepository:
         )
         return [_publication_run_record(model) for model in result]
 
+    async def next_release_at(self, *, after: datetime) -> datetime | None:
+        return await self._session.scalar(
+            select(func.min(PublicationRunModel.release_at)).where(
+                PublicationRunModel.state == PublicationState.WAITING_FOR_RELEASE.value,
+                PublicationRunModel.release_at > after,
+            )
+        )
+
     async def get_waiting_guard(
         self, guild_id: int, *, now: datetime, run_id: uuid.UUID | None = None
     ) -> PublicationRunRecord | None:
@@ -1457,7 +2280,27 @@ class SqlAlchemyShadowPublicationRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
-    async def record(self, capture: ShadowPublicationRecord) -> ShadowPublicationRecord:
+    async def record(
+        self, capture: ShadowPublicationRecord, draft: ShadowPublicationDraftRecord
+    ) -> ShadowPublicationRecord:
+        # Drafts are content addressed: an unchanged draft costs no new JSONB.
+        # The no-op update locks an existing row, so a concurrent orphan sweep
+        # cannot delete it before this capture commits its reference.
+        inserted = postgresql_insert(ShadowPublicationDraftModel).values(
+            sha256=draft.sha256, draft_json=draft.draft_json
+        )
+        await self._session.execute(
+            inserted.on_conflict_do_update(
+                index_elements=(ShadowPublicationDraftModel.sha256,),
+                set_={"sha256": inserted.excluded.sha256},
+            )
+        )
+        previous = await self._session.scalar(
+            select(ShadowPublicationModel.draft_sha256).where(
+                ShadowPublicationModel.guild_id == capture.guild_id,
+                ShadowPublicationModel.slot_key == capture.slot_key,
+            )
+        )
         values = asdict(capture)
         values["warning_codes"] = list(capture.warning_codes)
         statement = (
@@ -1473,7 +2316,6 @@ class SqlAlchemyShadowPublicationRepository:
                     "last_observed_at": capture.last_observed_at,
                     "observation_count": ShadowPublicationModel.observation_count + 1,
                     "draft_sha256": capture.draft_sha256,
-                    "draft_json": capture.draft_json,
                     "item_count": capture.item_count,
                     "message_count": capture.message_count,
                     "calendar_sync_valid": capture.calendar_sync_valid,
@@ -1484,8 +2326,40 @@ class SqlAlchemyShadowPublicationRepository:
             .returning(ShadowPublicationModel)
         )
         model = (await self._session.scalars(statement)).one()
+        if previous is not None and previous != capture.draft_sha256:
+            # A draft locked by another capture is about to be referenced again.
+            orphan = (
+                select(ShadowPublicationDraftModel.sha256)
+                .where(
+                    ShadowPublicationDraftModel.sha256 == previous,
+                    ~exists().where(ShadowPublicationModel.draft_sha256 == previous),
+                )
+                .with_for_update(skip_locked=True)
+            )
+            await self._session.execute(
+                delete(ShadowPublicationDraftModel).where(
+                    ShadowPublicationDraftModel.sha256.in_(orphan.scalar_subquery())
+                )
+            )
         return _shadow_publication_record(model)
 
+    async def get(self, capture_id: uuid.UUID) -> ShadowPublicationRecord | None:
+        model = await self._session.get(ShadowPublicationModel, capture_id)
+        return None if model is None else _shadow_publication_record(model)
+
+    async def list_drafts(self, sha256s: tuple[str, ...]) -> list[ShadowPublicationDraftRecord]:
+        if not sha256s:
+            return []
+        result = await self._session.scalars(
+            select(ShadowPublicationDraftModel).where(
+                ShadowPublicationDraftModel.sha256.in_(sha256s)
+            )
+        )
+        return [
+            ShadowPublicationDraftRecord(sha256=model.sha256, draft_json=dict(model.draft_json))
+            for model in result
+        ]
+
     async def list_for_guild(
         self, guild_id: int, *, limit: int = 20
     ) -> list[ShadowPublicationRecord]:
@@ -1505,19 +2379,36 @@ class SqlAlchemyRuntimeHeartbeatRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
-    async def upsert(self, heartbeat: RuntimeHeartbeatRecord) -> None:
-        await self._session.execute(
-            postgresql_insert(RuntimeHeartbeatModel)
-            .values(**asdict(heartbeat))
-            .on_conflict_do_update(
-                index_elements=(RuntimeHeartbeatModel.id,),
-                set_={
-                    "state": heartbeat.state,
-                    "last_seen_at": heartbeat.last_seen_at,
-                    "details": heartbeat.details,
-                },
-            )
+    async def upsert_many(
+        self, heartbeats: Sequence[RuntimeHeartbeatRecord], *, refresh_before: datetime
+    ) -> int:
+        if not heartbeats:
+            return 0
+        statement = postgresql_insert(RuntimeHeartbeatModel).values(
+            [asdict(heartbeat) for heartbeat in heartbeats]
         )
+        excluded = statement.excluded
+        result = cast(
+            CursorResult[Any],
+            await self._session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=(RuntimeHeartbeatModel.id,),
+                    set_={
+                        "state": excluded.state,
+                        "last_seen_at": excluded.last_seen_at,
+                        "details": excluded.details,
+                    },
+                    # An unchanged row that is still fresh keeps its version,
+                    # so a steady process costs no dead tuple per tick.
+                    where=or_(
+                        RuntimeHeartbeatModel.state != excluded.state,
+                        RuntimeHeartbeatModel.details != excluded.details,
+                        RuntimeHeartbeatModel.last_seen_at < refresh_before,
+                    ),
+                )
+            ),
+        )
+        return result.rowcount
 
     async def list_for_guild(
         self, guild_id: int, *, limit: int = 50
@@ -1531,6 +2422,19 @@ class SqlAlchemyRuntimeHeartbeatRepository:
         return [_runtime_heartbeat_record(model) for model in result]
 
 
+WORKER_WAKEUP_CHANNEL = "domcek_worker_wakeup"
+
+
+class SqlAlchemyWorkerWakeupRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def notify(self, reason: str) -> None:
+        # PostgreSQL delivers the notification only when the transaction
+        # commits, so a rolled back change never wakes the worker.
+        await self._session.execute(select(func.pg_notify(WORKER_WAKEUP_CHANNEL, reason)))
+
+
 class SqlAlchemyIntegrationTaskRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -1879,11 +2783,22 @@ class SqlAlchemyWebSessionRepository:
         model = result.one_or_none()
         return None if model is None else _web_session_record(model)
 
-    async def touch(self, session_id: uuid.UUID, *, seen_at: datetime) -> None:
+    async def touch_many(self, seen: Mapping[uuid.UUID, datetime]) -> None:
+        if not seen:
+            return
+        touched = sa_values(
+            column("id", UuidType()),
+            column("seen_at", DateTime(timezone=True)),
+            name="touched_web_session",
+        ).data(list(seen.items()))
         await self._session.execute(
             update(WebSessionModel)
-            .where(WebSessionModel.id == session_id, WebSessionModel.revoked_at.is_(None))
-            .values(last_seen_at=seen_at)
+            .where(
+                WebSessionModel.id == touched.c.id,
+                WebSessionModel.revoked_at.is_(None),
+                WebSessionModel.last_seen_at < touched.c.seen_at,
+            )
+            .values(last_seen_at=touched.c.seen_at)
         )
 
     async def revoke(self, session_id: uuid.UUID, *, revoked_at: datetime) -> bool:
@@ -1899,18 +2814,31 @@ class SqlAlchemyWebSessionRepository:
 
 
 class SqlAlchemyAuditLogRepository:
+    """Audit rows buffered for the transaction and written as one multi-row insert.
+
+    The unit of work calls ``flush_pending`` before commit; reads flush first so
+    a transaction still sees the entries it added.
+    """
+
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
+        self._pending: list[dict[str, Any]] = []
 
     async def add(self, record: AuditLogRecord) -> None:
         values = _record_values(record)
         values["result"] = record.result.value
         if record.created_at is None:
-            values.pop("created_at")
-        self._session.add(AuditLogModel(**values))
-        await self._session.flush()
+            values["created_at"] = func.now()
+        self._pending.append(values)
+
+    async def flush_pending(self) -> None:
+        if not self._pending:
+            return
+        rows, self._pending = self._pending, []
+        await self._session.execute(postgresql_insert(AuditLogModel).values(rows))
 
     async def list_for_object(self, object_type: str, object_id: str) -> list[AuditLogRecord]:
+        await self.flush_pending()
         result = await self._session.scalars(
             select(AuditLogModel)
             .where(
@@ -1928,6 +2856,7 @@ class SqlAlchemyAuditLogRepository:
         limit: int,
         object_types: tuple[str, ...] | None = None,
     ) -> list[AuditLogRecord]:
+        await self.flush_pending()
         query = select(AuditLogModel).where(AuditLogModel.guild_id == guild_id)
         if object_types is not None:
             query = query.where(AuditLogModel.object_type.in_(object_types))
@@ -1940,6 +2869,7 @@ class SqlAlchemyAuditLogRepository:
 PersistenceRecord = (
     GuildConfigRecord
     | CalendarSourceRecord
+    | CalendarWatchChannelRecord
     | ExternalEventRecord
     | EventOverrideRecord
     | EventSeriesOverrideRecord
@@ -11,7 +11,10 @@ from sqlalchemy.orm.exc import StaleDataError
 from domcek_bot.application.repositories import (
     AuditLogRepository,
     CalendarSourceRepository,
+    CalendarSyncRequestRepository,
+    CalendarWatchChannelRepository,
     ChannelArchiveRequestRepository,
+    DiscordRoleMembershipRepository,
     EventOverrideRepository,
     EventSeriesOverrideRepository,
     ExternalEventRepository,
@@ -20,11 +23,13 @@ from domcek_bot.application.repositories import (
     IntegrationTaskRepository,
     ManualEventRepository,
     PublicationRunRepository,
+    PublicationSnapshotRepository,
     ReactionConfigRepository,
     RuntimeHeartbeatRepository,
     ShadowPublicationRepository,
     UndoOperationRepository,
     WebSessionRepository,
+    WorkerWakeupRepository,
 )
 from domcek_bot.application.unit_of_work import RepositorySet
 from domcek_bot.domain.errors import OptimisticLockError
@@ -32,7 +37,10 @@ from domcek_bot.infrastructure.database import Database
 from domcek_bot.infrastructure.repositories import (
     SqlAlchemyAuditLogRepository,
     SqlAlchemyCalendarSourceRepository,
+    SqlAlchemyCalendarSyncRequestRepository,
+    SqlAlchemyCalendarWatchChannelRepository,
     SqlAlchemyChannelArchiveRequestRepository,
+    SqlAlchemyDiscordRoleMembershipRepository,
     SqlAlchemyEventOverrideRepository,
     SqlAlchemyEventSeriesOverrideRepository,
     SqlAlchemyExternalEventRepository,
@@ -41,11 +49,13 @@ from domcek_bot.infrastructure.repositories import (
     SqlAlchemyIntegrationTaskRepository,
     SqlAlchemyManualEventRepository,
     SqlAlchemyPublicationRunRepository,
+    SqlAlchemyPublicationSnapshotRepository,
     SqlAlchemyReactionConfigRepository,
     SqlAlchemyRuntimeHeartbeatRepository,
     SqlAlchemyShadowPublicationRepository,
     SqlAlchemyUndoOperationRepository,
     SqlAlchemyWebSessionRepository,
+    SqlAlchemyWorkerWakeupRepository,
 )
 
 
@@ -53,15 +63,20 @@ from domcek_bot.infrastructure.repositories import (
 class SqlAlchemyRepositorySet:
     guild_configs: GuildConfigRepository
     calendar_sources: CalendarSourceRepository
+    calendar_watch_channels: CalendarWatchChannelRepository
+    calendar_sync_requests: CalendarSyncRequestRepository
     reaction_configs: ReactionConfigRepository
+    discord_role_members: DiscordRoleMembershipRepository
     external_events: ExternalEventRepository
     event_overrides: EventOverrideRepository
     event_series_overrides: EventSeriesOverrideRepository
     manual_events: ManualEventRepository
     info_announcements: InfoAnnouncementRepository
+    publication_snapshots: PublicationSnapshotRepository
     publication_runs: PublicationRunRepository
     shadow_publications: ShadowPublicationRepository
     runtime_heartbeats: RuntimeHeartbeatRepository
+    worker_wakeups: WorkerWakeupRepository
     integration_tasks: IntegrationTaskRepository
     channel_archive_requests: ChannelArchiveRequestRepository
     undo_operations: UndoOperationRepository
@@ -77,23 +92,30 @@ class SqlAlchemyUnitOfWork:
     async def transaction(self) -> AsyncIterator[RepositorySet]:
         try:
             async with self._database.session() as session, session.begin():
+                audit_logs = SqlAlchemyAuditLogRepository(session)
                 yield SqlAlchemyRepositorySet(
                     guild_configs=SqlAlchemyGuildConfigRepository(session),
                     calendar_sources=SqlAlchemyCalendarSourceRepository(session),
+                    calendar_watch_channels=SqlAlchemyCalendarWatchChannelRepository(session),
+                    calendar_sync_requests=SqlAlchemyCalendarSyncRequestRepository(session),
                     reaction_configs=SqlAlchemyReactionConfigRepository(session),
+                    discord_role_members=SqlAlchemyDiscordRoleMembershipRepository(session),
                     external_events=SqlAlchemyExternalEventRepository(session),
                     event_overrides=SqlAlchemyEventOverrideRepository(session),
                     event_series_overrides=SqlAlchemyEventSeriesOverrideRepository(session),
                     manual_events=SqlAlchemyManualEventRepository(session),
                     info_announcements=SqlAlchemyInfoAnnouncementRepository(session),
+                    publication_snapshots=SqlAlchemyPublicationSnapshotRepository(session),
                     publication_runs=SqlAlchemyPublicationRunRepository(session),
                     shadow_publications=SqlAlchemyShadowPublicationRepository(session),
                     runtime_heartbeats=SqlAlchemyRuntimeHeartbeatRepository(session),
+                    worker_wakeups=SqlAlchemyWorkerWakeupRepository(session),
                     integration_tasks=SqlAlchemyIntegrationTaskRepository(session),
                     channel_archive_requests=SqlAlchemyChannelArchiveRequestRepository(session),
                     undo_operations=SqlAlchemyUndoOperationRepository(session),
                     web_sessions=SqlAlchemyWebSessionRepository(session),
-                    audit_logs=SqlAlchemyAuditLogRepository(session),
+                    audit_logs=audit_logs,
                 )
+                await audit_logs.flush_pending()
         except StaleDataError as exc:
             raise OptimisticLockError("record changed since it was loaded") from exc
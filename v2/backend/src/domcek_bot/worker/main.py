@@ -5,20 +5,34 @@ from __future__ import annotations
 import asyncio
 import signal
 import uuid
+from contextlib import suppress
+from dataclasses import asdict
 from datetime import UTC, datetime, timedelta
+from typing import Any
 
 import structlog
 
 from domcek_bot.application.alerts import AlertCategory, ConfiguredModeratorAlerts
+from domcek_bot.application.calendar.executor import CalendarSyncExecutor
+from domcek_bot.application.calendar.requests import CalendarSyncRequestQueue
+from domcek_bot.application.calendar.scheduling import CalendarSyncCadence
 from domcek_bot.application.calendar.sync import CalendarSyncPolicy, CalendarSyncService
+from domcek_bot.application.calendar.watch import CalendarWatchRenewer
 from domcek_bot.application.operations import RuntimeOperationsService
+from domcek_bot.application.publication.admin_roles import (
+    IndexedGuardDiscordGateway,
+    RoleMembershipIndex,
+)
+from domcek_bot.application.publication.composer import next_guild_slot
 from domcek_bot.application.publication.engine import ModeratorAlertGateway, PublicationEngine
 from domcek_bot.application.publication.guard import PublicationGuardService
 from domcek_bot.application.publication.intro import IntroService
 from domcek_bot.application.publication.scheduler import PublicationScheduler
 from domcek_bot.application.publication.service import PublicationDraftService
 from domcek_bot.application.publication.shadow import ShadowPublicationService
+from domcek_bot.application.wakeups import WorkerWakeupPlanner
 from domcek_bot.config import ProcessKind, PublicationExecutionMode, load_settings
+from domcek_bot.domain.enums import SyncStatus
 from domcek_bot.infrastructure.calendar_factory import build_google_calendar_client
 from domcek_bot.infrastructure.database import Database
 from domcek_bot.infrastructure.discord_publication import (
@@ -26,7 +40,9 @@ from domcek_bot.infrastructure.discord_publication import (
     DiscordHttpPublicationGuardGateway,
     DiscordModeratorAlertGateway,
 )
+from domcek_bot.infrastructure.discord_rate_limit import DiscordRateLimiter
 from domcek_bot.infrastructure.gemini_intro import GeminiIntroGenerator
+from domcek_bot.infrastructure.repositories import WORKER_WAKEUP_CHANNEL
 from domcek_bot.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
 from domcek_bot.logging import configure_logging
 
@@ -77,18 +93,22 @@ class WorkerFinalCalendarSynchronizer:
     def __init__(
         self,
         unit_of_work: SqlAlchemyUnitOfWork,
-        service: CalendarSyncService,
+        executor: CalendarSyncExecutor,
+        cadence: CalendarSyncCadence,
     ) -> None:
         self._unit_of_work = unit_of_work
-        self._service = service
+        self._executor = executor
+        self._cadence = cadence
 
     async def synchronize_guild(self, guild_id: int, *, correlation_id: str) -> bool:
-        return await _sync_active_calendars(
+        succeeded = await _sync_active_calendars(
             self._unit_of_work,
-            self._service,
+            self._executor,
+            self._cadence,
             guild_id=guild_id,
             correlation_id=correlation_id,
         )
+        return succeeded.get(guild_id, False)
 
 
 async def serve() -> None:
@@ -97,20 +117,33 @@ async def serve() -> None:
     database = Database(settings)
     unit_of_work = SqlAlchemyUnitOfWork(database)
     stop_event = asyncio.Event()
+    # Anything that should end the current sleep early sets the wakeup event,
+    # including shutdown.
+    wakeup_event = asyncio.Event()
+
+    def shutdown() -> None:
+        stop_event.set()
+        wakeup_event.set()
+
     loop = asyncio.get_running_loop()
     for shutdown_signal in (signal.SIGINT, signal.SIGTERM):
         try:
-            loop.add_signal_handler(shutdown_signal, stop_event.set)
+            loop.add_signal_handler(shutdown_signal, shutdown)
         except NotImplementedError:  # pragma: no cover - Windows event loop
             pass
 
     token = settings.discord_token_value()
-    discord = DiscordHttpPublicationGateway(bot_token=token)
+    discord_rate_limiter = DiscordRateLimiter()
+    discord = DiscordHttpPublicationGateway(bot_token=token, rate_limiter=discord_rate_limiter)
     guard_discord = DiscordHttpPublicationGuardGateway(
-        bot_token=token, frontend_base_url=settings.frontend_base_url
+        bot_token=token,
+        frontend_base_url=settings.frontend_base_url,
+        rate_limiter=discord_rate_limiter,
     )
     alerts = DiscordModeratorAlertGateway(
-        bot_token=token, frontend_base_url=settings.frontend_base_url
+        bot_token=token,
+        frontend_base_url=settings.frontend_base_url,
+        rate_limiter=discord_rate_limiter,
     )
     calendar_client = build_google_calendar_client(settings)
     intro_key = settings.optional_intro_generator_key()
@@ -148,36 +181,84 @@ async def serve() -> None:
         policy=CalendarSyncPolicy(
             past_horizon=timedelta(days=settings.calendar_sync_past_days),
             future_horizon=timedelta(days=settings.calendar_sync_future_days),
+            stream_pages=settings.calendar_sync_stream_pages,
+            full_sync_partitions=settings.calendar_sync_full_partitions,
         ),
         alerts=CalendarModeratorAlerts(unit_of_work, calendar_alerts),
     )
+    calendar_executor = CalendarSyncExecutor(
+        CalendarSyncRequestQueue(unit_of_work, calendar_sync),
+        max_concurrency=settings.calendar_sync_concurrency,
+        max_concurrency_per_guild=settings.calendar_sync_guild_concurrency,
+    )
+    calendar_cadence = CalendarSyncCadence(
+        base_interval=timedelta(seconds=settings.calendar_sync_interval_seconds),
+        max_interval=timedelta(seconds=settings.calendar_sync_max_interval_seconds),
+        publication_lead=timedelta(minutes=settings.calendar_max_safe_age_minutes),
+        watched_max_interval=timedelta(seconds=settings.calendar_sync_watched_max_interval_seconds)
+        if settings.calendar_watch_webhook_url is not None
+        else None,
+    )
+    calendar_watch = (
+        CalendarWatchRenewer(
+            unit_of_work,
+            calendar_client,
+            address=settings.calendar_watch_webhook_url,
+            ttl=timedelta(hours=settings.calendar_watch_ttl_hours),
+            renew_before=timedelta(minutes=settings.calendar_watch_renew_before_minutes),
+        )
+        if settings.calendar_watch_webhook_url is not None
+        else None
+    )
     scheduler = PublicationScheduler(
         unit_of_work,
         engine,
         publication_alerts,
         grace_period=timedelta(minutes=settings.publication_grace_period_minutes),
         calendar_max_safe_age=timedelta(minutes=settings.calendar_max_safe_age_minutes),
-        final_calendar_sync=WorkerFinalCalendarSynchronizer(unit_of_work, calendar_sync),
+        final_calendar_sync=WorkerFinalCalendarSynchronizer(
+            unit_of_work, calendar_executor, calendar_cadence
+        ),
         reminder_alerts=reminder_alerts,
         reminder_lead=timedelta(hours=settings.publication_reminder_lead_hours),
+        max_concurrency=settings.publication_scheduler_concurrency,
+        guild_timeout=timedelta(seconds=settings.publication_scheduler_guild_timeout_seconds),
     )
     publication_guard = PublicationGuardService(
-        unit_of_work, engine, guard_discord, publication_alerts
+        unit_of_work,
+        engine,
+        IndexedGuardDiscordGateway(
+            guard_discord,
+            RoleMembershipIndex(
+                unit_of_work, ttl=timedelta(minutes=settings.discord_role_index_ttl_minutes)
+            ),
+        ),
+        publication_alerts,
+    )
+    wakeups = WorkerWakeupPlanner(
+        unit_of_work,
+        reminder_lead=timedelta(hours=settings.publication_reminder_lead_hours),
+        publications=settings.publication_execution_mode is PublicationExecutionMode.LIVE,
     )
+    poll_interval = timedelta(seconds=settings.worker_poll_interval_seconds)
+    idle_recheck = timedelta(seconds=settings.worker_idle_recheck_seconds)
 
     await database.ping()
     await logger.ainfo(
         "worker_started",
         publication_execution_mode=settings.publication_execution_mode.value,
     )
+    wakeup_listener_task = asyncio.create_task(
+        _listen_for_wakeups(database, wakeup_event, retry_after=poll_interval)
+    )
     try:
         await _heartbeat_worker(
-            unit_of_work,
             runtime_operations,
             runtime_instance_id,
             runtime_started_at,
             state="running",
             execution_mode=settings.publication_execution_mode,
+            discord_rate_limiter=discord_rate_limiter,
         )
         if settings.publication_execution_mode is PublicationExecutionMode.LIVE:
             await _recover(engine, settings.publication_recovery_stale_seconds)
@@ -186,26 +267,27 @@ async def serve() -> None:
                 "publication_recovery_skipped",
                 publication_execution_mode=settings.publication_execution_mode.value,
             )
-        next_calendar_sync = datetime.min.replace(tzinfo=UTC)
+        next_shadow_capture = datetime.min.replace(tzinfo=UTC)
         while not stop_event.is_set():
+            wakeup_event.clear()
             now = datetime.now(UTC)
-            if now >= next_calendar_sync:
-                async with unit_of_work.transaction() as repositories:
-                    guilds = await repositories.guild_configs.list_all()
-                for guild in guilds:
-                    sync_succeeded = await _sync_active_calendars(
-                        unit_of_work,
-                        calendar_sync,
-                        guild_id=guild.guild_id,
+            if calendar_watch is not None:
+                await _renew_calendar_watches(calendar_watch)
+            sync_succeeded = await _sync_active_calendars(
+                unit_of_work, calendar_executor, calendar_cadence, due_before=now
+            )
+            if (
+                settings.publication_execution_mode is PublicationExecutionMode.SHADOW
+                and now >= next_shadow_capture
+            ):
+                for guild_id, guild_sync_succeeded in sync_succeeded.items():
+                    await _capture_shadow_publication(
+                        shadow_publications,
+                        guild_id,
+                        now,
+                        calendar_sync_succeeded=guild_sync_succeeded,
                     )
-                    if settings.publication_execution_mode is PublicationExecutionMode.SHADOW:
-                        await _capture_shadow_publication(
-                            shadow_publications,
-                            guild.guild_id,
-                            now,
-                            calendar_sync_succeeded=sync_succeeded,
-                        )
-                next_calendar_sync = now + timedelta(
+                next_shadow_capture = now + timedelta(
                     seconds=settings.calendar_sync_interval_seconds
                 )
             if settings.publication_execution_mode is PublicationExecutionMode.LIVE:
@@ -215,27 +297,37 @@ async def serve() -> None:
                 )
                 await _run_scheduler(scheduler, publication_guard)
             await _heartbeat_worker(
-                unit_of_work,
                 runtime_operations,
                 runtime_instance_id,
                 runtime_started_at,
                 state="running",
                 execution_mode=settings.publication_execution_mode,
             )
-            try:
-                await asyncio.wait_for(
-                    stop_event.wait(), timeout=settings.worker_poll_interval_seconds
-                )
-            except TimeoutError:
+            deadline = await _next_wakeup(
+                wakeups, now, idle_recheck=idle_recheck, retry_after=poll_interval
+            )
+            if settings.publication_execution_mode is PublicationExecutionMode.SHADOW:
+                deadline = min(deadline, next_shadow_capture)
+            while await _sleep_until(deadline, wakeup_event, max_sleep=poll_interval):
                 await database.ping()
+                await _heartbeat_worker(
+                    runtime_operations,
+                    runtime_instance_id,
+                    runtime_started_at,
+                    state="running",
+                    execution_mode=settings.publication_execution_mode,
+                )
     finally:
+        wakeup_listener_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await wakeup_listener_task
         await _heartbeat_worker(
-            unit_of_work,
             runtime_operations,
             runtime_instance_id,
             runtime_started_at,
             state="stopped",
             execution_mode=settings.publication_execution_mode,
+            discord_rate_limiter=discord_rate_limiter,
         )
         if intro_generator is not None:
             await intro_generator.close()
@@ -247,8 +339,68 @@ async def serve() -> None:
         await logger.ainfo("worker_stopped")
 
 
+async def _listen_for_wakeups(
+    database: Database, wakeup_event: asyncio.Event, *, retry_after: timedelta
+) -> None:
+    """Keep the worker subscribed to wakeup notifications until cancelled."""
+
+    subscribed_before = False
+    while True:
+        try:
+            async with database.listen(
+                WORKER_WAKEUP_CHANNEL, lambda _reason: wakeup_event.set()
+            ) as lost:
+                # Notifications sent while resubscribing are gone; a fresh
+                # pass over the stored schedule covers whatever they announced.
+                if subscribed_before:
+                    wakeup_event.set()
+                subscribed_before = True
+                await lost.wait()
+            await logger.awarning("worker_wakeup_listener_lost")
+        except Exception as exc:
+            await logger.awarning("worker_wakeup_listener_failed", error_type=type(exc).__name__)
+        await asyncio.sleep(retry_after.total_seconds())
+
+
+async def _next_wakeup(
+    planner: WorkerWakeupPlanner,
+    now: datetime,
+    *,
+    idle_recheck: timedelta,
+    retry_after: timedelta,
+) -> datetime:
+    try:
+        planned = await planner.next_wakeup(now)
+    except Exception as exc:
+        await logger.awarning("worker_wakeup_plan_failed", error_type=type(exc).__name__)
+        return now + retry_after
+    # The idle recheck also retries work that failed and is no longer
+    # announced by a future deadline.
+    return min(planned, now + idle_recheck) if planned is not None else now + idle_recheck
+
+
+async def _sleep_until(
+    deadline: datetime, wakeup_event: asyncio.Event, *, max_sleep: timedelta
+) -> bool:
+    """Sleep towards ``deadline`` for at most ``max_sleep``.
+
+    Returns ``True`` when the worker is still idle afterwards and only needs to
+    report liveness before sleeping again, ``False`` when it should run a pass.
+    """
+
+    remaining = deadline - datetime.now(UTC)
+    if remaining <= timedelta(0) or wakeup_event.is_set():
+        return False
+    try:
+        await asyncio.wait_for(
+            wakeup_event.wait(), timeout=min(remaining, max_sleep).total_seconds()
+        )
+    except TimeoutError:
+        return remaining > max_sleep
+    return False
+
+
 async def _heartbeat_worker(
-    unit_of_work: SqlAlchemyUnitOfWork,
     operations: RuntimeOperationsService,
     instance_id: uuid.UUID,
     started_at: datetime,
@@ -256,60 +408,130 @@ async def _heartbeat_worker(
     state: str,
     execution_mode: PublicationExecutionMode,
     observed_at: datetime | None = None,
+    discord_rate_limiter: DiscordRateLimiter | None = None,
 ) -> None:
+    details: dict[str, Any] = {"publication_execution_mode": execution_mode.value}
+    if discord_rate_limiter is not None:
+        details["discord_rate_limits"] = asdict(discord_rate_limiter.stats())
     try:
-        async with unit_of_work.transaction() as repositories:
-            guilds = await repositories.guild_configs.list_all()
-        for guild in guilds:
-            await operations.heartbeat(
-                guild_id=guild.guild_id,
-                process_name="worker",
-                instance_id=instance_id,
-                state=state,
-                started_at=started_at,
-                observed_at=observed_at,
-                details={"publication_execution_mode": execution_mode.value},
-            )
+        await operations.heartbeat_guilds(
+            guild_ids=None,
+            process_name="worker",
+            instance_id=instance_id,
+            state=state,
+            started_at=started_at,
+            observed_at=observed_at,
+            details=details,
+        )
     except Exception as exc:
         await logger.awarning("worker_runtime_heartbeat_failed", error_type=type(exc).__name__)
 
 
 async def _sync_active_calendars(
     unit_of_work: SqlAlchemyUnitOfWork,
-    service: CalendarSyncService,
+    executor: CalendarSyncExecutor,
+    cadence: CalendarSyncCadence,
     *,
     guild_id: int | None = None,
+    due_before: datetime | None = None,
     correlation_id: str | None = None,
-) -> bool:
+) -> dict[int, bool]:
+    """Synchronize active sources that are due and schedule their next run.
+
+    Without ``due_before`` every active source is synchronized. The result says
+    per guild whether all its active sources are currently synchronized.
+    """
+
     async with unit_of_work.transaction() as repositories:
-        guilds = await repositories.guild_configs.list_all()
+        guilds = [
+            guild
+            for guild in await repositories.guild_configs.list_all()
+            if guild_id is None or guild.guild_id == guild_id
+        ]
         sources = [
             source
             for guild in guilds
-            if guild_id is None or guild.guild_id == guild_id
             for source in await repositories.calendar_sources.list_for_guild(guild.guild_id)
             if source.active
         ]
-    all_succeeded = bool(sources)
+        channels = await repositories.calendar_watch_channels.list_all()
+        requested = set(await repositories.calendar_sync_requests.list_pending_source_ids())
+    # Queued requests nobody is waiting on any more are drained with the due
+    # sources; the executor joins them instead of starting a second sync.
+    due = [
+        source
+        for source in sources
+        if due_before is None
+        or source.next_sync_due_at is None
+        or source.next_sync_due_at <= due_before
+        or source.id in requested
+    ]
+    # A guild without an active source has no fresh calendar data to vouch for;
+    # sources that are not due yet report the outcome of their last sync.
+    succeeded = {guild.guild_id: False for guild in guilds}
+    succeeded.update({source.guild_id: True for source in sources})
+    due_ids = {source.id for source in due}
     for source in sources:
-        try:
-            result = await service.synchronize(source.id)
+        if source.id not in due_ids and source.sync_status is not SyncStatus.SUCCEEDED:
+            succeeded[source.guild_id] = False
+    if not due:
+        return succeeded
+
+    outcomes = await executor.run(due)
+    for outcome in outcomes:
+        if outcome.result is not None:
             await logger.ainfo(
                 "calendar_sync_completed",
-                source_id=str(source.id),
+                source_id=str(outcome.source_id),
                 correlation_id=correlation_id,
-                mode=result.mode.value,
-                received=result.received,
+                mode=outcome.result.mode.value,
+                received=outcome.result.received,
             )
-        except Exception as exc:
-            all_succeeded = False
+        else:
+            succeeded[outcome.guild_id] = False
             await logger.aerror(
                 "calendar_sync_failed",
-                source_id=str(source.id),
+                source_id=str(outcome.source_id),
                 correlation_id=correlation_id,
-                error_type=type(exc).__name__,
+                error_type=type(outcome.error).__name__,
             )
-    return all_succeeded
+
+    now = datetime.now(UTC)
+    slots = {guild.guild_id: next_guild_slot(guild, now, frozenset()).instant for guild in guilds}
+    watched = {channel.calendar_source_id for channel in channels if channel.expires_at > now}
+    try:
+        async with unit_of_work.transaction() as repositories:
+            for source, outcome in zip(due, outcomes, strict=True):
+                await repositories.calendar_sources.schedule_next_sync(
+                    source.id,
+                    due_at=cadence.next_due(
+                        source,
+                        outcome.result,
+                        now=now,
+                        next_publication_at=slots[source.guild_id],
+                        watched=source.id in watched,
+                    ),
+                )
+    except Exception as exc:
+        # Unscheduled sources stay due and are retried on the next poll.
+        await logger.awarning("calendar_sync_schedule_failed", error_type=type(exc).__name__)
+    return succeeded
+
+
+async def _renew_calendar_watches(renewer: CalendarWatchRenewer) -> None:
+    try:
+        renewal = await renewer.renew_due()
+    except Exception as exc:
+        # Without live channels the sources keep their polling cadence.
+        await logger.awarning("calendar_watch_renewal_failed", error_type=type(exc).__name__)
+        return
+    if renewal.created or renewal.stopped or renewal.failed:
+        await logger.ainfo(
+            "calendar_watch_renewed",
+            created=renewal.created,
+            stopped=renewal.stopped,
+            failed=renewal.failed,
+        )
 
 
 async def _recover(engine: PublicationEngine, stale_seconds: int) -> None:
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import uuid
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
 from datetime import UTC, date, datetime, timedelta
 
 import pytest
@@ -501,3 +502,299 @@ async def test_recent_running_sync_is_rejected_but_expired_lease_can_be_taken_ov
 
     assert result.mode is CalendarSyncMode.FULL
     assert len(takeover_client.requests) == 1
+
+
+async def test_batched_apply_keeps_counters_and_order_exact(database: Database) -> None:
+    source = _source(sync_token="old-token", sync_token_query_key="query-key-v1")
+    uow = await _seed_source(database, source)
+    known = normalize_provider_event(_timed_event("known-id", title="Známa"), source, synced_at=NOW)
+    async with uow.transaction() as transaction:
+        await transaction.external_events.add(known)
+
+    client = ScriptedCalendarClient(
+        [
+            CalendarEventPage(
+                events=(
+                    _timed_event("new-1", title="Nová 1"),
+                    _timed_event("known-id", title="Aktualizovaná"),
+                    _timed_event("new-2", title="Nová 2"),
+                    _cancelled("new-2"),
+                    _timed_event("new-1", title="Nová 1 znova"),
+                    _cancelled("unknown-id"),
+                    _cancelled("known-id"),
+                ),
+                next_page_token=None,
+                next_sync_token="new-token",
+            )
+        ]
+    )
+    result = await CalendarSyncService(
+        uow,
+        client,
+        clock=lambda: NOW,
+        policy=CalendarSyncPolicy(apply_batch_size=2),
+    ).synchronize(source.id)
+
+    assert result.created == 2
+    assert result.updated == 2
+    assert result.cancelled == 2
+    assert result.ignored_cancellations == 1
+    async with uow.transaction() as transaction:
+        events = await transaction.external_events.list_for_source(source.id)
+    by_id = {event.provider_event_id: event for event in events}
+    assert by_id["new-1"].source_title == "Nová 1 znova"
+    assert by_id["new-1"].deleted_at is None
+    assert by_id["new-2"].status is ExternalEventStatus.CANCELLED
+    assert by_id["known-id"].id == known.id
+    assert by_id["known-id"].status is ExternalEventStatus.CANCELLED
+
+
+class ObservingCalendarClient(ScriptedCalendarClient):
+    def __init__(
+        self,
+        script: list[CalendarEventPage | Exception],
+        observe: Callable[[], Awaitable[None]],
+    ) -> None:
+        super().__init__(script)
+        self._observe = observe
+
+    async def list_events(
+        self,
+        calendar_id: str,
+        *,
+        page_token: str | None = None,
+        sync_token: str | None = None,
+        time_min: datetime | None = None,
+        time_max: datetime | None = None,
+    ) -> CalendarEventPage:
+        if page_token is not None:
+            await self._observe()
+        return await super().list_events(
+            calendar_id,
+            page_token=page_token,
+            sync_token=sync_token,
+            time_min=time_min,
+            time_max=time_max,
+        )
+
+
+async def test_streamed_full_sync_is_invisible_until_commit(database: Database) -> None:
+    source = _source()
+    uow = await _seed_source(database, source)
+    stale = normalize_provider_event(
+        _timed_event("stale-id", title="Stará"), source, synced_at=NOW - timedelta(days=1)
+    )
+    async with uow.transaction() as transaction:
+        await transaction.external_events.add(stale)
+    observed: list[set[str]] = []
+
+    async def observe() -> None:
+        async with uow.transaction() as transaction:
+            events = await transaction.external_events.list_for_sources((source.id,))
+        observed.append({event.provider_event_id for event in events if event.deleted_at is None})
+
+    client = ObservingCalendarClient(
+        [
+            CalendarEventPage(
+                events=(_timed_event("event-1", title="Prvá"),),
+                next_page_token="page-2",
+                next_sync_token=None,
+            ),
+            CalendarEventPage(
+                events=(_all_day_event("event-2"),),
+                next_page_token=None,
+                next_sync_token="sync-token-1",
+            ),
+        ],
+        observe,
+    )
+    result = await CalendarSyncService(
+        uow, client, clock=lambda: NOW, policy=CalendarSyncPolicy(stream_pages=True)
+    ).synchronize(source.id)
+
+    assert observed == [{"stale-id"}]
+    assert result.pages == 2
+    assert result.received == 2
+    assert result.created == 2
+    assert result.missing_marked_deleted == 1
+    async with uow.transaction() as transaction:
+        events = await transaction.external_events.list_for_source(source.id)
+    by_provider_id = {event.provider_event_id: event for event in events}
+    assert by_provider_id["stale-id"].deleted_at == NOW
+    assert by_provider_id["event-1"].deleted_at is None
+    assert by_provider_id["event-2"].deleted_at is None
+
+
+async def test_streamed_sync_failure_rolls_back_applied_pages(database: Database) -> None:
+    source = _source()
+    uow = await _seed_source(database, source)
+    client = ScriptedCalendarClient(
+        [
+            CalendarEventPage(
+                events=(_timed_event("event-1", title="Nesmie sa uložiť"),),
+                next_page_token="page-2",
+                next_sync_token=None,
+            ),
+            CalendarTemporaryError("provider unavailable"),
+        ]
+    )
+
+    with pytest.raises(CalendarTemporaryError):
+        await CalendarSyncService(
+            uow, client, clock=lambda: NOW, policy=CalendarSyncPolicy(stream_pages=True)
+        ).synchronize(source.id)
+
+    async with uow.transaction() as transaction:
+        stored_source = await transaction.calendar_sources.get(source.id)
+        events = await transaction.external_events.list_for_source(source.id)
+    assert stored_source is not None
+    assert stored_source.sync_status is SyncStatus.FAILED
+    assert stored_source.sync_token is None
+    assert events == []
+
+
+async def test_unchanged_provider_rows_only_refresh_last_synced_at(database: Database) -> None:
+    source = _source(sync_token="old-token", sync_token_query_key="query-key-v1")
+    uow = await _seed_source(database, source)
+    current = normalize_provider_event(
+        _timed_event("current-id", title="Aktuálna"), source, synced_at=NOW - timedelta(hours=1)
+    )
+    restored = normalize_provider_event(
+        _timed_event("restored-id", title="Obnovená"), source, synced_at=NOW - timedelta(hours=1)
+    )
+    async with uow.transaction() as transaction:
+        await transaction.external_events.add(current)
+        await transaction.external_events.add(restored)
+        await transaction.external_events.mark_deleted(restored.id, NOW - timedelta(hours=1))
+    # A column changed behind the provider's back proves the row was not rewritten.
+    async with database.transaction() as connection:
+        await connection.execute(
+            text("UPDATE external_event SET source_title = 'Lokálne' WHERE id = :id"),
+            {"id": current.id},
+        )
+
+    client = ScriptedCalendarClient(
+        [
+            CalendarEventPage(
+                events=(
+                    _timed_event("current-id", title="Aktuálna"),
+                    _timed_event("restored-id", title="Obnovená"),
+                ),
+                next_page_token=None,
+                next_sync_token="new-token",
+            )
+        ]
+    )
+    result = await CalendarSyncService(uow, client, clock=lambda: NOW).synchronize(source.id)
+
+    assert result.unchanged == 1
+    assert result.updated == 1
+    async with uow.transaction() as transaction:
+        events = await transaction.external_events.list_for_source(source.id)
+    by_id = {event.provider_event_id: event for event in events}
+    assert by_id["current-id"].last_synced_at == NOW
+    assert by_id["current-id"].source_title == "Lokálne"
+    assert by_id["restored-id"].deleted_at is None
+
+
+class SlicedCalendarClient(ScriptedCalendarClient):
+    def __init__(self, pages_by_time_min: dict[datetime, CalendarEventPage]) -> None:
+        super().__init__([])
+        self._pages_by_time_min = pages_by_time_min
+
+    async def list_events(
+        self,
+        calendar_id: str,
+        *,
+        page_token: str | None = None,
+        sync_token: str | None = None,
+        time_min: datetime | None = None,
+        time_max: datetime | None = None,
+    ) -> CalendarEventPage:
+        self.requests.append({"time_min": time_min, "time_max": time_max})
+        assert time_min is not None
+        return self._pages_by_time_min[time_min]
+
+
+async def test_partitioned_full_sync_merges_slices_and_takes_token_first(
+    database: Database,
+) -> None:
+    source = _source()
+    uow = await _seed_source(database, source)
+    past, future = timedelta(days=30), timedelta(days=400)
+    boundary = NOW - past + (past + future) / 2
+    spanning_old = _timed_event("spanning-id", title="Stará verzia", start=boundary)
+    spanning_new = ProviderCalendarEvent(
+        provider_event_id="spanning-id",
+        status=ExternalEventStatus.CONFIRMED,
+        title="Nová verzia",
+        start=spanning_old.start,
+        end=spanning_old.end,
+        updated_at=NOW + timedelta(minutes=1),
+        etag="etag-new",
+    )
+    client = SlicedCalendarClient(
+        {
+            NOW + future: CalendarEventPage((), None, "probe-token"),
+            NOW - past: CalendarEventPage(
+                (_timed_event("early-id", title="Skorá"), spanning_old), None, "slice-1"
+            ),
+            boundary: CalendarEventPage((spanning_new,), None, "slice-2"),
+        }
+    )
+
+    result = await CalendarSyncService(
+        uow,
+        client,
+        clock=lambda: NOW,
+        policy=CalendarSyncPolicy(past_horizon=past, future_horizon=future, full_sync_partitions=2),
+    ).synchronize(source.id)
+
+    assert client.requests[0] == {
+        "time_min": NOW + future,
+        "time_max": NOW + future + timedelta(minutes=1),
+    }
+    assert {request["time_min"] for request in client.requests[1:]} == {NOW - past, boundary}
+    assert result.mode is CalendarSyncMode.FULL
+    assert result.pages == 3
+    assert result.received == 2
+    assert result.created == 2
+    async with uow.transaction() as transaction:
+        stored_source = await transaction.calendar_sources.get(source.id)
+        events = await transaction.external_events.list_for_source(source.id)
+    assert stored_source is not None
+    assert stored_source.sync_token == "probe-token"
+    by_id = {event.provider_event_id: event for event in events}
+    assert by_id["spanning-id"].source_title == "Nová verzia"
+
+
+async def test_cancelled_sync_releases_its_lease_without_alerting(database: Database) -> None:
+    source = _source()
+    uow = await _seed_source(database, source)
+    alerts = CapturingAlerts()
+
+    async def hang() -> None:
+        await asyncio.Event().wait()
+
+    client = ObservingCalendarClient(
+        [
+            CalendarEventPage(
+                events=(_timed_event("event-1", title="Prvá"),),
+                next_page_token="page-2",
+                next_sync_token=None,
+            ),
+        ],
+        hang,
+    )
+    service = CalendarSyncService(uow, client, clock=lambda: NOW, alerts=alerts)
+
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(0.1):
+            await service.synchronize(source.id)
+
+    async with uow.transaction() as transaction:
+        stored_source = await transaction.calendar_sources.get(source.id)
+    assert stored_source is not None
+    assert stored_source.sync_status is SyncStatus.FAILED
+    assert stored_source.last_sync_error == "CalendarSyncCancelled"
+    assert alerts.alerts == []
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import uuid
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from domcek_bot.application.calendar.contracts import CalendarTemporaryError
+from domcek_bot.application.calendar.requests import (
+    CalendarSyncRequestFailed,
+    CalendarSyncRequestQueue,
+)
+from domcek_bot.application.calendar.sync import CalendarSyncMode, CalendarSyncResult
+from domcek_bot.application.records import (
+    CalendarSourceRecord,
+    CalendarSyncRequestRecord,
+    GuildConfigRecord,
+)
+from domcek_bot.config import Settings
+from domcek_bot.domain.enums import CalendarSyncRequestState
+from domcek_bot.infrastructure.database import Database
+from domcek_bot.infrastructure.models import Base
+from domcek_bot.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+pytestmark = pytest.mark.skipif(
+    "TEST_DATABASE_URL" not in os.environ,
+    reason="integration database not configured",
+)
+
+GUILD_ID = 1535774834955391047
+NOW = datetime(2026, 8, 9, 18, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+async def database() -> AsyncIterator[Database]:
+    database = Database(Settings(database_url=os.environ["TEST_DATABASE_URL"]))
+    table_names = ", ".join(f'"{table.name}"' for table in Base.metadata.sorted_tables)
+    async with database.transaction() as connection:
+        await connection.execute(text(f"TRUNCATE TABLE {table_names} CASCADE"))
+    try:
+        yield database
+    finally:
+        async with database.transaction() as connection:
+            await connection.execute(text(f"TRUNCATE TABLE {table_names} CASCADE"))
+        await database.close()
+
+
+class GatedSynchronizer:
+    def __init__(self, *, error: Exception | None = None) -> None:
+        self.calls: list[tuple[uuid.UUID, bool]] = []
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self._error = error
+
+    async def synchronize(
+        self, source_id: uuid.UUID, *, force_full: bool = False
+    ) -> CalendarSyncResult:
+        self.calls.append((source_id, force_full))
+        self.started.set()
+        await self.release.wait()
+        if self._error is not None:
+            raise self._error
+        return CalendarSyncResult(
+            source_id=source_id,
+            mode=CalendarSyncMode.FULL if force_full else CalendarSyncMode.INCREMENTAL,
+            pages=1,
+            received=3,
+            created=1,
+            updated=1,
+            unchanged=1,
+            cancelled=0,
+            ignored_cancellations=0,
+            missing_marked_deleted=0,
+            series_identity_warnings=0,
+            completed_at=NOW,
+        )
+
+
+async def _seed(database: Database) -> tuple[SqlAlchemyUnitOfWork, uuid.UUID]:
+    uow = SqlAlchemyUnitOfWork(database)
+    source_id = uuid.uuid4()
+    async with uow.transaction() as transaction:
+        await transaction.guild_configs.add(GuildConfigRecord(guild_id=GUILD_ID))
+        await transaction.calendar_sources.add(
+            CalendarSourceRecord(
+                id=source_id,
+                guild_id=GUILD_ID,
+                provider="google",
+                external_calendar_id="calendar@example.test",
+                display_name="Test calendar",
+            )
+        )
+    return uow, source_id
+
+
+def _queue(uow: SqlAlchemyUnitOfWork, synchronizer: GatedSynchronizer) -> CalendarSyncRequestQueue:
+    return CalendarSyncRequestQueue(uow, synchronizer, poll_interval=0.01)
+
+
+async def test_concurrent_requests_share_one_execution(database: Database) -> None:
+    uow, source_id = await _seed(database)
+    synchronizer = GatedSynchronizer()
+    queue = _queue(uow, synchronizer)
+
+    first = await queue.request(source_id)
+    second = await queue.request(source_id, force_full=True)
+    waiters = [asyncio.create_task(queue.wait(first.id)) for _ in range(3)]
+    await synchronizer.started.wait()
+    synchronizer.release.set()
+    results = await asyncio.gather(*waiters)
+    stored = await queue.status(first.id)
+
+    assert second.id == first.id
+    assert second.requesters == 2
+    assert synchronizer.calls == [(source_id, True)]
+    assert {result.mode for result in results} == {CalendarSyncMode.FULL}
+    assert results[0] == results[1] == results[2]
+    assert stored.state is CalendarSyncRequestState.SUCCEEDED
+
+
+async def test_request_during_running_sync_queues_behind_it(database: Database) -> None:
+    uow, source_id = await _seed(database)
+    synchronizer = GatedSynchronizer()
+    queue = _queue(uow, synchronizer)
+
+    running = asyncio.create_task(queue.synchronize(source_id))
+    await synchronizer.started.wait()
+    follow_up = asyncio.create_task(queue.synchronize(source_id))
+    await asyncio.sleep(0.05)
+    assert len(synchronizer.calls) == 1
+    synchronizer.release.set()
+    await asyncio.gather(running, follow_up)
+
+    assert len(synchronizer.calls) == 2
+
+
+async def test_failure_reaches_every_waiter(database: Database) -> None:
+    uow, source_id = await _seed(database)
+    synchronizer = GatedSynchronizer(error=CalendarTemporaryError("provider unavailable"))
+    queue = _queue(uow, synchronizer)
+
+    request = await queue.request(source_id)
+    runner = asyncio.create_task(queue.wait(request.id))
+    await synchronizer.started.wait()
+    observer = asyncio.create_task(queue.wait(request.id))
+    synchronizer.release.set()
+
+    with pytest.raises(CalendarTemporaryError):
+        await runner
+    with pytest.raises(CalendarSyncRequestFailed) as failure:
+        await observer
+    assert failure.value.error_code == "CalendarTemporaryError"
+
+
+async def test_abandoned_running_request_does_not_block_the_source(database: Database) -> None:
+    uow, source_id = await _seed(database)
+    async with uow.transaction() as transaction:
+        await transaction.calendar_sync_requests.enqueue(
+            CalendarSyncRequestRecord(
+                id=uuid.uuid4(),
+                calendar_source_id=source_id,
+                state=CalendarSyncRequestState.RUNNING,
+                requested_at=NOW - timedelta(hours=1),
+                started_at=NOW - timedelta(hours=1),
+            )
+        )
+    synchronizer = GatedSynchronizer()
+    synchronizer.release.set()
+
+    result = await _queue(uow, synchronizer).synchronize(source_id)
+
+    assert result.source_id == source_id
+    assert len(synchronizer.calls) == 1
+
+
+async def test_cancelled_execution_fails_the_request(database: Database) -> None:
+    uow, source_id = await _seed(database)
+    synchronizer = GatedSynchronizer()
+    queue = _queue(uow, synchronizer)
+
+    request = await queue.request(source_id)
+    runner = asyncio.create_task(queue.wait(request.id))
+    await synchronizer.started.wait()
+    runner.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await runner
+    stored = await queue.status(request.id)
+
+    assert stored.state is CalendarSyncRequestState.FAILED
+    assert stored.error_code == "CalendarSyncCancelled"
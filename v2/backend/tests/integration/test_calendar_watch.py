@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+
+import httpx
+import pytest
+from sqlalchemy import text
+
+from domcek_bot.application.calendar.watch import (
+    CalendarNotificationReceiver,
+    CalendarWatchRenewer,
+)
+from domcek_bot.application.records import CalendarSourceRecord, GuildConfigRecord
+from domcek_bot.config import Settings
+from domcek_bot.infrastructure.database import Database
+from domcek_bot.infrastructure.google_calendar import GoogleCalendarClient
+from domcek_bot.infrastructure.models import Base
+from domcek_bot.infrastructure.repositories import WORKER_WAKEUP_CHANNEL
+from domcek_bot.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+pytestmark = pytest.mark.skipif(
+    "TEST_DATABASE_URL" not in os.environ,
+    reason="integration database not configured",
+)
+
+GUILD_ID = 1535774834955391047
+NOW = datetime(2026, 8, 9, 18, 0, tzinfo=UTC)
+ADDRESS = "https://carlo.example.test/api/v1/calendar/notifications"
+
+
+@pytest.fixture
+async def database() -> AsyncIterator[Database]:
+    database = Database(Settings(database_url=os.environ["TEST_DATABASE_URL"]))
+    table_names = ", ".join(f'"{table.name}"' for table in Base.metadata.sorted_tables)
+    async with database.transaction() as connection:
+        await connection.execute(text(f"TRUNCATE TABLE {table_names} CASCADE"))
+    try:
+        yield database
+    finally:
+        async with database.transaction() as connection:
+            await connection.execute(text(f"TRUNCATE TABLE {table_names} CASCADE"))
+        await database.close()
+
+
+class FakeGoogleEndpoint:
+    """Local stand-in for the Calendar channel endpoints."""
+
+    def __init__(self) -> None:
+        self.tokens: dict[str, str] = {}
+        self.stopped: list[str] = []
+        self.fail_watch = False
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if request.url.path.endswith("/channels/stop"):
+            self.stopped.append(body["id"])
+            return httpx.Response(204)
+        if self.fail_watch:
+            return httpx.Response(400, json={"error": {"message": "rejected"}})
+        self.tokens[body["id"]] = body["token"]
+        return httpx.Response(
+            200,
+            json={
+                "id": body["id"],
+                "resourceId": f"resource-{body['id']}",
+                "expiration": body["expiration"],
+            },
+        )
+
+
+class FakeTokenProvider:
+    async def get_token(self, *, force_refresh: bool = False) -> str:
+        return "test-access-token"
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = NOW
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def _client(endpoint: FakeGoogleEndpoint) -> GoogleCalendarClient:
+    return GoogleCalendarClient(
+        FakeTokenProvider(),
+        retry_attempts=1,
+        http_client=httpx.AsyncClient(
+            base_url="https://www.googleapis.com/calendar/v3",
+            transport=httpx.MockTransport(endpoint.handle),
+        ),
+    )
+
+
+async def _seed(database: Database, *sources: CalendarSourceRecord) -> SqlAlchemyUnitOfWork:
+    uow = SqlAlchemyUnitOfWork(database)
+    async with uow.transaction() as transaction:
+        await transaction.guild_configs.add(GuildConfigRecord(guild_id=GUILD_ID))
+        for source in sources:
+            await transaction.calendar_sources.add(source)
+    return uow
+
+
+def _source(*, active: bool = True) -> CalendarSourceRecord:
+    return CalendarSourceRecord(
+        id=uuid.uuid4(),
+        guild_id=GUILD_ID,
+        provider="google",
+        external_calendar_id=f"{uuid.uuid4()}@example.test",
+        display_name="Test calendar",
+        active=active,
+        next_sync_due_at=NOW + timedelta(hours=1),
+    )
+
+
+async def test_authenticated_ping_makes_source_due_immediately(database: Database) -> None:
+    source = _source()
+    uow = await _seed(database, source)
+    endpoint = FakeGoogleEndpoint()
+    clock = Clock()
+    client = _client(endpoint)
+    try:
+        renewal = await CalendarWatchRenewer(uow, client, address=ADDRESS, clock=clock).renew_due()
+    finally:
+        await client.close()
+    assert renewal.created == 1
+    (channel_id, token) = next(iter(endpoint.tokens.items()))
+    receiver = CalendarNotificationReceiver(uow, clock=clock)
+
+    forged = await receiver.receive(
+        channel_id=channel_id,
+        token="guessed",
+        resource_id=f"resource-{channel_id}",
+        resource_state="exists",
+    )
+    handshake = await receiver.receive(
+        channel_id=channel_id,
+        token=token,
+        resource_id=f"resource-{channel_id}",
+        resource_state="sync",
+    )
+    async with uow.transaction() as transaction:
+        untouched = await transaction.calendar_sources.get(source.id)
+    clock.now = NOW + timedelta(minutes=3)
+    accepted = await receiver.receive(
+        channel_id=channel_id,
+        token=token,
+        resource_id=f"resource-{channel_id}",
+        resource_state="exists",
+    )
+    async with uow.transaction() as transaction:
+        due = await transaction.calendar_sources.get(source.id)
+
+    assert not forged
+    assert handshake and accepted
+    assert untouched is not None and untouched.next_sync_due_at == NOW + timedelta(hours=1)
+    assert due is not None and due.next_sync_due_at == NOW + timedelta(minutes=3)
+
+
+async def test_accepted_change_ping_wakes_the_worker(database: Database) -> None:
+    source = _source()
+    uow = await _seed(database, source)
+    endpoint = FakeGoogleEndpoint()
+    clock = Clock()
+    client = _client(endpoint)
+    try:
+        await CalendarWatchRenewer(uow, client, address=ADDRESS, clock=clock).renew_due()
+    finally:
+        await client.close()
+    (channel_id, token) = next(iter(endpoint.tokens.items()))
+    receiver = CalendarNotificationReceiver(uow, clock=clock)
+    received: list[str] = []
+    arrived = asyncio.Event()
+
+    def on_wakeup(reason: str) -> None:
+        received.append(reason)
+        arrived.set()
+
+    async with database.listen(WORKER_WAKEUP_CHANNEL, on_wakeup):
+        accepted = await receiver.receive(
+            channel_id=channel_id,
+            token=token,
+            resource_id=f"resource-{channel_id}",
+            resource_state="exists",
+        )
+        await asyncio.wait_for(arrived.wait(), timeout=5)
+
+    assert accepted
+    assert received == ["calendar_watch"]
+
+
+async def test_renewal_replaces_expiring_channels_and_retires_orphans(database: Database) -> None:
+    watched = _source()
+    inactive = _source(active=False)
+    uow = await _seed(database, watched, inactive)
+    endpoint = FakeGoogleEndpoint()
+    clock = Clock()
+    client = _client(endpoint)
+    renewer = CalendarWatchRenewer(
+        uow,
+        client,
+        address=ADDRESS,
+        ttl=timedelta(hours=24),
+        renew_before=timedelta(hours=1),
+        clock=clock,
+    )
+    try:
+        await renewer.renew_due()
+        first_channel = next(iter(endpoint.tokens))
+        async with uow.transaction() as transaction:
+            inactive_record = await transaction.calendar_sources.get(inactive.id)
+            assert inactive_record is not None
+            await transaction.calendar_sources.update(
+                replace(inactive_record, active=True),
+                expected_version=inactive_record.version,
+            )
+        await renewer.renew_due()
+        async with uow.transaction() as transaction:
+            inactive_record = await transaction.calendar_sources.get(inactive.id)
+            assert inactive_record is not None
+            await transaction.calendar_sources.update(
+                replace(inactive_record, active=False),
+                expected_version=inactive_record.version,
+            )
+
+        clock.now = NOW + timedelta(hours=23, minutes=30)
+        renewal = await renewer.renew_due()
+    finally:
+        await client.close()
+    async with uow.transaction() as transaction:
+        channels = await transaction.calendar_watch_channels.list_all()
+
+    assert renewal.created == 1
+    assert renewal.stopped == 2
+    assert first_channel in endpoint.stopped
+    assert [channel.calendar_source_id for channel in channels] == [watched.id]
+    assert channels[0].expires_at == clock.now + timedelta(hours=24)
+
+
+async def test_lapsed_channel_falls_back_to_polling(database: Database) -> None:
+    source = _source()
+    uow = await _seed(database, source)
+    endpoint = FakeGoogleEndpoint()
+    clock = Clock()
+    client = _client(endpoint)
+    renewer = CalendarWatchRenewer(uow, client, address=ADDRESS, clock=clock)
+    try:
+        await renewer.renew_due()
+        endpoint.fail_watch = True
+        clock.now = NOW + timedelta(hours=25)
+        renewal = await renewer.renew_due()
+    finally:
+        await client.close()
+    async with uow.transaction() as transaction:
+        channels = await transaction.calendar_watch_channels.list_all()
+        record = await transaction.calendar_sources.get(source.id)
+
+    assert renewal.failed == 1
+    assert channels == []
+    assert endpoint.stopped == []
+    assert record is not None and record.next_sync_due_at == clock.now
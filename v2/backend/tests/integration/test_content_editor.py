@@ -149,6 +149,9 @@ async def test_manual_event_lifecycle_is_versioned_soft_deleted_and_audited(
     assert [
         record.id for record in await service.list_manual(principal=_principal(AppRole.ADMIN))
     ] == [created.id]
+    fingerprint = await service.manual_fingerprint(principal=_principal(AppRole.ADMIN))
+    assert fingerprint != await service.info_fingerprint(principal=_principal(AppRole.ADMIN))
+    assert fingerprint == await service.manual_fingerprint(principal=_principal(AppRole.TEAM_MOD))
     async with unit_of_work.transaction() as repositories:
         audit = await repositories.audit_logs.list_for_object("manual_event", str(created.id))
     assert [entry.action for entry in audit] == [
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import os
+import uuid
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from domcek_bot.application.publication.admin_roles import (
+    IndexedGuardDiscordGateway,
+    RoleMembershipIndex,
+)
+from domcek_bot.application.records import GuildConfigRecord
+from domcek_bot.config import Settings
+from domcek_bot.infrastructure.database import Database
+from domcek_bot.infrastructure.models import Base
+from domcek_bot.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+pytestmark = pytest.mark.skipif(
+    "TEST_DATABASE_URL" not in os.environ,
+    reason="integration database not configured",
+)
+
+GUILD_ID = 1535774834955391047
+ADMIN_ROLE_ID = 1535774834955391090
+OTHER_ROLE_ID = 1535774834955391091
+NOW = datetime(2026, 8, 9, 18, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+async def database() -> AsyncIterator[Database]:
+    database = Database(Settings(database_url=os.environ["TEST_DATABASE_URL"]))
+    table_names = ", ".join(f'"{table.name}"' for table in Base.metadata.sorted_tables)
+    async with database.transaction() as connection:
+        await connection.execute(text(f"TRUNCATE TABLE {table_names} CASCADE"))
+    try:
+        yield database
+    finally:
+        async with database.transaction() as connection:
+            await connection.execute(text(f"TRUNCATE TABLE {table_names} CASCADE"))
+        await database.close()
+
+
+class CountingMemberScan:
+    def __init__(self, members: tuple[int, ...]) -> None:
+        self.members = members
+        self.scans = 0
+
+    async def admin_member_ids(self, guild_id: int, admin_role_id: int) -> tuple[int, ...]:
+        assert (guild_id, admin_role_id) == (GUILD_ID, ADMIN_ROLE_ID)
+        self.scans += 1
+        return self.members
+
+    async def send_guard_dm(
+        self,
+        *,
+        recipient_user_id: int,
+        run_id: uuid.UUID,
+        release_at: datetime,
+        nonce: str,
+    ) -> tuple[int, int]:
+        raise AssertionError("not used")
+
+    async def delete_guard_dm(self, *, channel_id: int, message_id: int) -> None:
+        raise AssertionError("not used")
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = NOW
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+async def test_member_events_keep_the_index_current_until_it_expires(
+    database: Database,
+) -> None:
+    uow = SqlAlchemyUnitOfWork(database)
+    async with uow.transaction() as repositories:
+        await repositories.guild_configs.add(GuildConfigRecord(guild_id=GUILD_ID))
+    scan = CountingMemberScan((11, 12))
+    clock = Clock()
+    index = RoleMembershipIndex(uow, ttl=timedelta(hours=6), clock=clock)
+    gateway = IndexedGuardDiscordGateway(scan, index)
+
+    loaded = await gateway.admin_member_ids(GUILD_ID, ADMIN_ROLE_ID)
+    await index.record_member_roles(GUILD_ID, 13, (ADMIN_ROLE_ID, OTHER_ROLE_ID))
+    await index.record_member_roles(GUILD_ID, 11, (OTHER_ROLE_ID,))
+    clock.now = NOW + timedelta(hours=5)
+    maintained = await gateway.admin_member_ids(GUILD_ID, ADMIN_ROLE_ID)
+
+    clock.now = NOW + timedelta(hours=7)
+    scan.members = (12, 14)
+    expired = await gateway.admin_member_ids(GUILD_ID, ADMIN_ROLE_ID)
+    await index.invalidate(GUILD_ID)
+    reloaded = await gateway.admin_member_ids(GUILD_ID, ADMIN_ROLE_ID)
+
+    assert loaded == (11, 12)
+    assert maintained == (12, 13)
+    assert expired == (12, 14)
+    assert reloaded == (12, 14)
+    assert scan.scans == 3
+
+
+class MemberScanRacingAnEvent(CountingMemberScan):
+    def __init__(self, members: tuple[int, ...], index: RoleMembershipIndex) -> None:
+        super().__init__(members)
+        self.index = index
+
+    async def admin_member_ids(self, guild_id: int, admin_role_id: int) -> tuple[int, ...]:
+        loaded = await super().admin_member_ids(guild_id, admin_role_id)
+        if self.scans == 1:
+            await self.index.record_member_roles(GUILD_ID, 11, ())
+        return loaded
+
+
+async def test_scan_overtaken_by_a_member_event_is_not_stored(database: Database) -> None:
+    uow = SqlAlchemyUnitOfWork(database)
+    async with uow.transaction() as repositories:
+        await repositories.guild_configs.add(GuildConfigRecord(guild_id=GUILD_ID))
+    index = RoleMembershipIndex(uow, ttl=timedelta(hours=6), clock=Clock())
+    scan = MemberScanRacingAnEvent((11, 12), index)
+    gateway = IndexedGuardDiscordGateway(scan, index)
+
+    raced = await gateway.admin_member_ids(GUILD_ID, ADMIN_ROLE_ID)
+    scan.members = (12,)
+    rescanned = await gateway.admin_member_ids(GUILD_ID, ADMIN_ROLE_ID)
+    cached = await gateway.admin_member_ids(GUILD_ID, ADMIN_ROLE_ID)
+
+    assert raced == (11, 12)
+    assert rescanned == (12,)
+    assert cached == (12,)
+    assert scan.scans == 2
@@ -104,7 +104,34 @@ async def test_all_e2_tables_exist(database: Database) -> None:
         table_names = await connection.run_sync(lambda sync: set(inspect(sync).get_table_names()))
 
     assert set(Base.metadata.tables) <= table_names
-    assert len(Base.metadata.tables) == 21
+    assert set(Base.metadata.tables) == {
+        "audit_log",
+        "calendar_source",
+        "calendar_sync_request",
+        "calendar_watch_channel",
+        "channel_archive_request",
+        "discord_role_index",
+        "discord_role_member",
+        "event_override",
+        "event_series_override",
+        "external_event",
+        "guild_config",
+        "info_announcement",
+        "integration_task",
+        "manual_event",
+        "publication_guard_notice",
+        "publication_incident",
+        "publication_item",
+        "publication_message",
+        "publication_run",
+        "reaction_config",
+        "reaction_config_channel",
+        "runtime_heartbeat",
+        "shadow_publication",
+        "shadow_publication_draft",
+        "undo_operation",
+        "web_session",
+    }
 
 
 async def test_required_postgresql_constraints_and_indexes_exist(database: Database) -> None:
@@ -119,6 +146,7 @@ async def test_required_postgresql_constraints_and_indexes_exist(database: Datab
         ("external_event", "source_key"),
         ("external_event", "ix_external_event_source_deleted_starts_at"),
         ("external_event", "ix_external_event_source_deleted_starts_on"),
+        ("external_event", "ix_external_event_source_provider_event"),
         ("event_series_override", "ix_event_series_override_lookup"),
         ("info_announcement", "ix_info_announcement_guild_active_validity"),
         ("publication_run", "guild_slot"),
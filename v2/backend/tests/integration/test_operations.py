@@ -220,6 +220,57 @@ async def test_heartbeat_upsert_keeps_identity_and_updates_state(database: Datab
     assert heartbeats[0].last_seen_at == NOW
 
 
+async def test_guild_heartbeats_are_batched_and_skip_unchanged_fresh_rows(
+    database: Database,
+) -> None:
+    unit_of_work = SqlAlchemyUnitOfWork(database)
+    operations = RuntimeOperationsService(unit_of_work, heartbeat_refresh=timedelta(seconds=45))
+    instance_id = uuid.uuid4()
+    async with unit_of_work.transaction() as repositories:
+        await repositories.guild_configs.add(GuildConfigRecord(guild_id=GUILD_ID))
+        await repositories.guild_configs.add(GuildConfigRecord(guild_id=OTHER_GUILD_ID))
+
+    async def beat(observed_at: datetime, *, state: str = "running", mode: str = "live") -> int:
+        return await operations.heartbeat_guilds(
+            guild_ids=None,
+            process_name="worker",
+            instance_id=instance_id,
+            state=state,
+            started_at=NOW - timedelta(hours=1),
+            observed_at=observed_at,
+            details={"publication_execution_mode": mode},
+        )
+
+    written = [
+        await beat(NOW - timedelta(seconds=60)),
+        await beat(NOW - timedelta(seconds=30)),
+        await beat(NOW - timedelta(seconds=10), mode="shadow"),
+        await beat(NOW, mode="shadow"),
+        await beat(NOW + timedelta(seconds=40), mode="shadow"),
+        await beat(NOW + timedelta(seconds=41), state="stopping", mode="shadow"),
+    ]
+    async with unit_of_work.transaction() as repositories:
+        stored = [
+            heartbeat
+            for guild_id in (GUILD_ID, OTHER_GUILD_ID)
+            for heartbeat in await repositories.runtime_heartbeats.list_for_guild(guild_id)
+        ]
+    health = await operations.process_health(
+        guild_id=OTHER_GUILD_ID,
+        process_name="worker",
+        expected_state="stopping",
+        expected_execution_mode="shadow",
+        now=NOW + timedelta(seconds=60),
+    )
+
+    assert written == [2, 0, 2, 0, 2, 2]
+    assert [(item.guild_id, item.last_seen_at) for item in stored] == [
+        (GUILD_ID, NOW + timedelta(seconds=41)),
+        (OTHER_GUILD_ID, NOW + timedelta(seconds=41)),
+    ]
+    assert health.healthy is True
+
+
 async def test_heartbeat_rejects_naive_timestamps(database: Database) -> None:
     operations = RuntimeOperationsService(SqlAlchemyUnitOfWork(database))
     with pytest.raises(ValueError, match="timezone-aware"):
@@ -28,6 +28,8 @@ from domcek_bot.infrastructure.models import (
     InfoAnnouncementModel,
     ManualEventModel,
     PublicationRunModel,
+    ReactionConfigChannelModel,
+    ReactionConfigModel,
 )
 from domcek_bot.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
 
@@ -75,6 +77,18 @@ async def test_service_composes_one_transactional_persistence_snapshot(
             )
         )
         await session.flush()
+        session.add(
+            ReactionConfigModel(
+                guild_id=GUILD_ID, seen_emoji_unicode="👀", auto_reaction_enabled=True
+            )
+        )
+        await session.flush()
+        session.add_all(
+            [
+                ReactionConfigChannelModel(guild_id=GUILD_ID, discord_channel_id=channel_id)
+                for channel_id in (1535774834955391049, 1535774834955391048)
+            ]
+        )
         session.add(
             CalendarSourceModel(
                 id=source_id,
@@ -198,3 +212,236 @@ async def test_service_composes_one_transactional_persistence_snapshot(
     assert draft.messages[0].content == ("@everyone\nNajbližšie udalosti\n\nMajte sa pekne.")
     assert draft.messages[0].allowed_mentions == ("everyone",)
     assert draft.messages[-1].seen_target
+
+    async with SqlAlchemyUnitOfWork(database).transaction() as repositories:
+        inputs = await repositories.publication_snapshots.load_guild_inputs(GUILD_ID)
+        window_events = await repositories.publication_snapshots.load_window_events(
+            (source_id,),
+            starts_at=draft.window_starts_at,
+            ends_at=draft.window_ends_at,
+            starts_on=date(2026, 8, 17),
+            ends_on=date(2026, 8, 31),
+        )
+        assert inputs is not None
+        assert inputs.guild == await repositories.guild_configs.get(GUILD_ID)
+        assert inputs.completed_slot_keys == frozenset({FIRST_SLOT_KEY})
+        assert list(inputs.calendar_sources) == (
+            await repositories.calendar_sources.list_for_guild(GUILD_ID)
+        )
+        assert list(inputs.series_overrides) == (
+            await repositories.event_series_overrides.list_for_sources((source_id,))
+        )
+        assert list(inputs.manual_events) == await repositories.manual_events.list_for_guild(
+            GUILD_ID
+        )
+        assert list(inputs.info_announcements) == (
+            await repositories.info_announcements.list_for_guild(GUILD_ID)
+        )
+        assert inputs.reaction_config == await repositories.reaction_configs.get(GUILD_ID)
+        assert [event.id for event in window_events.external_events] == [event_id]
+        assert list(window_events.external_events) == (
+            await repositories.external_events.list_for_sources((source_id,))
+        )
+        assert list(window_events.event_overrides) == (
+            await repositories.event_overrides.list_for_events((event_id,))
+        )
+        assert await repositories.publication_snapshots.load_guild_inputs(GUILD_ID + 1) is None
+
+
+async def test_snapshot_loads_only_live_events_overlapping_the_window(
+    database: Database,
+) -> None:
+    source_id = uuid.uuid4()
+    in_window = datetime(2026, 8, 12, 8, 0, tzinfo=UTC)
+    spanning = datetime(2026, 8, 10, 8, 0, tzinfo=UTC)
+    historic = datetime(2024, 8, 12, 8, 0, tzinfo=UTC)
+    after_window = datetime(2026, 8, 30, 8, 0, tzinfo=UTC)
+
+    async with database.session() as session, session.begin():
+        session.add(GuildConfigModel(guild_id=GUILD_ID))
+        await session.flush()
+        session.add(
+            CalendarSourceModel(
+                id=source_id,
+                guild_id=GUILD_ID,
+                provider="google",
+                external_calendar_id="calendar@example.test",
+                display_name="Test calendar",
+            )
+        )
+        await session.flush()
+
+        def timed(key: str, starts_at: datetime, **values: object) -> ExternalEventModel:
+            return ExternalEventModel(
+                id=uuid.uuid4(),
+                calendar_source_id=source_id,
+                source_key=key,
+                provider_event_id=key,
+                source_title=key,
+                is_all_day=False,
+                starts_at=starts_at,
+                ends_at=starts_at + timedelta(hours=1),
+                last_synced_at=REFERENCE,
+                **values,
+            )
+
+        session.add_all(
+            [
+                timed("in-window", in_window),
+                ExternalEventModel(
+                    id=uuid.uuid4(),
+                    calendar_source_id=source_id,
+                    source_key="spanning",
+                    provider_event_id="spanning",
+                    source_title="spanning",
+                    is_all_day=False,
+                    starts_at=spanning,
+                    ends_at=spanning + timedelta(days=3),
+                    last_synced_at=REFERENCE,
+                ),
+                ExternalEventModel(
+                    id=uuid.uuid4(),
+                    calendar_source_id=source_id,
+                    source_key="all-day",
+                    provider_event_id="all-day",
+                    source_title="all-day",
+                    is_all_day=True,
+                    starts_on=date(2026, 8, 23),
+                    ends_on=date(2026, 8, 24),
+                    last_synced_at=REFERENCE,
+                ),
+                timed("historic", historic),
+                timed("after-window", after_window),
+                timed("deleted", in_window, deleted_at=REFERENCE),
+                timed(
+                    "cancelled",
+                    in_window,
+                    status="cancelled",
+                    deleted_at=REFERENCE,
+                ),
+            ]
+        )
+
+    snapshot = await PublicationDraftService(SqlAlchemyUnitOfWork(database)).load_next_snapshot(
+        GUILD_ID,
+        reference_time=REFERENCE,
+        intro_text="Najbližšie udalosti",
+    )
+
+    assert sorted(event.source_key for event in snapshot.external_events) == [
+        "all-day",
+        "in-window",
+        "spanning",
+    ]
+
+
+async def test_compose_next_reuses_draft_until_inputs_or_slot_change(database: Database) -> None:
+    manual_id = uuid.uuid4()
+    async with database.session() as session, session.begin():
+        session.add(GuildConfigModel(guild_id=GUILD_ID))
+        await session.flush()
+        session.add(
+            ManualEventModel(
+                id=manual_id,
+                guild_id=GUILD_ID,
+                title="Pôvodný názov",
+                is_all_day=False,
+                starts_at=datetime(2026, 8, 11, 16, 0, tzinfo=UTC),
+                ends_at=datetime(2026, 8, 11, 17, 0, tzinfo=UTC),
+                created_by_user_id=USER_ID,
+                updated_by_user_id=USER_ID,
+            )
+        )
+    service = PublicationDraftService(SqlAlchemyUnitOfWork(database))
+
+    first = await service.compose_next(GUILD_ID, reference_time=REFERENCE, intro_text="Úvod")
+    repeated = await service.compose_next(
+        GUILD_ID, reference_time=REFERENCE + timedelta(hours=1), intro_text="Úvod"
+    )
+    other_intro = await service.compose_next(
+        GUILD_ID, reference_time=REFERENCE, intro_text="Iný úvod"
+    )
+    async with database.session() as session, session.begin():
+        manual = await session.get(ManualEventModel, manual_id)
+        assert manual is not None
+        manual.title = "Nový názov"
+    edited = await service.compose_next(GUILD_ID, reference_time=REFERENCE, intro_text="Úvod")
+    async with database.session() as session, session.begin():
+        session.add(
+            PublicationRunModel(
+                id=uuid.uuid4(),
+                guild_id=GUILD_ID,
+                slot_key=FIRST_SLOT_KEY,
+                scheduled_for=datetime(2026, 8, 10, 18, 0, tzinfo=UTC),
+                mode=PublicationMode.MANUAL.value,
+                state=PublicationState.SUCCEEDED_MANUAL.value,
+                idempotency_key="completed-first-slot",
+            )
+        )
+    next_slot = await service.compose_next(GUILD_ID, reference_time=REFERENCE, intro_text="Úvod")
+
+    assert repeated is first
+    assert other_intro.public_items is first.public_items
+    assert other_intro.intro_text == "Iný úvod"
+    assert edited is not first
+    assert [item.title for item in edited.public_items] == ["Nový názov"]
+    assert first.slot_key == FIRST_SLOT_KEY
+    assert next_slot.slot_key == f"{GUILD_ID}:2026-08-17T20:00:Europe/Bratislava"
+
+
+async def test_compose_cache_follows_only_events_inside_the_window(database: Database) -> None:
+    source_id = uuid.uuid4()
+    inside_id = uuid.uuid4()
+    outside_id = uuid.uuid4()
+    async with database.session() as session, session.begin():
+        session.add(GuildConfigModel(guild_id=GUILD_ID))
+        await session.flush()
+        session.add(
+            CalendarSourceModel(
+                id=source_id,
+                guild_id=GUILD_ID,
+                provider="google",
+                external_calendar_id="calendar@example.test",
+                display_name="Test calendar",
+                priority=10,
+            )
+        )
+        await session.flush()
+        for event_id, source_key, starts_at in (
+            (inside_id, "inside", datetime(2026, 8, 11, 16, 0, tzinfo=UTC)),
+            (outside_id, "outside", datetime(2026, 10, 11, 16, 0, tzinfo=UTC)),
+        ):
+            session.add(
+                ExternalEventModel(
+                    id=event_id,
+                    calendar_source_id=source_id,
+                    source_key=source_key,
+                    provider_event_id=f"google-{source_key}",
+                    source_title="Pôvodný názov",
+                    is_all_day=False,
+                    starts_at=starts_at,
+                    ends_at=starts_at + timedelta(hours=1),
+                    last_synced_at=REFERENCE,
+                )
+            )
+    service = PublicationDraftService(SqlAlchemyUnitOfWork(database))
+
+    first = await service.compose_next(GUILD_ID, reference_time=REFERENCE, intro_text="Úvod")
+    async with SqlAlchemyUnitOfWork(database).transaction() as repositories:
+        await repositories.external_events.mark_many_synced(
+            ("inside", "outside"), synced_at=REFERENCE + timedelta(minutes=5)
+        )
+    async with database.session() as session, session.begin():
+        outside = await session.get(ExternalEventModel, outside_id)
+        assert outside is not None
+        outside.source_title = "Mimo okna"
+    unchanged = await service.compose_next(GUILD_ID, reference_time=REFERENCE, intro_text="Úvod")
+    async with database.session() as session, session.begin():
+        inside = await session.get(ExternalEventModel, inside_id)
+        assert inside is not None
+        inside.source_title = "Nový názov"
+    edited = await service.compose_next(GUILD_ID, reference_time=REFERENCE, intro_text="Úvod")
+
+    assert unchanged is first
+    assert edited is not first
+    assert [item.title for item in edited.public_items] == ["Nový názov"]
@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import os
 import uuid
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
 from datetime import UTC, datetime, timedelta
 
 import pytest
@@ -37,6 +37,7 @@ from domcek_bot.infrastructure.models import (
     CalendarSourceModel,
     ExternalEventModel,
     GuildConfigModel,
+    PublicationGuardNoticeModel,
     PublicationIncidentModel,
     PublicationMessageModel,
     PublicationRunModel,
@@ -277,6 +278,64 @@ async def test_snapshot_is_immutable_and_more_than_ten_events_publish_with_retry
     assert [message.attempt_count for message in messages] == [2, 1]
 
 
+class OutboxObservingDiscord(RecordingDiscord):
+    """Capture the durable message states Discord's POST would race against."""
+
+    def __init__(self, database: Database) -> None:
+        super().__init__()
+        self.database = database
+        self.observed: list[list[str]] = []
+
+    async def send_message(self, message: PublicationMessageRecord) -> int:
+        async with self.database.session() as session:
+            states = await session.scalars(
+                select(PublicationMessageModel.state)
+                .where(PublicationMessageModel.publication_run_id == message.publication_run_id)
+                .order_by(PublicationMessageModel.position)
+            )
+            self.observed.append(list(states))
+        return await super().send_message(message)
+
+
+async def test_each_send_is_preceded_by_the_previous_record_and_its_own_claim(
+    database: Database,
+) -> None:
+    await _seed(database, event_count=21)
+    discord = OutboxObservingDiscord(database)
+    engine = _engine(database, discord)
+    prepared = await engine.prepare(
+        GUILD_ID,
+        reference_time=REFERENCE,
+        mode=PublicationMode.AUTOMATIC,
+        initiated_by_user_id=None,
+        correlation_id="engine-outbox",
+    )
+
+    result = await engine.publish(prepared.run.id, correlation_id="engine-outbox")
+
+    sent = PublicationMessageState.SENT.value
+    sending = PublicationMessageState.SENDING.value
+    pending = PublicationMessageState.PENDING.value
+    assert result.state is PublicationState.SUCCEEDED_AUTOMATIC
+    assert result.sent_message_ids == (9001, 9002, 9003)
+    assert discord.observed == [
+        [sending, pending, pending],
+        [sent, sending, pending],
+        [sent, sent, sending],
+    ]
+    assert discord.reactions == [(CHANNEL_ID, 9003, "✅")]
+    async with database.session() as session:
+        messages = list(
+            await session.scalars(
+                select(PublicationMessageModel)
+                .where(PublicationMessageModel.publication_run_id == prepared.run.id)
+                .order_by(PublicationMessageModel.position)
+            )
+        )
+    assert [message.discord_message_id for message in messages] == [9001, 9002, 9003]
+    assert all(message.state == sent for message in messages)
+
+
 async def test_manual_confirmation_publishes_the_exact_generated_preview(
     database: Database,
 ) -> None:
@@ -809,6 +868,156 @@ async def test_guard_dm_failure_alerts_but_does_not_block_release(
     assert alerts.calls == [("Ochranná správa sa nedoručila", "guard-failed-dm")]
 
 
+class OverlappingGuardDiscord(RecordingGuardDiscord):
+    def __init__(self, *, admins: tuple[int, ...], fail_for: frozenset[int]) -> None:
+        super().__init__(admins=admins, fail_for=fail_for)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def send_guard_dm(
+        self,
+        *,
+        recipient_user_id: int,
+        run_id: uuid.UUID,
+        release_at: datetime,
+        nonce: str,
+    ) -> tuple[int, int]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return await super().send_guard_dm(
+                recipient_user_id=recipient_user_id,
+                run_id=run_id,
+                release_at=release_at,
+                nonce=nonce,
+            )
+        finally:
+            self.in_flight -= 1
+
+
+async def test_guard_dms_fan_out_with_bounded_concurrency_and_one_failure_alert(
+    database: Database,
+) -> None:
+    await _seed(database, event_count=1, grace_seconds=30)
+    async with database.session() as session, session.begin():
+        await session.execute(
+            update(GuildConfigModel)
+            .where(GuildConfigModel.guild_id == GUILD_ID)
+            .values(admin_role_id=777, moderator_channel_id=CHANNEL_ID + 1)
+        )
+    engine = _engine(database, RecordingDiscord())
+    prepared = await engine.prepare(
+        GUILD_ID,
+        reference_time=REFERENCE,
+        mode=PublicationMode.AUTOMATIC,
+        initiated_by_user_id=None,
+        correlation_id="guard-fan-out-prepare",
+    )
+    await engine.begin_guard(prepared.run.id, correlation_id="guard-fan-out", now=REFERENCE)
+    admins = tuple(USER_ID + offset for offset in range(12))
+    discord = OverlappingGuardDiscord(admins=admins, fail_for=frozenset(admins[:3]))
+    alerts = RecordingAlerts()
+    guard = PublicationGuardService(
+        SqlAlchemyUnitOfWork(database), engine, discord, alerts, max_concurrency=4
+    )
+
+    sent = await guard.notify(prepared.run.id, correlation_id="guard-fan-out")
+    await engine.cancel_guard(
+        prepared.run.id,
+        correlation_id="guard-fan-out-cancel",
+        actor_user_id=USER_ID,
+        now=REFERENCE + timedelta(seconds=1),
+    )
+    await guard.cleanup(prepared.run.id)
+
+    assert sent == 9
+    assert 1 < discord.max_in_flight <= 4
+    assert alerts.calls == [("Ochranná správa sa nedoručila", "guard-fan-out")]
+    assert sorted(discord.deleted) == sorted((admin + 100, admin + 200) for admin in admins[3:])
+    async with database.session() as session:
+        states = sorted(
+            await session.scalars(
+                select(PublicationGuardNoticeModel.state).where(
+                    PublicationGuardNoticeModel.publication_run_id == prepared.run.id
+                )
+            )
+        )
+    assert states == ["deleted"] * 9 + ["failed"] * 3
+
+
+class StoppingGuardDiscord(RecordingGuardDiscord):
+    """Stop the run while the last DM is still in flight."""
+
+    def __init__(self, *, admins: tuple[int, ...], stop: Callable[[], Awaitable[None]]) -> None:
+        super().__init__(admins=admins)
+        self.stop = stop
+
+    async def send_guard_dm(
+        self,
+        *,
+        recipient_user_id: int,
+        run_id: uuid.UUID,
+        release_at: datetime,
+        nonce: str,
+    ) -> tuple[int, int]:
+        if recipient_user_id == self.admins[-1]:
+            await self.stop()
+        return await super().send_guard_dm(
+            recipient_user_id=recipient_user_id,
+            run_id=run_id,
+            release_at=release_at,
+            nonce=nonce,
+        )
+
+
+async def test_guard_stop_during_fan_out_deletes_every_delivered_dm(database: Database) -> None:
+    await _seed(database, event_count=1, grace_seconds=30)
+    async with database.session() as session, session.begin():
+        await session.execute(
+            update(GuildConfigModel)
+            .where(GuildConfigModel.guild_id == GUILD_ID)
+            .values(admin_role_id=777)
+        )
+    engine = _engine(database, RecordingDiscord())
+    prepared = await engine.prepare(
+        GUILD_ID,
+        reference_time=REFERENCE,
+        mode=PublicationMode.AUTOMATIC,
+        initiated_by_user_id=None,
+        correlation_id="guard-stop-mid-fan-out-prepare",
+    )
+    await engine.begin_guard(
+        prepared.run.id, correlation_id="guard-stop-mid-fan-out", now=REFERENCE
+    )
+    admins = tuple(USER_ID + offset for offset in range(3))
+
+    async def stop() -> None:
+        await guard.stop_for_user(
+            guild_id=GUILD_ID,
+            user_id=admins[0],
+            correlation_id="guard-stop-mid-fan-out-stop",
+            now=REFERENCE + timedelta(seconds=1),
+        )
+
+    discord = StoppingGuardDiscord(admins=admins, stop=stop)
+    guard = PublicationGuardService(
+        SqlAlchemyUnitOfWork(database), engine, discord, RecordingAlerts(), max_concurrency=1
+    )
+
+    assert await guard.notify(prepared.run.id, correlation_id="guard-stop-mid-fan-out") == 3
+    assert sorted(discord.deleted) == sorted((admin + 100, admin + 200) for admin in admins)
+    async with database.session() as session:
+        states = list(
+            await session.scalars(
+                select(PublicationGuardNoticeModel.state).where(
+                    PublicationGuardNoticeModel.publication_run_id == prepared.run.id
+                )
+            )
+        )
+    assert states == ["deleted"] * 3
+
+
 async def test_dm_stop_reloads_admin_membership_and_cleans_up_notices(
     database: Database,
 ) -> None:
@@ -1095,3 +1304,50 @@ async def test_two_scheduler_instances_cannot_duplicate_the_same_slot(
         runs = list(await session.scalars(select(PublicationRunModel)))
     assert len(runs) == 1
     assert runs[0].state == PublicationState.SUCCEEDED_AUTOMATIC.value
+
+
+class PerGuildFinalCalendarSync:
+    def __init__(self, *, hanging_guild_id: int, failing_guild_id: int) -> None:
+        self.hanging_guild_id = hanging_guild_id
+        self.failing_guild_id = failing_guild_id
+
+    async def synchronize_guild(self, guild_id: int, *, correlation_id: str) -> bool:
+        if guild_id == self.hanging_guild_id:
+            await asyncio.Event().wait()
+        if guild_id == self.failing_guild_id:
+            raise ConnectionError("calendar provider unavailable")
+        return True
+
+
+async def test_scheduler_contains_slow_and_failing_guilds_and_keeps_guild_order(
+    database: Database,
+) -> None:
+    await _seed(database, event_count=1)
+    slow_guild_id, failing_guild_id = GUILD_ID - 1, GUILD_ID + 1
+    async with database.session() as session, session.begin():
+        session.add_all(
+            [GuildConfigModel(guild_id=slow_guild_id), GuildConfigModel(guild_id=failing_guild_id)]
+        )
+    discord = RecordingDiscord()
+    scheduler = PublicationScheduler(
+        SqlAlchemyUnitOfWork(database),
+        _engine(database, discord),
+        RecordingAlerts(),
+        grace_period=timedelta(hours=2),
+        calendar_max_safe_age=timedelta(days=2),
+        final_calendar_sync=PerGuildFinalCalendarSync(
+            hanging_guild_id=slow_guild_id, failing_guild_id=failing_guild_id
+        ),
+        max_concurrency=3,
+        guild_timeout=timedelta(seconds=1),
+    )
+    checked_at = datetime(2026, 8, 10, 18, 30, tzinfo=UTC)
+
+    decisions = await scheduler.run_due(now=checked_at, correlation_id="multi-guild")
+
+    assert [(decision.guild_id, decision.action) for decision in decisions] == [
+        (slow_guild_id, "guild_timed_out"),
+        (GUILD_ID, PublicationState.SUCCEEDED_AUTOMATIC.value),
+        (failing_guild_id, "guild_failed"),
+    ]
+    assert len(discord.sent) == 1
@@ -13,7 +13,11 @@ from domcek_bot.application.auth.authorization import (
     AuthorizationDenied,
     Principal,
 )
-from domcek_bot.application.publication.history import PublicationHistoryService
+from domcek_bot.application.publication.history import (
+    InvalidHistoryCursor,
+    PublicationHistoryCursor,
+    PublicationHistoryService,
+)
 from domcek_bot.application.records import (
     CalendarSourceRecord,
     ChannelArchiveRequestRecord,
@@ -143,9 +147,11 @@ async def test_history_returns_ordered_immutable_snapshots_and_is_guild_isolated
             await repositories.publication_runs.add_snapshot(*snapshot)
 
     service = PublicationHistoryService(uow)
-    entries = await service.list(_principal(AppRole.PUBLISHER))
+    page = await service.list(_principal(AppRole.PUBLISHER))
+    entries = page.entries
 
     assert [entry.run.id for entry in entries] == [latest[0].id, older[0].id]
+    assert page.next_cursor is None
     assert entries[0].items[0].final_title == "Najnovšia"
     assert entries[0].messages[0].discord_message_id == latest[2][0].discord_message_id
     assert entries[0].messages[0].reaction_emoji == "👀"
@@ -156,6 +162,46 @@ async def test_history_returns_ordered_immutable_snapshots_and_is_guild_isolated
         await service.list(_principal(None))
 
 
+async def test_history_pages_by_keyset_cursor_and_can_skip_details(database: Database) -> None:
+    uow = SqlAlchemyUnitOfWork(database)
+    snapshots = [
+        _snapshot(GUILD_ID, scheduled_for=NOW - timedelta(days=7 * week), title=f"Týždeň {week}")
+        for week in range(5)
+    ]
+    async with uow.transaction() as repositories:
+        await repositories.guild_configs.add(GuildConfigRecord(guild_id=GUILD_ID))
+        for snapshot in snapshots:
+            await repositories.publication_runs.add_snapshot(*snapshot)
+    service = PublicationHistoryService(uow)
+    principal = _principal(AppRole.ADMIN)
+
+    first = await service.list(principal, limit=2)
+    assert first.next_cursor is not None
+    cursor = PublicationHistoryCursor.decode(first.next_cursor.encode())
+    second = await service.list(principal, limit=2, before=cursor)
+    assert second.next_cursor is not None
+    last = await service.list(principal, limit=2, before=second.next_cursor)
+    summary = await service.list(principal, limit=5, include_details=False)
+
+    pages = (first, second, last)
+    assert [[entry.run.id for entry in page.entries] for page in pages] == [
+        [snapshots[0][0].id, snapshots[1][0].id],
+        [snapshots[2][0].id, snapshots[3][0].id],
+        [snapshots[4][0].id],
+    ]
+    assert last.next_cursor is None
+    assert [entry.items[0].final_title for entry in second.entries] == ["Týždeň 2", "Týždeň 3"]
+    assert [entry.messages[0].id for entry in second.entries] == [
+        snapshots[2][2][0].id,
+        snapshots[3][2][0].id,
+    ]
+    assert [entry.run.id for entry in summary.entries] == [item[0].id for item in snapshots]
+    assert all(not entry.items and not entry.messages for entry in summary.entries)
+    assert summary.next_cursor is None
+    with pytest.raises(InvalidHistoryCursor):
+        PublicationHistoryCursor.decode("not-a-cursor")
+
+
 async def test_dashboard_uses_live_configuration_latest_sync_run_and_pending_archives(
     database: Database,
 ) -> None:
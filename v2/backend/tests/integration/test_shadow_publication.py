@@ -23,6 +23,7 @@ from domcek_bot.infrastructure.models import (
     GuildConfigModel,
     ManualEventModel,
     PublicationRunModel,
+    ShadowPublicationDraftModel,
 )
 from domcek_bot.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
 
@@ -137,7 +138,10 @@ async def test_shadow_capture_is_durable_updated_and_never_materializes_a_live_r
     assert second.observation_count == 2
     assert second.item_count == 1
     assert second.message_count == 1
-    assert second.draft_json["public_items"][0]["title"] == "Druhá verzia"
+    second_draft = await service.draft(second, _principal(AppRole.ADMIN))
+    assert second_draft is not None
+    assert second_draft.sha256 == second.draft_sha256
+    assert second_draft.draft_json["public_items"][0]["title"] == "Druhá verzia"
     assert first.calendar_sync_valid is True
     assert second.calendar_sync_valid is False
     assert second.calendar_sync_evidence["sync_attempt_succeeded"] is False
@@ -145,11 +149,27 @@ async def test_shadow_capture_is_durable_updated_and_never_materializes_a_live_r
     assert foreign.calendar_sync_valid is False
 
     own = await service.list(_principal(AppRole.TEAM_MOD))
-    assert [capture.id for capture in own] == [second.id]
-    assert foreign.id not in {capture.id for capture in own}
+    assert [entry.capture.id for entry in own] == [second.id]
+    assert own[0].draft_json == second_draft.draft_json
+    assert foreign.id not in {entry.capture.id for entry in own}
+    summary = await service.list(_principal(AppRole.TEAM_MOD), include_drafts=False)
+    assert [(entry.capture, entry.draft_json) for entry in summary] == [(second, None)]
+    assert await service.get(foreign.id, _principal(AppRole.ADMIN)) is None
+    assert await service.draft(foreign, _principal(AppRole.ADMIN)) is None
+
+    third = await service.capture_next(
+        GUILD_ID,
+        observed_at=second_observation + timedelta(hours=1),
+        calendar_sync_succeeded=True,
+    )
+    assert third.draft_sha256 == second.draft_sha256
+    assert third.observation_count == 3
     with pytest.raises(AuthorizationDenied):
         await service.list(_principal(None))
 
     async with database.session() as session:
         live_run_count = await session.scalar(select(func.count()).select_from(PublicationRunModel))
+        stored_drafts = set(await session.scalars(select(ShadowPublicationDraftModel.sha256)))
     assert live_run_count == 0
+    # The replaced first draft is no longer referenced and was removed.
+    assert stored_drafts == {second.draft_sha256, foreign.draft_sha256}
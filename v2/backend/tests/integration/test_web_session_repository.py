@@ -65,3 +65,40 @@ async def test_session_is_persisted_touched_expired_and_revoked(database: Databa
     await sessions.revoke(loaded, now=NOW + timedelta(minutes=6))
     with pytest.raises(InvalidSession):
         await sessions.authenticate(issued.session_token, now=NOW + timedelta(minutes=7))
+
+
+async def test_batched_touch_only_moves_active_sessions_forward(database: Database) -> None:
+    unit_of_work = SqlAlchemyUnitOfWork(database)
+    async with unit_of_work.transaction() as repositories:
+        await repositories.guild_configs.add(GuildConfigRecord(guild_id=GUILD_ID))
+    sessions = SessionService(
+        unit_of_work,
+        secret="s" * 32,
+        lifetime=timedelta(hours=1),
+        defer_touches=True,
+    )
+    active = await sessions.create(guild_id=GUILD_ID, user_id=USER_ID, now=NOW)
+    stale = await sessions.create(guild_id=GUILD_ID, user_id=USER_ID + 1, now=NOW)
+    revoked = await sessions.create(guild_id=GUILD_ID, user_id=USER_ID + 2, now=NOW)
+    await sessions.revoke(revoked.record, now=NOW)
+
+    async with unit_of_work.transaction() as repositories:
+        await repositories.web_sessions.touch_many(
+            {
+                active.record.id: NOW + timedelta(minutes=2),
+                stale.record.id: NOW - timedelta(minutes=2),
+                revoked.record.id: NOW + timedelta(minutes=2),
+            }
+        )
+        records = {
+            issued.record.id: await repositories.web_sessions.get_active_by_token_hash(
+                issued.record.session_token_hash, now=NOW
+            )
+            for issued in (active, stale)
+        }
+    await sessions.close()
+
+    assert {key: record.last_seen_at for key, record in records.items() if record} == {
+        active.record.id: NOW + timedelta(minutes=2),
+        stale.record.id: NOW,
+    }
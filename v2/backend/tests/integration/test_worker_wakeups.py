@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import uuid
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from domcek_bot.application.records import (
+    CalendarSourceRecord,
+    GuildConfigRecord,
+    PublicationRunRecord,
+)
+from domcek_bot.application.wakeups import WorkerWakeupPlanner
+from domcek_bot.config import Settings
+from domcek_bot.domain.enums import PublicationMode, PublicationState
+from domcek_bot.infrastructure.database import Database
+from domcek_bot.infrastructure.models import Base
+from domcek_bot.infrastructure.repositories import WORKER_WAKEUP_CHANNEL
+from domcek_bot.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+pytestmark = pytest.mark.skipif(
+    "TEST_DATABASE_URL" not in os.environ,
+    reason="integration database not configured",
+)
+
+GUILD_ID = 1535774834955391047
+MODERATOR_CHANNEL_ID = 1535774834955391060
+# Sunday; the guild publishes on Monday 20:00 Europe/Bratislava (18:00 UTC).
+NOW = datetime(2026, 8, 9, 18, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+async def database() -> AsyncIterator[Database]:
+    database = Database(Settings(database_url=os.environ["TEST_DATABASE_URL"]))
+    table_names = ", ".join(f'"{table.name}"' for table in Base.metadata.sorted_tables)
+    async with database.transaction() as connection:
+        await connection.execute(text(f"TRUNCATE TABLE {table_names} CASCADE"))
+    try:
+        yield database
+    finally:
+        async with database.transaction() as connection:
+            await connection.execute(text(f"TRUNCATE TABLE {table_names} CASCADE"))
+        await database.close()
+
+
+def _source(*, due_in: timedelta, active: bool = True) -> CalendarSourceRecord:
+    return CalendarSourceRecord(
+        id=uuid.uuid4(),
+        guild_id=GUILD_ID,
+        provider="google",
+        external_calendar_id=f"{uuid.uuid4()}@example.test",
+        display_name="Kalendár",
+        active=active,
+        next_sync_due_at=NOW + due_in,
+    )
+
+
+def _waiting_run(*, release_in: timedelta, slot_key: str) -> PublicationRunRecord:
+    run_id = uuid.uuid4()
+    return PublicationRunRecord(
+        id=run_id,
+        guild_id=GUILD_ID,
+        slot_key=slot_key,
+        scheduled_for=NOW,
+        mode=PublicationMode.MANUAL,
+        state=PublicationState.WAITING_FOR_RELEASE,
+        attempt=1,
+        idempotency_key=f"wakeup-{run_id}",
+        composer_version="test-v1",
+        intro_text="Úvod",
+        intro_prompt_version="fallback-v1",
+        intro_used_fallback=True,
+        release_at=NOW + release_in,
+    )
+
+
+async def test_planner_wakes_for_the_earliest_future_deadline(database: Database) -> None:
+    uow = SqlAlchemyUnitOfWork(database)
+    async with uow.transaction() as repositories:
+        await repositories.guild_configs.add(
+            GuildConfigRecord(
+                guild_id=GUILD_ID,
+                alert_publication_reminder_enabled=True,
+                moderator_channel_id=MODERATOR_CHANNEL_ID,
+            )
+        )
+        await repositories.calendar_sources.add(_source(due_in=timedelta(hours=3)))
+        await repositories.calendar_sources.add(_source(due_in=timedelta(hours=1), active=False))
+        await repositories.calendar_sources.add(_source(due_in=-timedelta(minutes=1)))
+        await repositories.publication_runs.add_snapshot(
+            _waiting_run(release_in=timedelta(hours=2), slot_key="slot-future"), (), ()
+        )
+        await repositories.publication_runs.add_snapshot(
+            _waiting_run(release_in=-timedelta(minutes=1), slot_key="slot-overdue"), (), ()
+        )
+    planner = WorkerWakeupPlanner(uow, reminder_lead=timedelta(hours=12))
+
+    release = await planner.next_wakeup(NOW)
+    sync = await WorkerWakeupPlanner(
+        uow, reminder_lead=timedelta(hours=12), publications=False
+    ).next_wakeup(NOW)
+    reminder = await planner.next_wakeup(NOW + timedelta(hours=3))
+    slot = await planner.next_wakeup(NOW + timedelta(hours=12))
+
+    assert release == NOW + timedelta(hours=2)
+    assert sync == NOW + timedelta(hours=3)
+    assert reminder == datetime(2026, 8, 10, 6, 0, tzinfo=UTC)
+    assert slot == datetime(2026, 8, 10, 18, 0, tzinfo=UTC)
+
+
+async def test_wakeup_notification_is_delivered_only_on_commit(database: Database) -> None:
+    uow = SqlAlchemyUnitOfWork(database)
+    received: list[str] = []
+    arrived = asyncio.Event()
+
+    def on_wakeup(reason: str) -> None:
+        received.append(reason)
+        arrived.set()
+
+    async with database.listen(WORKER_WAKEUP_CHANNEL, on_wakeup):
+        with pytest.raises(RuntimeError):
+            async with uow.transaction() as repositories:
+                await repositories.worker_wakeups.notify("rolled_back")
+                raise RuntimeError("abort")
+        async with uow.transaction() as repositories:
+            await repositories.guild_configs.add(GuildConfigRecord(guild_id=GUILD_ID))
+            await repositories.worker_wakeups.notify("settings")
+        await asyncio.wait_for(arrived.wait(), timeout=5)
+
+    assert received == ["settings"]
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
+from fastapi.testclient import TestClient
+
+from domcek_bot.api.validators import not_modified, strong_etag, validated_json
+
+
+def _app() -> tuple[FastAPI, list[str]]:
+    app = FastAPI()
+    loads: list[str] = []
+
+    @app.get("/content")
+    async def content(request: Request) -> Response:
+        return validated_json(request, {"title": "Stretko", "version": 3})
+
+    @app.get("/versioned")
+    async def versioned(request: Request) -> Response:
+        etag = strong_etag("versioned", "3")
+        unchanged = not_modified(request, etag)
+        if unchanged is not None:
+            return unchanged
+        loads.append("versioned")
+        return validated_json(request, ["Stretko"], etag=etag)
+
+    return app, loads
+
+
+def test_content_etag_turns_an_unchanged_poll_into_not_modified() -> None:
+    app, _ = _app()
+    with TestClient(app) as client:
+        first = client.get("/content")
+        etag = first.headers["etag"]
+        repeated = client.get("/content", headers={"If-None-Match": f'"other", W/{etag}'})
+        stale = client.get("/content", headers={"If-None-Match": '"other"'})
+
+    assert first.status_code == 200
+    assert first.json() == {"title": "Stretko", "version": 3}
+    assert etag.startswith('"') and len(etag) == 66
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert first.headers["vary"] == "Cookie"
+    assert repeated.status_code == 304
+    assert repeated.content == b""
+    assert repeated.headers["etag"] == etag
+    assert stale.status_code == 200
+    assert stale.headers["etag"] == etag
+
+
+def test_version_etag_answers_before_loading_the_body() -> None:
+    app, loads = _app()
+    with TestClient(app) as client:
+        first = client.get("/versioned")
+        cached = client.get("/versioned", headers={"If-None-Match": first.headers["etag"]})
+        wildcard = client.get("/versioned", headers={"If-None-Match": "*"})
+
+    assert first.status_code == 200
+    assert first.headers["etag"] == strong_etag("versioned", "3")
+    assert (cached.status_code, wildcard.status_code) == (304, 304)
+    assert loads == ["versioned"]
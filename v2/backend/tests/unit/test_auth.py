@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import uuid
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Mapping
 from contextlib import asynccontextmanager
 from dataclasses import replace
 from datetime import UTC, datetime, timedelta
@@ -31,6 +32,7 @@ from domcek_bot.application.auth.oauth_state import (
     OAuthStateCodec,
     safe_return_path,
 )
+from domcek_bot.application.auth.principals import PrincipalCache
 from domcek_bot.application.auth.service import AuthService, GuildConfigurationMissing, LoginDenied
 from domcek_bot.application.auth.session import InvalidSession, SessionService
 from domcek_bot.application.bootstrap import ensure_guild_config
@@ -72,6 +74,7 @@ class FakeGuildConfigs:
 class FakeWebSessions:
     def __init__(self) -> None:
         self.records: dict[uuid.UUID, WebSessionRecord] = {}
+        self.touch_batches: list[dict[uuid.UUID, datetime]] = []
 
     async def add(self, record: WebSessionRecord) -> None:
         self.records[record.id] = record
@@ -90,8 +93,12 @@ class FakeWebSessions:
             None,
         )
 
-    async def touch(self, session_id: uuid.UUID, *, seen_at: datetime) -> None:
-        self.records[session_id] = replace(self.records[session_id], last_seen_at=seen_at)
+    async def touch_many(self, seen: Mapping[uuid.UUID, datetime]) -> None:
+        self.touch_batches.append(dict(seen))
+        for session_id, seen_at in seen.items():
+            record = self.records[session_id]
+            if record.revoked_at is None and record.last_seen_at < seen_at:
+                self.records[session_id] = replace(record, last_seen_at=seen_at)
 
     async def revoke(self, session_id: uuid.UUID, *, revoked_at: datetime) -> bool:
         record = self.records.get(session_id)
@@ -117,6 +124,7 @@ class FakeDiscord:
         self.closed = False
         self.scopes = frozenset({"identify", "guilds.members.read"})
         self.user = DiscordUser(USER_ID, "domcek-user", "Domček User", "avatar")
+        self.member_lookups = 0
 
     async def exchange_code(self, code: str) -> DiscordOAuthToken:
         assert code == "valid-code"
@@ -137,6 +145,8 @@ class FakeDiscord:
 
     async def guild_member(self, guild_id: int, user_id: int) -> DiscordGuildMember:
         assert user_id == USER_ID
+        self.member_lookups += 1
+        await asyncio.sleep(0)
         return DiscordGuildMember(self.user, guild_id, self.role_ids, "Domček")
 
     async def close(self) -> None:
@@ -277,6 +287,85 @@ async def test_session_token_and_csrf_are_hashed_and_revocable() -> None:
         await service.authenticate(issued.session_token, now=NOW)
 
 
+async def test_session_touches_are_debounced_and_flushed_in_one_batch() -> None:
+    fake_uow = FakeUnitOfWork(_config())
+    service = SessionService(
+        cast(UnitOfWork, fake_uow),
+        secret="s" * 32,
+        lifetime=timedelta(hours=12),
+        touch_granularity=timedelta(minutes=1),
+        defer_touches=True,
+    )
+    first = await service.create(guild_id=GUILD_ID, user_id=USER_ID, now=NOW)
+    second = await service.create(guild_id=GUILD_ID, user_id=USER_ID + 1, now=NOW)
+    revoked = await service.create(guild_id=GUILD_ID, user_id=USER_ID + 2, now=NOW)
+
+    await service.authenticate(first.session_token, now=NOW + timedelta(seconds=30))
+    for seconds in (90, 100):
+        await service.authenticate(first.session_token, now=NOW + timedelta(seconds=seconds))
+        await service.authenticate(second.session_token, now=NOW + timedelta(seconds=seconds))
+    loaded = await service.authenticate(revoked.session_token, now=NOW + timedelta(seconds=90))
+    await service.revoke(loaded, now=NOW + timedelta(seconds=95))
+
+    assert fake_uow.web_sessions.touch_batches == []
+    await service.close()
+    assert fake_uow.web_sessions.touch_batches == [
+        {
+            first.record.id: NOW + timedelta(seconds=100),
+            second.record.id: NOW + timedelta(seconds=100),
+        }
+    ]
+    assert fake_uow.web_sessions.records[first.record.id].last_seen_at == NOW + timedelta(
+        seconds=100
+    )
+    assert await service.flush_touches() == 0
+
+
+class UnreachableWebSessions(FakeWebSessions):
+    async def touch_many(self, seen: Mapping[uuid.UUID, datetime]) -> None:
+        raise ConnectionError("database unavailable")
+
+
+class ClosingResource:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+async def test_api_services_close_everything_after_a_failed_touch_flush() -> None:
+    fake_uow = FakeUnitOfWork(_config())
+    fake_uow.web_sessions = UnreachableWebSessions()
+    unit_of_work = cast(UnitOfWork, fake_uow)
+    discord = FakeDiscord(frozenset({TEAM_ROLE}))
+    session_service = SessionService(
+        unit_of_work,
+        secret="s" * 32,
+        lifetime=timedelta(hours=12),
+        touch_granularity=timedelta(minutes=1),
+        defer_touches=True,
+    )
+    issued = await session_service.create(guild_id=GUILD_ID, user_id=USER_ID, now=NOW)
+    await session_service.authenticate(issued.session_token, now=NOW + timedelta(seconds=90))
+    resource = ClosingResource()
+    api_services = ApiServices(
+        auth=AuthService(unit_of_work, discord, session_service, guild_id=GUILD_ID),
+        sessions=session_service,
+        oauth_state=OAuthStateCodec(secret="s" * 32, lifetime=timedelta(minutes=10)),
+        publication_drafts=PublicationDraftService(unit_of_work),
+        event_editor=EventEditorialService(unit_of_work),
+        content_editor=ContentEditorialService(unit_of_work),
+        audit=AuditQueryService(unit_of_work),
+        resources=(resource,),
+    )
+
+    await api_services.close()
+
+    assert discord.closed
+    assert resource.closed
+
+
 def test_http_oauth_session_csrf_logout_and_security_headers(settings: Settings) -> None:
     configured = settings.model_copy(
         update={
@@ -521,3 +610,60 @@ async def test_login_distinguishes_missing_server_configuration_from_missing_use
     with pytest.raises(GuildConfigurationMissing, match="configuration is missing"):
         await auth.login("valid-code")
     assert not fake_uow.web_sessions.records
+
+
+class MonotonicClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def test_session_principal_is_cached_single_flight_and_expires() -> None:
+    fake_uow = FakeUnitOfWork(_config())
+    unit_of_work = cast(UnitOfWork, fake_uow)
+    sessions = SessionService(unit_of_work, secret="s" * 32, lifetime=timedelta(hours=12))
+    discord = FakeDiscord(frozenset({ADMIN_ROLE}))
+    clock = MonotonicClock()
+    principals = PrincipalCache(ttl=timedelta(seconds=30), clock=clock)
+    auth = AuthService(unit_of_work, discord, sessions, guild_id=GUILD_ID, principals=principals)
+    issued = await sessions.create(guild_id=GUILD_ID, user_id=USER_ID)
+
+    concurrent = await asyncio.gather(
+        *(auth.principal_for_session(issued.session_token) for _ in range(3))
+    )
+    clock.now += 29
+    _, cached = await auth.principal_for_session(issued.session_token)
+    discord.role_ids = frozenset()
+    _, still_cached = await auth.principal_for_session(issued.session_token)
+    clock.now += 2
+    with pytest.raises(LoginDenied, match="no longer"):
+        await auth.principal_for_session(issued.session_token)
+
+    assert {principal.app_roles for _, principal in concurrent} == {frozenset({AppRole.ADMIN})}
+    assert cached.app_roles == still_cached.app_roles == frozenset({AppRole.ADMIN})
+    assert discord.member_lookups == 2
+    stats = principals.stats()
+    assert (stats.hits, stats.misses, stats.joined) == (2, 2, 2)
+
+
+async def test_principal_cache_invalidation_and_session_revocation_apply_immediately() -> None:
+    fake_uow = FakeUnitOfWork(_config())
+    unit_of_work = cast(UnitOfWork, fake_uow)
+    sessions = SessionService(unit_of_work, secret="s" * 32, lifetime=timedelta(hours=12))
+    discord = FakeDiscord(frozenset({ADMIN_ROLE}))
+    principals = PrincipalCache(ttl=timedelta(minutes=5))
+    auth = AuthService(unit_of_work, discord, sessions, guild_id=GUILD_ID, principals=principals)
+    issued = await sessions.create(guild_id=GUILD_ID, user_id=USER_ID)
+
+    record, _ = await auth.principal_for_session(issued.session_token)
+    discord.role_ids = frozenset({TEAM_ROLE})
+    principals.invalidate_user(USER_ID)
+    _, demoted = await auth.principal_for_session(issued.session_token)
+    await sessions.revoke(record)
+
+    assert demoted.app_roles == frozenset({AppRole.TEAM_MOD})
+    with pytest.raises(InvalidSession):
+        await auth.principal_for_session(issued.session_token)
+    assert principals.stats().invalidations == 1
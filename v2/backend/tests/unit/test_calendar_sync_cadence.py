@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from domcek_bot.application.calendar.scheduling import CalendarSyncCadence
+from domcek_bot.application.calendar.sync import CalendarSyncMode, CalendarSyncResult
+from domcek_bot.application.records import CalendarSourceRecord
+
+NOW = datetime(2026, 8, 3, 12, tzinfo=UTC)
+FAR_PUBLICATION = NOW + timedelta(days=5)
+
+
+def _source(previous_interval: timedelta | None) -> CalendarSourceRecord:
+    attempted_at = NOW - timedelta(minutes=1)
+    return CalendarSourceRecord(
+        id=uuid.uuid4(),
+        guild_id=1,
+        provider="google",
+        external_calendar_id="farnost@group.calendar.google.com",
+        display_name="Farnosť",
+        last_sync_attempt_at=attempted_at,
+        next_sync_due_at=None if previous_interval is None else attempted_at + previous_interval,
+    )
+
+
+def _result(*, updated: int = 0) -> CalendarSyncResult:
+    return CalendarSyncResult(
+        source_id=uuid.uuid4(),
+        mode=CalendarSyncMode.INCREMENTAL,
+        pages=1,
+        received=updated,
+        created=0,
+        updated=updated,
+        unchanged=0,
+        cancelled=0,
+        ignored_cancellations=0,
+        missing_marked_deleted=0,
+        series_identity_warnings=0,
+        completed_at=NOW,
+    )
+
+
+def test_quiet_sources_back_off_up_to_the_ceiling() -> None:
+    cadence = CalendarSyncCadence(
+        base_interval=timedelta(minutes=5), max_interval=timedelta(minutes=30)
+    )
+
+    first = cadence.next_due(_source(None), _result(), now=NOW, next_publication_at=FAR_PUBLICATION)
+    doubled = cadence.next_due(
+        _source(timedelta(minutes=5)), _result(), now=NOW, next_publication_at=FAR_PUBLICATION
+    )
+    capped = cadence.next_due(
+        _source(timedelta(minutes=20)), _result(), now=NOW, next_publication_at=FAR_PUBLICATION
+    )
+
+    assert first == NOW + timedelta(minutes=5)
+    assert doubled == NOW + timedelta(minutes=10)
+    assert capped == NOW + timedelta(minutes=30)
+
+
+def test_changes_and_failures_reset_to_base_interval() -> None:
+    cadence = CalendarSyncCadence()
+    source = _source(timedelta(minutes=40))
+
+    changed = cadence.next_due(
+        source, _result(updated=1), now=NOW, next_publication_at=FAR_PUBLICATION
+    )
+    failed = cadence.next_due(source, None, now=NOW, next_publication_at=FAR_PUBLICATION)
+
+    assert changed == failed == NOW + timedelta(minutes=5)
+
+
+def test_publication_lead_starts_with_a_sync_and_keeps_base_interval() -> None:
+    cadence = CalendarSyncCadence(
+        max_interval=timedelta(hours=1), publication_lead=timedelta(hours=6)
+    )
+    quiet = _source(timedelta(hours=1))
+
+    before_lead = cadence.next_due(
+        quiet, _result(), now=NOW, next_publication_at=NOW + timedelta(hours=6, minutes=20)
+    )
+    inside_lead = cadence.next_due(
+        quiet, _result(), now=NOW, next_publication_at=NOW + timedelta(hours=2)
+    )
+
+    assert before_lead == NOW + timedelta(minutes=20)
+    assert inside_lead == NOW + timedelta(minutes=5)
+
+
+def test_ceiling_cannot_be_below_base_interval() -> None:
+    with pytest.raises(ValueError, match="max sync interval"):
+        CalendarSyncCadence(base_interval=timedelta(hours=1), max_interval=timedelta(minutes=5))
+
+
+def test_live_push_channel_raises_the_backoff_ceiling() -> None:
+    cadence = CalendarSyncCadence(
+        max_interval=timedelta(minutes=30), watched_max_interval=timedelta(minutes=90)
+    )
+    source = _source(timedelta(minutes=30))
+
+    watched = cadence.next_due(
+        source, _result(), now=NOW, next_publication_at=FAR_PUBLICATION, watched=True
+    )
+    lapsed = cadence.next_due(source, _result(), now=NOW, next_publication_at=FAR_PUBLICATION)
+
+    assert watched == NOW + timedelta(minutes=60)
+    assert lapsed == NOW + timedelta(minutes=30)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+from collections import Counter
+from datetime import UTC, datetime
+
+import pytest
+
+from domcek_bot.application.calendar.executor import CalendarSyncExecutor
+from domcek_bot.application.calendar.sync import CalendarSyncMode, CalendarSyncResult
+from domcek_bot.application.records import CalendarSourceRecord
+
+
+class RecordingSynchronizer:
+    def __init__(self, sources: list[CalendarSourceRecord], failing: set[uuid.UUID]) -> None:
+        self._guilds = {source.id: source.guild_id for source in sources}
+        self._failing = failing
+        self.running: Counter[int] = Counter()
+        self.peak_total = 0
+        self.peak_per_guild: Counter[int] = Counter()
+
+    async def synchronize(self, source_id: uuid.UUID) -> CalendarSyncResult:
+        guild_id = self._guilds[source_id]
+        self.running[guild_id] += 1
+        self.peak_total = max(self.peak_total, sum(self.running.values()))
+        self.peak_per_guild[guild_id] = max(self.peak_per_guild[guild_id], self.running[guild_id])
+        try:
+            await asyncio.sleep(0.01)
+            if source_id in self._failing:
+                raise RuntimeError("provider unavailable")
+            return CalendarSyncResult(
+                source_id=source_id,
+                mode=CalendarSyncMode.INCREMENTAL,
+                pages=1,
+                received=0,
+                created=0,
+                updated=0,
+                unchanged=0,
+                cancelled=0,
+                ignored_cancellations=0,
+                missing_marked_deleted=0,
+                series_identity_warnings=0,
+                completed_at=datetime(2026, 8, 1, tzinfo=UTC),
+            )
+        finally:
+            self.running[guild_id] -= 1
+
+
+def _source(guild_id: int) -> CalendarSourceRecord:
+    return CalendarSourceRecord(
+        id=uuid.uuid4(),
+        guild_id=guild_id,
+        provider="google",
+        external_calendar_id=f"{uuid.uuid4()}@group.calendar.google.com",
+        display_name="Farnosť",
+    )
+
+
+async def test_executor_respects_global_and_per_guild_limits() -> None:
+    sources = [_source(1) for _ in range(4)] + [_source(2) for _ in range(4)]
+    synchronizer = RecordingSynchronizer(sources, failing=set())
+    executor = CalendarSyncExecutor(synchronizer, max_concurrency=3, max_concurrency_per_guild=2)
+
+    outcomes = await executor.run(sources)
+
+    assert [outcome.source_id for outcome in outcomes] == [source.id for source in sources]
+    assert all(outcome.succeeded for outcome in outcomes)
+    assert synchronizer.peak_total == 3
+    assert max(synchronizer.peak_per_guild.values()) == 2
+
+
+async def test_executor_isolates_failing_sources() -> None:
+    sources = [_source(1), _source(1), _source(2)]
+    synchronizer = RecordingSynchronizer(sources, failing={sources[1].id})
+    executor = CalendarSyncExecutor(synchronizer)
+
+    outcomes = await executor.run(sources)
+
+    assert [outcome.succeeded for outcome in outcomes] == [True, False, True]
+    assert isinstance(outcomes[1].error, RuntimeError)
+    assert outcomes[1].result is None
+
+
+def test_executor_rejects_non_positive_limits() -> None:
+    synchronizer = RecordingSynchronizer([], failing=set())
+    with pytest.raises(ValueError, match="positive"):
+        CalendarSyncExecutor(synchronizer, max_concurrency_per_guild=0)
@@ -60,6 +60,60 @@ def test_calendar_warning_age_must_be_lower_than_unsafe_age() -> None:
         )
 
 
+def test_streamed_calendar_sync_cannot_be_partitioned() -> None:
+    with pytest.raises(ValidationError, match="CALENDAR_SYNC_STREAM_PAGES"):
+        Settings(
+            database_url="postgresql+asyncpg://localhost/domcek",
+            calendar_sync_stream_pages=True,
+            calendar_sync_full_partitions=4,
+        )
+
+
+@pytest.mark.parametrize(
+    ("overrides", "expected"),
+    [
+        ({"calendar_sync_interval_seconds": 7200}, 7200),
+        ({"calendar_stale_warning_minutes": 30}, 1500),
+    ],
+)
+def test_calendar_sync_backoff_ceiling_is_clamped_for_older_configs(
+    overrides: dict[str, int], expected: float
+) -> None:
+    with pytest.warns(UserWarning, match="CALENDAR_SYNC_MAX_INTERVAL_SECONDS"):
+        settings = Settings(database_url="postgresql+asyncpg://localhost/domcek", **overrides)
+
+    assert settings.calendar_sync_max_interval_seconds == expected
+
+
+def test_worker_idle_recheck_cannot_be_shorter_than_poll_interval() -> None:
+    with pytest.raises(ValidationError, match="WORKER_IDLE_RECHECK_SECONDS"):
+        Settings(
+            database_url="postgresql+asyncpg://localhost/domcek",
+            worker_poll_interval_seconds=60,
+            worker_idle_recheck_seconds=30,
+        )
+
+
+@pytest.mark.parametrize(
+    ("field", "value", "message"),
+    [
+        ("calendar_watch_webhook_url", "http://carlo.example.test/hook", "HTTPS"),
+        ("calendar_watch_renew_before_minutes", 120, "RENEW_BEFORE"),
+        ("calendar_sync_watched_max_interval_seconds", 1800, "WATCHED_MAX_INTERVAL"),
+    ],
+)
+def test_calendar_watch_settings_are_validated_when_enabled(
+    field: str, value: object, message: str
+) -> None:
+    values: dict[str, object] = {
+        "calendar_watch_webhook_url": "https://carlo.example.test/api/v1/calendar/notifications",
+        "calendar_watch_ttl_hours": 2,
+    }
+    values[field] = value
+    with pytest.raises(ValidationError, match=message):
+        Settings(database_url="postgresql+asyncpg://localhost/domcek", **values)  # type: ignore[arg-type]
+
+
 @pytest.mark.parametrize(
     ("field", "value"),
     [
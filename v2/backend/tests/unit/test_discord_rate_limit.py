@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from domcek_bot.infrastructure.discord_rate_limit import (
+    DiscordRateLimiter,
+    DiscordRateLimitTransport,
+    discord_route,
+)
+
+CHANNEL_ID = 1535774834955391048
+OTHER_CHANNEL_ID = 1535774834955391053
+MESSAGE_ID = 1535774834955391060
+
+
+class FakeTime:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+def _client(limiter: DiscordRateLimiter, handler: httpx.MockTransport) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url="https://discord.com/api/v10",
+        headers={"Authorization": "Bot token"},
+        transport=DiscordRateLimitTransport(limiter, handler),
+    )
+
+
+def _bucket_headers(remaining: int, reset_after: float) -> dict[str, str]:
+    return {
+        "X-RateLimit-Bucket": "messages",
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset-After": str(reset_after),
+    }
+
+
+def test_route_keeps_major_parameter_and_collapses_the_rest() -> None:
+    message = discord_route(
+        "put",
+        f"/api/v10/channels/{CHANNEL_ID}/messages/{MESSAGE_ID}/reactions/%E2%9C%85/@me",
+        "Bot token",
+    )
+    other_message = discord_route(
+        "PUT",
+        f"/api/v10/channels/{CHANNEL_ID}/messages/{OTHER_CHANNEL_ID}/reactions/other/@me",
+        "Bot token",
+    )
+    other_channel = discord_route(
+        "PUT",
+        f"/api/v10/channels/{OTHER_CHANNEL_ID}/messages/{MESSAGE_ID}/reactions/x/@me",
+        "Bot token",
+    )
+    user = discord_route(
+        "PUT", f"/api/v10/channels/{CHANNEL_ID}/messages/{OTHER_CHANNEL_ID}/reactions/x/@me", ""
+    )
+
+    assert message.startswith(f"PUT channels/{CHANNEL_ID}|")
+    assert message.split("|")[1] == f"/channels/{CHANNEL_ID}/messages/{{id}}/reactions/{{id}}/@me"
+    assert message != other_channel
+    assert message.split("|")[:2] == other_message.split("|")[:2]
+    assert user != message
+
+
+async def test_exhausted_bucket_waits_for_reset_instead_of_hitting_429() -> None:
+    time = FakeTime()
+    limiter = DiscordRateLimiter(clock=time.clock, sleep=time.sleep)
+    sent: list[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(time.now)
+        remaining = 1 if len(sent) == 1 else 0
+        return httpx.Response(200, headers=_bucket_headers(remaining, 2.0), json={})
+
+    async with _client(limiter, httpx.MockTransport(handler)) as client:
+        for _ in range(3):
+            await client.post(f"/channels/{CHANNEL_ID}/messages", json={})
+
+    assert sent == [100.0, 100.0, 102.0]
+    assert time.sleeps == [2.0]
+    stats = limiter.stats()
+    assert stats.delayed_requests == 1
+    assert stats.max_wait_seconds == 2.0
+    assert stats.rate_limited_responses == 0
+
+
+async def test_bucket_learned_from_one_gateway_is_honored_by_another() -> None:
+    time = FakeTime()
+    limiter = DiscordRateLimiter(clock=time.clock, sleep=time.sleep)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers=_bucket_headers(0, 5.0), json={})
+
+    transport = httpx.MockTransport(handler)
+    async with _client(limiter, transport) as publication, _client(limiter, transport) as alerts:
+        await publication.post(f"/channels/{CHANNEL_ID}/messages", json={})
+        await alerts.post(f"/channels/{CHANNEL_ID}/messages", json={})
+        await alerts.post(f"/channels/{OTHER_CHANNEL_ID}/messages", json={})
+
+    assert time.sleeps == [5.0]
+
+
+async def test_global_429_pauses_every_bot_route() -> None:
+    time = FakeTime()
+    limiter = DiscordRateLimiter(clock=time.clock, sleep=time.sleep)
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            return httpx.Response(
+                429,
+                headers={"Retry-After": "1.5", "X-RateLimit-Global": "true"},
+                json={"global": True},
+            )
+        return httpx.Response(200, json={})
+
+    async with _client(limiter, httpx.MockTransport(handler)) as client:
+        first = await client.post(f"/channels/{CHANNEL_ID}/messages", json={})
+        await client.get(f"/guilds/{OTHER_CHANNEL_ID}/members")
+
+    assert first.status_code == 429
+    assert time.sleeps == [1.5]
+    assert limiter.stats().rate_limited_responses == 1
+
+
+async def test_wait_beyond_limit_is_not_taken() -> None:
+    time = FakeTime()
+    limiter = DiscordRateLimiter(max_wait=10.0, clock=time.clock, sleep=time.sleep)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers=_bucket_headers(0, 60.0), json={})
+
+    async with _client(limiter, httpx.MockTransport(handler)) as client:
+        await client.post(f"/channels/{CHANNEL_ID}/messages", json={})
+        await client.post(f"/channels/{CHANNEL_ID}/messages", json={})
+
+    assert time.sleeps == []
+
+
+async def test_global_budget_spreads_bursts_across_seconds() -> None:
+    time = FakeTime()
+    limiter = DiscordRateLimiter(global_per_second=2, clock=time.clock, sleep=time.sleep)
+
+    await asyncio.gather(*(limiter.acquire(f"GET |/r{index}|x", bot=True) for index in range(5)))
+
+    assert time.sleeps == [1.0, 1.0]
+
+
+async def test_unknown_window_sends_one_request_until_its_headers_arrive() -> None:
+    time = FakeTime()
+    limiter = DiscordRateLimiter(clock=time.clock, sleep=time.sleep)
+    route = discord_route("POST", f"/api/v10/channels/{CHANNEL_ID}/messages", "Bot token")
+    limiter.observe(route, httpx.Response(200, headers=_bucket_headers(0, 2.0)))
+    log: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        log.append("sent")
+        await asyncio.sleep(0)
+        log.append("answered")
+        return httpx.Response(200, headers=_bucket_headers(4, 2.0), json={})
+
+    async with _client(limiter, httpx.MockTransport(handler)) as client:
+        await asyncio.gather(
+            *(client.post(f"/channels/{CHANNEL_ID}/messages", json={}) for _ in range(3))
+        )
+
+    assert time.sleeps == [2.0]
+    assert log[:2] == ["sent", "answered"]
+    assert log.count("sent") == 3
+
+
+async def test_failed_probe_releases_waiting_requests() -> None:
+    time = FakeTime()
+    limiter = DiscordRateLimiter(clock=time.clock, sleep=time.sleep)
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        if calls == 1:
+            raise httpx.ConnectError("unreachable", request=request)
+        return httpx.Response(200, json={})
+
+    async with _client(limiter, httpx.MockTransport(handler)) as client:
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *(client.post(f"/channels/{CHANNEL_ID}/messages", json={}) for _ in range(3)),
+                return_exceptions=True,
+            ),
+            timeout=1.0,
+        )
+
+    assert isinstance(results[0], httpx.ConnectError)
+    assert [getattr(result, "status_code", None) for result in results[1:]] == [200, 200]
+
+
+async def test_probe_cancelled_in_global_wait_releases_its_bucket() -> None:
+    time = FakeTime()
+    in_global_wait = asyncio.Event()
+
+    async def blocking_sleep(delay: float) -> None:
+        in_global_wait.set()
+        await asyncio.Event().wait()
+
+    limiter = DiscordRateLimiter(clock=time.clock, sleep=blocking_sleep)
+    route = discord_route("POST", f"/api/v10/channels/{CHANNEL_ID}/messages", "Bot token")
+    limiter.observe(
+        discord_route("GET", f"/api/v10/guilds/{OTHER_CHANNEL_ID}/members", "Bot token"),
+        httpx.Response(429, headers={"Retry-After": "1.5", "X-RateLimit-Global": "true"}),
+    )
+    probe = asyncio.create_task(limiter.acquire(route, bot=True))
+    await in_global_wait.wait()
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+
+    await asyncio.wait_for(limiter.acquire(route, bot=False), timeout=1.0)
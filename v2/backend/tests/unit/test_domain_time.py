@@ -58,6 +58,7 @@ def test_window_uses_half_open_overlap_rules() -> None:
     assert not window.overlaps_timed(window.ends_at, window.ends_at + timedelta(hours=1))
     assert window.overlaps_all_day(date(2026, 8, 9), date(2026, 8, 11))
     assert not window.overlaps_all_day(date(2026, 8, 24), date(2026, 8, 25))
+    assert window.local_dates() == (date(2026, 8, 10), date(2026, 8, 24))
 
 
 def test_invalid_ranges_are_rejected() -> None:
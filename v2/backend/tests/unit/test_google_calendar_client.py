@@ -249,3 +249,51 @@ async def test_access_denial_is_not_retried_or_leaked() -> None:
 
     assert calls == 1
     assert "sensitive provider detail" not in str(captured.value)
+
+
+async def test_watch_events_registers_web_hook_channel_and_stop_releases_it() -> None:
+    observed: list[tuple[str, dict[str, str]]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        observed.append((request.url.raw_path.decode("ascii"), body))
+        if request.url.path.endswith("/events/watch"):
+            return httpx.Response(
+                200,
+                json={
+                    "kind": "api#channel",
+                    "id": body["id"],
+                    "resourceId": "resource-1",
+                    "expiration": "1788004800000",
+                },
+            )
+        return httpx.Response(204)
+
+    client, _ = _client(handler)
+    try:
+        channel = await client.watch_events(
+            "calendar/id@example.test",
+            channel_id="channel-1",
+            token="secret-token",
+            address="https://carlo.example.test/api/v1/calendar/notifications",
+            expires_at=datetime(2026, 9, 1, 12, tzinfo=UTC),
+        )
+        await client.stop_watch(channel.channel_id, channel.resource_id)
+    finally:
+        await client.close()
+
+    watch_path, watch_body = observed[0]
+    assert watch_path == "/calendar/v3/calendars/calendar%2Fid%40example.test/events/watch"
+    assert watch_body == {
+        "id": "channel-1",
+        "type": "web_hook",
+        "address": "https://carlo.example.test/api/v1/calendar/notifications",
+        "token": "secret-token",
+        "expiration": "1788264000000",
+    }
+    assert channel.resource_id == "resource-1"
+    assert channel.expires_at == datetime(2026, 8, 29, 12, tzinfo=UTC)
+    assert observed[1] == (
+        "/calendar/v3/channels/stop",
+        {"id": "channel-1", "resourceId": "resource-1"},
+    )
@@ -14,6 +14,8 @@ from domcek_bot.application.publication.composer import (
     PublicationCompositionError,
     compose_publication,
     plan_discord_messages,
+    render_publication,
+    select_publication_items,
 )
 from domcek_bot.application.publication.formatting import (
     format_all_day_range,
@@ -207,6 +209,22 @@ def test_next_completed_slot_is_skipped_without_changing_window_rule() -> None:
     assert draft.window_ends_at.isoformat() == "2026-08-31T20:00:00+02:00"
 
 
+def test_rendering_a_selection_matches_full_composition_for_any_intro() -> None:
+    snapshot = _snapshot(
+        events=(_timed_event(uuid.UUID("00000000-0000-4000-8000-000000000001"), title="Stretko"),)
+    )
+    selection = select_publication_items(snapshot)
+
+    draft = render_publication(selection, intro_text=snapshot.intro_text)
+    generated = render_publication(selection, intro_text="Vygenerovaný úvod")
+
+    assert draft == compose_publication(snapshot)
+    assert generated == compose_publication(replace(snapshot, intro_text="Vygenerovaný úvod"))
+    assert generated.public_items is draft.public_items
+    assert generated.messages[0].content is not None
+    assert generated.messages[0].content.startswith("@everyone\nVygenerovaný úvod")
+
+
 @pytest.mark.parametrize(
     ("reference", "expected_slot", "expected_end"),
     [
@@ -888,6 +888,7 @@ function mockCalendar(overrides: Partial<Record<string, unknown>> = {}): Record<
     last_sync_success_at: '2026-08-12T18:00:00Z',
     last_full_sync_at: '2026-08-12T18:00:00Z',
     last_sync_error: null,
+    next_sync_due_at: '2026-08-12T18:05:00Z',
     version: 1,
     ...overrides,
   }
@@ -22,6 +22,13 @@ export interface OperationsSummary {
     details: Record<string, unknown>
   }>
   active_instance_counts: Record<string, number>
+  api_principal_cache?: {
+    entries: number
+    hits: number
+    misses: number
+    joined: number
+    invalidations: number
+  } | null
   calendars: Array<{
     id: string
     display_name: string
@@ -248,6 +255,7 @@ export interface CalendarSource {
   last_sync_success_at: string | null
   last_full_sync_at: string | null
   last_sync_error: string | null
+  next_sync_due_at: string | null
   version: number
 }
 
@@ -422,7 +430,7 @@ export interface ShadowPublicationCapture {
     }>
   }
   warning_codes: string[]
-  draft: PublicationDraft
+  draft?: PublicationDraft
 }
 
 export interface DashboardSummary {
@@ -632,7 +640,14 @@ export function confirmPublicationMessageNotSent(runId: string, messagePosition:
 }
 
 export function getShadowPublicationHistory(signal?: AbortSignal) {
-  return requestJson<ShadowPublicationCapture[]>('/api/v1/publication/shadow-history?limit=20', {
+  return requestJson<ShadowPublicationCapture[]>(
+    '/api/v1/publication/shadow-history?limit=20&summary=true',
+    { signal },
+  )
+}
+
+export function getShadowPublicationDraft(captureId: string, signal?: AbortSignal) {
+  return requestJson<PublicationDraft>(`/api/v1/publication/shadow-history/${captureId}/draft`, {
     signal,
   })
 }
@@ -666,6 +681,7 @@ export function createCalendarSource(
     | 'last_sync_success_at'
     | 'last_full_sync_at'
     | 'last_sync_error'
+    | 'next_sync_due_at'
     | 'version'
   >,
 ) {
@@ -4,6 +4,7 @@ import { AlertTriangle, CheckCircle2, ExternalLink, Eye, Radio } from 'lucide-re
 import {
   confirmPublicationMessageNotSent,
   getPublicationHistory,
+  getShadowPublicationDraft,
   getShadowPublicationHistory,
   linkExistingPublicationMessage,
   type PublicationHistoryEntry,
@@ -154,6 +155,16 @@ export function PublicationHistoryPage() {
 }
 
 function ShadowRun({ capture }: { capture: ShadowPublicationCapture }) {
+  const [draft, setDraft] = useState<PublicationDraft | null>(capture.draft ?? null)
+  const [draftError, setDraftError] = useState<string | null>(null)
+  const loadDraft = (open: boolean) => {
+    if (!open || draft) return
+    setDraftError(null)
+    // The body is fetched on demand; its ETag lets the browser revalidate cheaply.
+    getShadowPublicationDraft(capture.id)
+      .then(setDraft)
+      .catch(() => setDraftError('Pripravený obsah sa nepodarilo načítať.'))
+  }
   return (
     <Card className="history-run shadow-run">
       <CardHeader className="history-run-header">
@@ -188,20 +199,29 @@ function ShadowRun({ capture }: { capture: ShadowPublicationCapture }) {
             <strong>{capture.observation_count}</strong> kontrol
           </span>
         </div>
-        <details className="history-details">
+        <details
+          className="history-details"
+          onToggle={(event) => loadDraft(event.currentTarget.open)}
+        >
           <summary>Zobraziť pripravený obsah</summary>
-          <div className="history-snapshot">
-            {capture.draft.intro_text && (
-              <p className="history-intro">{capture.draft.intro_text}</p>
-            )}
-            {capture.draft.public_items.map((item) => (
-              <article key={`${item.kind}-${item.source_id}`}>
-                <small>{item.display_time ?? kindLabel(item.kind)}</small>
-                <strong>{item.title}</strong>
-                {item.description && <p>{item.description}</p>}
-              </article>
-            ))}
-          </div>
+          {draftError && (
+            <p className="desk-warning" role="alert">
+              {draftError}
+            </p>
+          )}
+          {!draft && !draftError && <LoadingState label="Načítavam pripravený obsah…" />}
+          {draft && (
+            <div className="history-snapshot">
+              {draft.intro_text && <p className="history-intro">{draft.intro_text}</p>}
+              {draft.public_items.map((item) => (
+                <article key={`${item.kind}-${item.source_id}`}>
+                  <small>{item.display_time ?? kindLabel(item.kind)}</small>
+                  <strong>{item.title}</strong>
+                  {item.description && <p>{item.description}</p>}
+                </article>
+              ))}
+            </div>
+          )}
         </details>
         <details className="technical-details">
           <summary>Technické údaje</summary>